@@ -1,7 +1,7 @@
 import Company from '../models/Company.js';
 import Resume from '../models/Resume.js';
 
-import { generateRankings } from '../services/rankGenerator.js';
+import { scheduleRerank, getRerankJob, listRerankJobs, getTopRankings, dropCompanyRankings } from '../services/rankGenerator.js';
 
 
 export async function createCompany(req, res) {
@@ -44,45 +44,10 @@ export async function createCompany(req, res) {
     
     await company.save();
     
-    // get all resumes from Database
-    const resumes = await Resume.find();
+    // Score every stored resume for the new company, in the background
+    const rerankJob = scheduleRerank(company._id);
     
-    for (const resume of resumes) {
-      const resumeData = {
-        name: resume.name,
-        email: resume.email,
-        phone: resume.phone,
-        education: resume.education,
-        skills: resume.skills,
-        experience: resume.experience,
-        projects: resume.projects,
-        resumeText: resume.resumeText
-      };
-      
-      //generating rankings for all
-      const rankings = await generateRankings(resumeData, [company]);
-      
-
-      if (rankings.length > 0) {
-        resume.rankings.push({
-          company: company._id,
-          score: rankings[0].score,
-          rank: resume.rankings.length + 1
-        });
-        
-        // Sort rankings by score
-        resume.rankings.sort((a, b) => b.score - a.score);
-        
-        // Update ranks
-        resume.rankings.forEach((ranking, index) => {
-          ranking.rank = index + 1;
-        });
-        
-        await resume.save();
-      }
-    }
-    
-    res.status(201).json(company);
+    res.status(201).json({ ...company.toJSON(), rerankJob });
   } catch (error) {
     console.error('Error in createCompany:', error);
     res.status(500).json({ msg: 'Server error', error: error.message });
@@ -174,42 +139,11 @@ export async function updateCompany(req, res) {
     );
     
     
-    // Update rankings for all existing resumes
-    const resumes = await Resume.find();
-    
-    for (const resume of resumes) {
-      const resumeData = {
-        name: resume.name,
-        email: resume.email,
-        phone: resume.phone,
-        education: resume.education,
-        skills: resume.skills,
-        experience: resume.experience,
-        projects: resume.projects,
-        resumeText: resume.resumeText
-      };
-      
-      const rankingIndex = resume.rankings.findIndex(r => r.company.toString() === company._id.toString());
-      
-      if (rankingIndex !== -1) {
-        // Generate new ranking
-        const rankings = await generateRankings(resumeData, [company]);
-        
-        if (rankings.length > 0) {
-          resume.rankings[rankingIndex].score = rankings[0].score;
-          resume.rankings.sort((a, b) => b.score - a.score);
-          
-          // Update ranks
-          resume.rankings.forEach((ranking, index) => {
-            ranking.rank = index + 1;
-          });
-          
-          await resume.save();
-        }
-      }
-    }
+    // Requirements changed: rescore and re-rank every resume for it, in the
+    // background
+    const rerankJob = scheduleRerank(company._id);
     
-    res.json(company);
+    res.json({ ...company.toJSON(), rerankJob });
   } catch (error) {
     console.error('Error in updateCompany:', error);
     
@@ -237,17 +171,8 @@ export async function deleteCompany(req, res) {
       { $pull: { rankings: { company: req.params.id } } }
     );
     
-    const resumes = await Resume.find({ 'rankings.0': { $exists: true } });
-    
-    for (const resume of resumes) {
-      resume.rankings.sort((a, b) => b.score - a.score);
-      // Update ranks
-      resume.rankings.forEach((ranking, index) => {
-        ranking.rank = index + 1;
-      });
-      
-      await resume.save();
-    }
+    // Ranks are per company, so the other companies' rankings are unchanged
+    await dropCompanyRankings(req.params.id);
     
     res.json({ msg: 'Company removed' });
   } catch (error) {
@@ -262,6 +187,29 @@ export async function deleteCompany(req, res) {
 }
 
 
+// Queues a re-rank of every resume for every company (scripts/rerankAll.js).
+// It runs in this process because the rank index may only be changed by its
+// worker; the reply is the job, whose progress getRerankJob reports.
+export async function rerankCompanies(req, res) {
+  res.status(202).json(scheduleRerank());
+}
+
+// A re-rank job's status (queued, running, done or failed, with its summary
+// or error)
+export async function getRerankStatus(req, res) {
+  const job = getRerankJob(req.params.jobId);
+  if (!job) {
+    return res.status(404).json({ msg: 'Re-rank job not found' });
+  }
+  res.json(job);
+}
+
+export async function getRerankJobs(req, res) {
+  res.json(listRerankJobs());
+}
+
+
+// The best-ranked resumes for a company (?k=, default 10) from the rank index
 export async function getTopResumes(req, res) {
     try {
       const company = await Company.findById(req.params.id);
@@ -270,31 +218,28 @@ export async function getTopResumes(req, res) {
         return res.status(404).json({ msg: 'Company not found' });
       }
       
-      const resumes = await Resume.find({
-        'rankings.company': req.params.id
-      })
-      .select('name email skills education rankings')
-      .sort({ 'rankings.score': -1 });
+      const k = Math.max(1, parseInt(req.query.k, 10) || 10);
+      const { rankings, totalResumes } = await getTopRankings(company._id, k);
       
-      // Filter and format the results
-      const topResumes = resumes.map(resume => {
-        const ranking = resume.rankings.find(r => 
-          r.company.toString() === req.params.id
-        );
-        
-        return {
-          id: resume._id,
-          name: resume.name,
-          email: resume.email,
-          skills: resume.skills,
-          education: resume.education,
-          score: ranking ? ranking.score : 0,
-          rank: ranking ? ranking.rank : null
-        };
-      });
+      const resumes = await Resume.find({ _id: { $in: rankings.map(r => r.resume) } })
+        .select('name email skills education');
+      const resumesById = new Map(resumes.map(resume => [resume._id.toString(), resume]));
       
-      // Sort by score
-      topResumes.sort((a, b) => b.score - a.score);
+      const topResumes = rankings
+        .filter(ranking => resumesById.has(ranking.resume))
+        .map(ranking => {
+          const resume = resumesById.get(ranking.resume);
+          return {
+            id: resume._id,
+            name: resume.name,
+            email: resume.email,
+            skills: resume.skills,
+            education: resume.education,
+            score: ranking.score,
+            rank: ranking.rank,
+            totalResumes
+          };
+        });
       
       res.json(topResumes);
     } catch (error) {
@@ -307,4 +252,3 @@ export async function getTopResumes(req, res) {
       res.status(500).json({ msg: 'Server error', error: error.message });
     }
   }
-  
\ No newline at end of file
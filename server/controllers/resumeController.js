@@ -1,7 +1,8 @@
+import { Types } from 'mongoose';
 import Resume from '../models/Resume.js';
 import Company from '../models/Company.js';
 import { parseResumeFile } from '../services/resumeParser.js';
-import { generateRankings } from '../services/rankGenerator.js';
+import { generateRankings, scoringInputs, removeResumeRankings } from '../services/rankGenerator.js';
 import fs, { existsSync, unlinkSync } from 'fs';
 import path from 'path';
 
@@ -50,7 +51,8 @@ export async function uploadResume(req, res) {
       operationId, 
       emailFound: !!parsedResume.Email_ID, 
       skillsCount: parsedResume.Skills?.length ?? 0,
-      projectsCount: parsedResume.No_of_Projects ?? 0
+      projectsCount: parsedResume.No_of_Projects ?? 0,
+      degraded: parsedResume.Degraded ?? []
     });
 
     // Check for email
@@ -71,9 +73,14 @@ export async function uploadResume(req, res) {
     }
     log.info(`Successfully fetched ${companies.length} companies.`, { operationId });
 
+    // The rank index keys scores by resume id, so a new resume gets its id now
+    log.info('Checking for existing resume by email.', { operationId, email: parsedResume.Email_ID });
+    let resume = await Resume.findOne({ email: parsedResume.Email_ID });
+    const resumeId = resume ? resume._id : new Types.ObjectId();
+
     // Generate rankings
-    log.info('Attempting to generate rankings.', { operationId, email: parsedResume.Email_ID });
-    const rankings = await generateRankings(parsedResume, companies); // This function should have its own robust logging
+    log.info('Attempting to generate rankings.', { operationId, email: parsedResume.Email_ID, resumeId });
+    const rankings = await generateRankings(parsedResume, companies, resumeId); // This function should have its own robust logging
     log.info(`Rankings generated. Count: ${rankings.length}.`, { operationId });
 
     const nameFromFile = originalFilename.replace(/\.[^/.]+$/, "").replace(/[_-]/g, " ");
@@ -93,6 +100,7 @@ export async function uploadResume(req, res) {
         endDate: new Date()
       }] : [],
       projects: formatProjects(parsedResume, operationId), // Pass operationId for traceability
+      scoring: scoringInputs(parsedResume), // What the rankings were scored on, for re-ranks
       resumeText: parsedResume.resumeText // Be cautious logging large texts directly
     };
     log.debug('Resume data mapped for database.', { 
@@ -103,8 +111,6 @@ export async function uploadResume(req, res) {
     });
 
     // If a resume with this email already exists
-    log.info('Checking for existing resume by email.', { operationId, email: mappedResume.email });
-    let resume = await Resume.findOne({ email: mappedResume.email });
     let isUpdate = false;
 
     if (resume) {
@@ -118,6 +124,7 @@ export async function uploadResume(req, res) {
       resume.skills = mappedResume.skills || resume.skills;
       resume.experience = mappedResume.experience || resume.experience;
       resume.projects = mappedResume.projects || resume.projects;
+      resume.scoring = mappedResume.scoring;
       resume.rankings = rankings;
       resume.resumeText = mappedResume.resumeText;
 
@@ -145,6 +152,7 @@ export async function uploadResume(req, res) {
     } else {
       log.info('No existing resume found. Creating new resume record.', { operationId, email: mappedResume.email });
       resume = new Resume({
+        _id: resumeId,
         ...mappedResume, // Spread the mapped resume data
         rankings: rankings, // Ensure rankings is part of the new object
         filePath: filePath 
@@ -244,13 +252,14 @@ function deleteAllFilesInDirectory(directory, operationId) {
 // These should ideally also log using the passed operationId if they perform complex logic or can fail.
 function formatEducation(parsedResume, operationId) {
   // log.debug('Formatting education data.', { operationId, parsedBranch: parsedResume.Branch });
-  if (!parsedResume.Branch) {
-    // log.warn('No branch information for formatting education.', { operationId });
+  // An unknown branch still keeps the CPI/GPA
+  if (!parsedResume.Branch && !parsedResume['CPI/GPA']) {
+    // log.warn('No branch or GPA information for formatting education.', { operationId });
     return [];
   }
   return [{
     degree: 'B.Tech', // Placeholder, ideally extracted
-    field: parsedResume.Branch,
+    field: parsedResume.Branch || '',
     institution: 'Institution', // Placeholder
     gpa: parsedResume['CPI/GPA'] || null,
     year: new Date().getFullYear() // Placeholder, year should be extracted
@@ -541,6 +550,9 @@ export async function deleteResume(req, res) {
 
     await resume.deleteOne();
 
+    // Otherwise it would still count towards every company's ranks and totals
+    await removeResumeRankings(resume._id);
+
     res.json({ msg: 'Resume deleted' });
   } catch (error) {
     console.error('Error in deleteResume:', error);
@@ -12,6 +12,17 @@ const skillsSchema = new mongoose.Schema({
   soft_skills: [String]
 }, { _id: false });
 
+// The exact inputs rank_generator.py scored the resume on at upload, so a
+// re-rank scores it the same way whatever the display fields below keep
+const scoringSchema = new mongoose.Schema({
+  cpi: Number,
+  branch: String,
+  projects: Number,
+  projectKeywords: [String],
+  skillSet: [String],
+  experience: Number
+}, { _id: false });
+
 const ResumeSchema = new Schema({
   name: {
     type: String,
@@ -27,6 +38,7 @@ const ResumeSchema = new Schema({
   },
   education: [{
     degree: String,
+    field: String,
     institution: String,
     year: String,
     gpa: Number
@@ -43,13 +55,18 @@ const ResumeSchema = new Schema({
     description: String,
     technologies: [String]
   }],
+  scoring: {
+    type: scoringSchema,
+    default: undefined
+  },
   rankings: [{
     company: {
       type: Schema.Types.ObjectId,
       ref: 'Company'
     },
     score: Number,
-    rank: Number
+    rank: Number,
+    totalResumes: Number
   }],
   resumeText: {
     type: String,
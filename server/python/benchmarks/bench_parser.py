@@ -0,0 +1,153 @@
+# Benchmark for EnhancedResumeParser on a synthetic corpus (see corpus.py).
+#
+# Times the shared text analysis and every extractor of parse_resume on each
+# generated resume text, then reading and parsing generated PDFs end to end, and
+# prints p50/p90/p99 latency and throughput per stage. Every extracted field
+# of the golden corpus is compared with benchmarks/golden/parser.jsonl and
+# any difference fails the run.
+#
+# Skills and Project_Keywords depend on the spaCy model: without it they are
+# left out of the timings and of the golden check. The check compares the
+# columns that both the golden file and this run have, says loudly which
+# columns it could not cover, and fails outright only against golden values
+# recorded under a different model. Record the golden with --update-golden
+# where en_core_web_sm is installed to cover every column.
+#
+# Usage: python benchmarks/bench_parser.py [--resumes N] [--pdf N] [--update-golden]
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import Vocabulary, make_corpus, write_pdf
+from golden import compare, load_golden, normalize, report, write_golden
+from resume_parser import PARSER_VERSION, SPACY_MODEL, EnhancedResumeParser, ResourceUnavailableError, get_nlp, get_stopwords
+
+MODEL_COLUMNS = ('Skills', 'Project_Keywords')
+GOLDEN_SEED = 0
+GOLDEN_COUNT = 300
+
+
+def nlp_version():
+    # "<model> <version>" of the spaCy pipeline, or None when it is not
+    # installed here
+    try:
+        meta = get_nlp().meta
+        get_stopwords()
+    except ResourceUnavailableError as e:
+        print(f"Warning: {e}; skipping {', '.join(MODEL_COLUMNS)}")
+        return None
+    return f"{meta.get('lang')}_{meta.get('name')} {meta.get('version')}"
+
+
+def extract(parser, text, columns, times=None):
+    # The columns parse_resume would extract from text, timing each stage
+    # into times when given
+    def record(stage, start):
+        if times is not None:
+            times.setdefault(stage, []).append(time.perf_counter() - start)
+
+    first = start = time.perf_counter()
+    context = parser.analyze(text)
+    context.lower, context.preprocessed
+    if any(column in MODEL_COLUMNS for column in columns):
+        context.doc
+    record('analyze', start)
+
+    result = {}
+    for column, extractor in parser.extractors():
+        if column in columns:
+            start = time.perf_counter()
+            result[column] = extractor(context)
+            record(column, start)
+    record('text end to end', first)
+    return result
+
+
+def print_times(times):
+    print(f"{'stage':24s} {'p50 ms':>9s} {'p90 ms':>9s} {'p99 ms':>9s} {'per second':>11s}")
+    for stage, seconds in times.items():
+        ms = np.array(seconds) * 1000
+        p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+        print(f"{stage:24s} {p50:9.3f} {p90:9.3f} {p99:9.3f} {len(ms) / (ms.sum() / 1000):11.0f}")
+
+
+def check_golden(parser, vocabulary, columns, nlp, update):
+    header, expected = load_golden('parser')
+    if update or header is None:
+        corpus = make_corpus(GOLDEN_COUNT, GOLDEN_SEED, vocabulary)
+        values = {name: normalize(extract(parser, text, columns)) for name, text in corpus}
+        write_golden('parser', {
+            'seed': GOLDEN_SEED, 'count': GOLDEN_COUNT, 'columns': columns,
+            'nlp': nlp, 'parser_version': PARSER_VERSION
+        }, values)
+        print(f"Golden parser: wrote {len(values)} resumes ({', '.join(columns)})")
+        if nlp is None:
+            print(f"Warning: golden parser recorded without spaCy {SPACY_MODEL}; "
+                  f"{', '.join(MODEL_COLUMNS)} have no golden values")
+        return True
+
+    recorded = header.get('nlp')
+    if recorded is not None and nlp is not None and recorded != nlp:
+        print(f"Golden parser: recorded with spaCy {recorded}, running {nlp}; "
+              f"re-record it with --update-golden under the intended model")
+        return False
+
+    compared = [column for column in header['columns'] if column in columns]
+    uncovered = [column for column in MODEL_COLUMNS if column not in compared]
+    if uncovered:
+        print(f"Warning: golden parser does not cover {', '.join(uncovered)} "
+              f"(recorded with spaCy {recorded}, running {nlp}); "
+              f"run --update-golden with {SPACY_MODEL} installed to cover them")
+
+    corpus = make_corpus(header['count'], header['seed'], vocabulary)
+    actual = {name: normalize(extract(parser, text, compared)) for name, text in corpus}
+    return report('parser', compare(expected, actual, compared))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark resume parsing on a synthetic corpus')
+    arg_parser.add_argument('--resumes', type=int, default=1000, help='resume texts to time extractors on')
+    arg_parser.add_argument('--pdf', type=int, default=200, help='PDFs to read and parse end to end')
+    arg_parser.add_argument('--seed', type=int, default=1)
+    arg_parser.add_argument('--update-golden', action='store_true',
+                            help='rewrite golden/parser.jsonl from the current parser')
+    args = arg_parser.parse_args()
+
+    parser = EnhancedResumeParser()
+    nlp = nlp_version()
+    columns = [column for column, _ in parser.extractors() if nlp or column not in MODEL_COLUMNS]
+    vocabulary = Vocabulary(parser)
+
+    corpus = make_corpus(max(args.resumes, args.pdf), args.seed, vocabulary)
+    times = {}
+    for _, text in corpus[:args.resumes]:
+        extract(parser, text, columns, times)
+
+    if args.pdf:
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, text in corpus[:args.pdf]:
+                write_pdf(text, os.path.join(tmp, name))
+            # parse_resume's steps, without it so that a missing spaCy model
+            # only skips its columns
+            for name, _ in corpus[:args.pdf]:
+                start = time.perf_counter()
+                text, _ = parser.read_pdf_text(os.path.join(tmp, name))
+                times.setdefault('read PDF', []).append(time.perf_counter() - start)
+                extract(parser, text, columns)
+                times.setdefault('PDF end to end', []).append(time.perf_counter() - start)
+
+    print(f"{args.resumes} resume texts, {args.pdf} PDFs")
+    print_times(times)
+
+    if not check_golden(parser, vocabulary, columns, nlp, args.update_golden):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# Pathological-input corpus for the parser's regexes.
+#
+# Every pattern in EnhancedResumeParser.patterns is run over each input at two
+# sizes. A pattern fails if one run over the larger input takes more than
+# --max-seconds, or if its time grows clearly faster than the input (4x the
+# text taking more than 8x the time). The inputs are the shapes that used to
+# stall workers: text without newlines, thousands of blank lines, long runs of
+# digits or word characters, and section keywords repeated with nothing after
+# them. --fuzz adds inputs made by repeating random snippets of the parser's
+# own keywords and punctuation.
+#
+# Patterns are run on the text their extractor actually gives them: the
+# count_projects patterns on its normalized text, the verb patterns only on
+# the fragments that contain their verb.
+#
+# With --extractors, every extractor of parse_resume is also timed on each
+# larger input; without the spaCy model, Skills and Project_Keywords are
+# skipped as in bench_parser.
+#
+# Usage: python benchmarks/bench_regex_pathological.py [--size N] [--fuzz N] [--extractors]
+import gc
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parser import MODEL_COLUMNS, nlp_version
+from resume_parser import EnhancedResumeParser, MAX_BLANK_LINES
+
+GROWTH = 4          # the larger input is this many times the smaller one
+MAX_RATIO = 8.0     # linear growth gives ~4x, quadratic ~16x
+NOISE_SECONDS = 0.005
+REPEAT = 3          # best of, per pattern and input
+
+# Patterns the parser uses for substitution or splitting rather than searching
+SUBSTITUTIONS = {
+    'preprocess.punctuation', 'preprocess.whitespace', 'mobile.non_digit',
+    'projects.horizontal_whitespace', 'projects.blank_lines'
+}
+SPLITS = {'projects.fragment_break'}
+
+
+def repeat(snippet, size):
+    return (snippet * (size // len(snippet) + 1))[:size]
+
+
+# name -> function(size) returning the input text
+INPUTS = {
+    # Layout
+    'one_word': lambda n: 'a' * n,
+    'no_newlines': lambda n: repeat('lorem ipsum dolor ', n),
+    'newlines': lambda n: '\n' * n,
+    'crlf': lambda n: '\r\n' * (n // 2),
+    'spaces': lambda n: ' ' * n,
+    'blank_lines_with_spaces': lambda n: repeat('\n' + ' ' * 50, n),
+    'short_lines': lambda n: repeat('\nxxxxxxxxxxxxxxxxxxxx', n),
+    'bullets': lambda n: repeat('\n- yyyyyyyyyyyyyyyyyyyy', n),
+    'bullet_after_blank_lines': lambda n: '\n' * n + '- x',
+    'dashes': lambda n: '-' * n,
+    'dash_lines': lambda n: repeat('---\n', n),
+    'capitalized_words': lambda n: repeat('Ab ', n),
+
+    # Numbers and addresses
+    'digits': lambda n: '1' * n,
+    'digits_and_dots': lambda n: repeat('1.', n),
+    'dotted_word_before_at': lambda n: repeat('a.', n) + '@',
+    'at_signs': lambda n: repeat('a@', n),
+    'long_domain': lambda n: 'a@' + 'b' * n,
+
+    # Keywords with nothing usable after them
+    'cgpa': lambda n: repeat('cgpa ', n),
+    'cpi': lambda n: repeat('cpi ', n),
+    'gpa_fraction': lambda n: repeat('gpa 1/ ', n),
+    'grade': lambda n: repeat('grade ', n),
+    'upto': lambda n: repeat('upto 1/10 sem ', n),
+    'education_colon': lambda n: repeat('education: x ', n),
+    'education_lines': lambda n: repeat('education\n1\n', n),
+    'education_digit_lines': lambda n: 'education:\n' + repeat('1\n', n),
+    'skills_colon': lambda n: repeat('skills: ', n),
+    'email_lines': lambda n: repeat('email\n', n),
+    'email_colon': lambda n: repeat('email: x ', n),
+    'phone': lambda n: repeat('phone ', n),
+    'phone_lines': lambda n: repeat('phone\n', n),
+    'degree': lambda n: repeat('bachelor in of ', n),
+    'degree_lines': lambda n: repeat('bachelor in of \n', n),
+    'degree_punctuation': lambda n: 'bachelor in ' + '.' * n,
+    'projects_long_word': lambda n: 'projects:\n' + 'a' * n,
+    'projects_long_lines': lambda n: 'projects:\n' + repeat('\n' + 'a' * 200, n),
+    'projects_blank_lines': lambda n: 'projects:\n' + '\n' * n + 'x',
+    'project': lambda n: repeat('project ', n),
+    'title': lambda n: 'title: ' + 'x' * n,
+    'months': lambda n: repeat('jan 2020 - ', n),
+    'year_ranges': lambda n: repeat(' 2020 -', n),
+    'duration': lambda n: repeat('duration: ', n),
+    'guide': lambda n: repeat('guide ', n),
+    'verbs': lambda n: repeat('developed ', n),
+    'worked_at': lambda n: repeat('worked at ', n),
+    'job_title': lambda n: repeat('engineer ', n),
+    'job_title_then_student': lambda n: repeat('engineer ', n) + ' student',
+}
+
+FUZZ_TOKENS = [
+    'cgpa', 'cpi', 'gpa', '/10', '1', '9.5', '.', ':', '-', '@', ' ', '\n', '\n\n', '\t',
+    'a', 'Z', 'education', 'skills', 'projects', 'project', 'experience', 'email', 'phone',
+    'title', 'duration', 'months', '2020', 'present', 'engineer', 'student', 'developed',
+    'bachelor', 'in', '•', '*', '=', '_',
+]
+
+
+def fuzz_inputs(count, seed):
+    rng = random.Random(seed)
+    inputs = {}
+    for i in range(count):
+        snippet = ''.join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(1, 6)))
+        inputs[f'fuzz_{i}'] = lambda n, snippet=snippet: repeat(snippet, n)
+    return inputs
+
+
+class PatternRunner:
+    # Runs each registered pattern the way its extractor does
+
+    def __init__(self, parser):
+        self.parser = parser
+        self.patterns = parser.patterns
+        self.verbs = dict(zip(
+            (pattern.name for pattern in self.patterns['projects.verb_context']),
+            parser.project_action_verbs
+        ))
+
+    def projects_text(self, text):
+        # Same normalization as the start of count_projects
+        text = self.patterns['projects.horizontal_whitespace'].sub(' ', text).lower()
+        return self.patterns['projects.blank_lines'].sub('\n' * (MAX_BLANK_LINES + 1), text)
+
+    def targets(self, name, text):
+        if name in self.verbs:
+            verb = self.verbs[name]
+            fragments = self.patterns['projects.fragment_break'].split(self.projects_text(text))
+            return [fragment for fragment in fragments if verb in fragment]
+        if name.startswith('projects.') and name not in ('projects.horizontal_whitespace', 'projects.blank_lines'):
+            return [self.projects_text(text)]
+        return [text]
+
+    def run(self, name, pattern, targets):
+        for target in targets:
+            if name in SUBSTITUTIONS:
+                pattern.sub(' ', target)
+            elif name in SPLITS:
+                pattern.split(target)
+            else:
+                pattern.finditer(target)
+
+    def time(self, name, text):
+        pattern = self.patterns[name]
+        targets = self.targets(name, text)
+        timings = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            self.run(name, pattern, targets)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+
+def check_patterns(parser, inputs, size, max_seconds):
+    runner = PatternRunner(parser)
+    small_size = size // GROWTH
+    failures = []
+    slowest = []
+
+    for input_name, make in inputs.items():
+        small_text, large_text = make(small_size), make(size)
+        for name in parser.patterns.patterns:
+            small = runner.time(name, small_text)
+            large = runner.time(name, large_text)
+            ratio = large / small if small > 0 else 0.0
+            slowest.append((large, name, input_name, ratio))
+
+            if large > max_seconds:
+                failures.append(f"{name} on {input_name}: {large:.3f}s for {len(large_text)} chars")
+            elif large > NOISE_SECONDS and ratio > MAX_RATIO:
+                failures.append(f"{name} on {input_name}: {ratio:.1f}x slower for {GROWTH}x the text")
+
+    return failures, sorted(slowest, reverse=True)
+
+
+def check_extractors(parser, inputs, size, max_seconds):
+    nlp = nlp_version()
+    extractors = [
+        extractor for column, extractor in parser.extractors() if nlp or column not in MODEL_COLUMNS
+    ]
+    failures = []
+    slowest = []
+
+    for input_name, make in inputs.items():
+        context = parser.analyze(make(size))
+        for extractor in extractors:
+            start = time.perf_counter()
+            extractor(context)
+            elapsed = time.perf_counter() - start
+            slowest.append((elapsed, extractor.__name__, input_name))
+            if elapsed > max_seconds:
+                failures.append(f"{extractor.__name__} on {input_name}: {elapsed:.3f}s")
+
+    return failures, sorted(slowest, reverse=True)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Check parser regexes for super-linear runtime on pathological input')
+    arg_parser.add_argument('--size', type=int, default=16000, help='characters in the larger input')
+    arg_parser.add_argument('--max-seconds', type=float, default=0.2,
+                            help='longest one pattern may take on the larger input')
+    arg_parser.add_argument('--fuzz', type=int, default=0, help='random repeated-snippet inputs to add')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--extractors', action='store_true', help='also time every extractor')
+    arg_parser.add_argument('--max-extractor-seconds', type=float, default=2.0)
+    args = arg_parser.parse_args()
+
+    parser = EnhancedResumeParser()
+    inputs = dict(INPUTS)
+    inputs.update(fuzz_inputs(args.fuzz, args.seed))
+
+    # Collections in the middle of a run would be counted against one pattern
+    gc.disable()
+    failures, slowest = check_patterns(parser, inputs, args.size, args.max_seconds)
+    print(f"{len(parser.patterns.patterns)} patterns x {len(inputs)} inputs of {args.size} characters")
+    print("Slowest:")
+    for elapsed, name, input_name, ratio in slowest[:10]:
+        print(f"  {elapsed * 1000:8.2f} ms  {ratio:5.1f}x  {name} on {input_name}")
+
+    if args.extractors:
+        extractor_failures, extractor_slowest = check_extractors(
+            parser, inputs, args.size, args.max_extractor_seconds
+        )
+        failures.extend(extractor_failures)
+        print("Slowest extractors:")
+        for elapsed, name, input_name in extractor_slowest[:10]:
+            print(f"  {elapsed * 1000:8.2f} ms  {name} on {input_name}")
+
+    if failures:
+        print(f"{len(failures)} failures:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+    print("All within bounds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# Benchmark for resume_index.ResumeIndex queries against a scan of the
+# parse results.
+#
+# Builds an index of synthetic parse_resume results (skills and project
+# keywords from the shared vocabularies), times building it, reloading it
+# from its log and a handful of requirement queries, and checks the reloaded
+# fields and every query against the parse results and a plain Python scan
+# (any difference fails the run).
+#
+# Usage: python benchmarks/bench_resume_index.py [--resumes N]
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_score_matrix import BRANCHES, vocabularies
+from resume_index import ResumeIndex, index_fields
+
+CORE_SKILLS = ['Computer Architecture', 'DBMS', 'Networks', 'OOP', 'OS']
+
+QUERIES = [
+    {'skills': ['python', 'docker'], 'cpi': {'min': 7.5}, 'branch': ['cse', 'it']},
+    {'skills': {'any': ['react', 'angular', 'vue.js'], 'none': ['php']}},
+    {'skills': ['machine learning'], 'core': ['DBMS'], 'experience': True},
+    {'cpi': {'min': 8, 'max': 9}, 'projects': {'min': 3}},
+    {'branch': ['Mechanical Engineering'], 'keywords': ['robotics']},
+]
+
+
+def make_result(rng, i, skills, keywords):
+    return {
+        'file_name': f'resume_{i}.pdf',
+        'Skills': rng.sample(skills, rng.randint(0, 25)),
+        'Project_Keywords': rng.sample(keywords, rng.randint(0, 10)),
+        'Core_Computer_Skills': ', '.join(sorted(rng.sample(CORE_SKILLS, rng.randint(0, 3)))) or None,
+        'Branch': rng.choice(BRANCHES) or None,
+        'CPI/GPA': rng.choice([None, round(rng.uniform(5, 10), 2)]),
+        'No_of_Projects': rng.randint(0, 6),
+        'Experience': rng.choice(['Yes', 'No']),
+    }
+
+
+def scan(fields, spec, aliases):
+    # The query semantics of ResumeIndex.query, one resume at a time
+    matches = []
+    for resume, values in fields.items():
+        ok = True
+        for field in ('skills', 'keywords', 'core'):
+            clause = spec.get(field)
+            if clause is None:
+                continue
+            clause = clause if isinstance(clause, dict) else {'all': clause}
+            have = set(values[field])
+            ok &= all(term.lower() in have for term in clause.get('all', []))
+            ok &= not clause.get('any') or any(term.lower() in have for term in clause['any'])
+            ok &= not any(term.lower() in have for term in clause.get('none', []))
+        if spec.get('branch') is not None:
+            ok &= values['branch'] in {aliases.get(name.lower(), name.lower()) for name in spec['branch']}
+        for field in ('cpi', 'projects', 'experience'):
+            clause = spec.get(field)
+            if clause is None:
+                continue
+            low, high = (clause.get('min', float('-inf')), clause.get('max', float('inf'))) \
+                if isinstance(clause, dict) else (float(clause), float(clause))
+            ok &= values[field] is not None and low <= values[field] <= high
+        if ok:
+            matches.append(resume)
+    return matches
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark inverted index queries over parsed resumes')
+    arg_parser.add_argument('--resumes', type=int, default=200000)
+    arg_parser.add_argument('--repeat', type=int, default=20)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    from vocabulary import BRANCH_MAPPING
+    aliases = {alias: branch.lower() for branch, names in BRANCH_MAPPING.items() for alias in names}
+
+    rng = random.Random(args.seed)
+    skills, keywords = vocabularies()
+    results = [make_result(rng, i, skills, keywords) for i in range(args.resumes)]
+    fields = {result['file_name']: index_fields(result) for result in results}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'resume_index.jsonl')
+
+        start = time.perf_counter()
+        index = ResumeIndex(path)
+        for result in results:
+            index.add(result['file_name'], result)
+        index.close()
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = ResumeIndex(path)
+        load_time = time.perf_counter() - start
+
+        print(f"{args.resumes} resumes, index file {os.path.getsize(path) / 1e6:.1f} MB")
+        print(f"Build:  {build_time:.2f} s    Reload: {load_time:.2f} s")
+
+        failures = []
+        if index.fields != fields:
+            failures.append('reloaded fields')
+        for spec in QUERIES:
+            matches = index.query(spec)
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                index.query(spec)
+            elapsed = (time.perf_counter() - start) / args.repeat
+
+            start = time.perf_counter()
+            expected = scan(fields, spec, aliases)
+            scan_time = time.perf_counter() - start
+
+            if matches != expected:
+                failures.append(spec)
+            print(f"{elapsed * 1000:8.2f} ms (scan {scan_time * 1000:7.1f} ms) {len(matches):7d} matches  {spec}")
+        index.close()
+
+    if failures:
+        print(f"{len(failures)} checks differ from the parse results or the scan:")
+        for spec in failures:
+            print(f"  {spec}")
+        sys.exit(1)
+
+    print("All queries match the scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# Benchmark for score_matrix.CompanyProfiles against calculate_score per pair.
+#
+# Generates synthetic resumes and companies from the shared skill and
+# project keyword vocabularies (vocabulary.py), scores every resume against every company
+# with the matrix engine, and checks the first --check resumes against
+# calculate_scores_pairwise cell by cell (any difference fails the run).
+# Both are also compared with the scores in benchmarks/golden/scores.jsonl,
+# so a change that moves any score fails too. The golden inputs are drawn
+# from the first terms by id, which stay the same as terms are added.
+#
+# Usage: python benchmarks/bench_score_matrix.py [--resumes N] [--companies N] [--check N] [--update-golden]
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from golden import compare, load_golden, report, write_golden
+from rank_generator import calculate_scores_pairwise
+from score_matrix import CompanyProfiles
+from vocabulary import KEYWORDS, SKILLS
+
+GOLDEN_SEED = 0
+GOLDEN_RESUMES = 100
+GOLDEN_COMPANIES = 50
+
+BRANCHES = [
+    'Computer Science', 'Computer Science and Engineering', 'Electrical Engineering',
+    'Electronics and Communication', 'Mechanical Engineering', 'Civil Engineering',
+    'Mathematics and Computing', 'Chemical Engineering', ''
+]
+
+
+def vocabularies(skill_count=None, keyword_count=None):
+    # Skills and project keywords in id order, the first ones only if given
+    return SKILLS.terms[:skill_count], KEYWORDS.terms[:keyword_count]
+
+
+def make_company(rng, skills, keywords):
+    return {
+        'Skill_Set': rng.sample(skills, rng.randint(3, 15)),
+        'Core_Skills': rng.sample(skills, rng.randint(0, 5)),
+        'Project_Keywords': rng.sample(keywords, rng.randint(0, 8)),
+        'CPI': rng.choice([0, 6, 6.5, 7, 7.5, 8, 8.5]),
+        'Min_Projects': rng.randint(0, 4),
+        'Branch': rng.sample(BRANCHES[:-1], rng.randint(0, 3)),
+    }
+
+
+def make_resume(rng, skills, keywords):
+    return {
+        'Skill_Set': rng.sample(skills, rng.randint(0, 25)),
+        'Project_Keywords': rng.sample(keywords, rng.randint(0, 10)),
+        'CPI': rng.choice([0, round(rng.uniform(5, 10), 2)]),
+        'Projects': rng.randint(0, 6),
+        'Experience': rng.choice([0, 1]),
+        'Branch': rng.choice(BRANCHES),
+    }
+
+
+def golden_scores(seed, resume_count, company_count, skill_count, keyword_count):
+    # {key: {"matrix": [...], "pairwise": [...]}} for the golden inputs
+    rng = random.Random(seed)
+    skills, keywords = vocabularies(skill_count, keyword_count)
+    companies = [make_company(rng, skills, keywords) for _ in range(company_count)]
+    resumes = [make_resume(rng, skills, keywords) for _ in range(resume_count)]
+    scores, _ = CompanyProfiles(companies).score(resumes)
+    expected, _ = calculate_scores_pairwise(resumes, companies)
+    return {
+        f"resume_{i}": {"matrix": scores[i].tolist(), "pairwise": expected[i]} for i in range(resume_count)
+    }
+
+
+def check_golden(update):
+    header, expected = load_golden('scores')
+    if update or header is None:
+        values = golden_scores(GOLDEN_SEED, GOLDEN_RESUMES, GOLDEN_COMPANIES, len(SKILLS), len(KEYWORDS))
+        write_golden('scores', {
+            'seed': GOLDEN_SEED, 'resumes': GOLDEN_RESUMES, 'companies': GOLDEN_COMPANIES,
+            'skills': len(SKILLS), 'keywords': len(KEYWORDS)
+        }, {key: value["pairwise"] for key, value in values.items()})
+        print(f"Golden scores: wrote {GOLDEN_RESUMES} resumes x {GOLDEN_COMPANIES} companies")
+        return True
+
+    values = golden_scores(
+        header['seed'], header['resumes'], header['companies'], header['skills'], header['keywords']
+    )
+    expected = {key: {"matrix": scores, "pairwise": scores} for key, scores in expected.items()}
+    return report('scores', compare(expected, values, ["matrix", "pairwise"]))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark vectorized resume x company scoring')
+    arg_parser.add_argument('--resumes', type=int, default=50000)
+    arg_parser.add_argument('--companies', type=int, default=100)
+    arg_parser.add_argument('--check', type=int, default=500, help='resumes to compare with calculate_score')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--update-golden', action='store_true',
+                            help='rewrite golden/scores.jsonl from the current calculate_score')
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills, keywords = vocabularies()
+    companies = [make_company(rng, skills, keywords) for _ in range(args.companies)]
+    resumes = [make_resume(rng, skills, keywords) for _ in range(args.resumes)]
+
+    start = time.perf_counter()
+    profiles = CompanyProfiles(companies)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores, errors = profiles.score(resumes)
+    matrix_time = time.perf_counter() - start
+
+    sample = resumes[:args.check]
+    start = time.perf_counter()
+    expected, expected_errors = calculate_scores_pairwise(sample, companies)
+    pairwise_time = time.perf_counter() - start
+
+    mismatches = [
+        (i, j, scores[i, j], expected[i][j])
+        for i in range(len(sample)) for j in range(len(companies))
+        if scores[i, j] != expected[i][j]
+    ]
+
+    cells = args.resumes * args.companies
+    print(f"{args.resumes} resumes x {args.companies} companies ({cells} scores)")
+    print(f"Compile profiles:  {compile_time * 1000:.1f} ms")
+    print(f"Matrix scoring:    {matrix_time:.3f} s ({matrix_time / cells * 1e9:.0f} ns/score)")
+    if sample:
+        per_score = pairwise_time / (len(sample) * args.companies)
+        print(f"calculate_score:   {per_score * 1e9:.0f} ns/score "
+              f"(~{per_score * cells:.1f} s for all, {per_score * cells / matrix_time:.0f}x slower)")
+
+    if mismatches or errors or expected_errors:
+        print(f"{len(mismatches)} mismatches, {len(errors)}/{len(expected_errors)} errors")
+        for i, j, got, want in mismatches[:10]:
+            print(f"  resume {i}, company {j}: {got} != {want}")
+        sys.exit(1)
+
+    print(f"Matches calculate_score on the first {len(sample)} resumes")
+
+    if not check_golden(args.update_golden):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Benchmark for shortlist.ResumePool.top_k against ranking the whole pool.
+#
+# Builds pools of growing size from bench_score_matrix's synthetic resumes,
+# with a few rare skills held by a fixed fraction of them, and asks for the
+# top k of a broad company (common skills) and a selective one (the rare
+# skills and a CPI bar). Every shortlist is checked against the first k of
+# the full ranking (any difference fails the run): exactness is what top_k
+# guarantees. How many resumes it scores depends on the data, not on the
+# pool size: it stops once no remaining bound reaches the k-th score. For
+# the selective company that is cheap once k resumes hold the rare skills
+# and clear the CPI bar, and it scores far more while fewer than k do (the
+# smallest pool here, with 25 holders for k = 50). The scored counts are
+# printed, not checked.
+#
+# Usage: python benchmarks/bench_shortlist.py [--sizes N ...] [-k K]
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_score_matrix import make_company, make_resume, vocabularies
+from rerank import rank_company
+from score_matrix import CompanyProfiles
+from shortlist import ResumePool
+
+RARE_SKILLS = ['verilog', 'fpga design', 'vlsi']
+RARE_EVERY = 400    # one resume in this many holds two of the rare skills
+
+
+def build(rng, size, skills, keywords):
+    resumes = []
+    for i in range(size):
+        resume = make_resume(rng, skills, keywords)
+        if i % RARE_EVERY == 0:
+            resume['Skill_Set'] = resume['Skill_Set'] + rng.sample(RARE_SKILLS, 2)
+        resumes.append(resume)
+    pool = ResumePool()
+    for i, resume in enumerate(resumes):
+        pool.add(i, resume)
+    return resumes, pool
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark top-k shortlists against full ranking')
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 40000, 160000])
+    arg_parser.add_argument('-k', type=int, default=50)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills, keywords = vocabularies()
+    companies = {
+        'broad': make_company(rng, skills, keywords),
+        'selective': {
+            'Skill_Set': RARE_SKILLS, 'Core_Skills': RARE_SKILLS[:1], 'Project_Keywords': keywords[:3],
+            'CPI': 8, 'Min_Projects': 2, 'Branch': []
+        },
+    }
+
+    failures = []
+    for size in args.sizes:
+        resumes, pool = build(rng, size, skills, keywords)
+        full, _ = CompanyProfiles(list(companies.values())).score(resumes)
+
+        for j, (name, company) in enumerate(companies.items()):
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                rankings, scored = pool.top_k(company, args.k)
+            elapsed = (time.perf_counter() - start) / args.repeat
+
+            order, ranks = rank_company(full[:, j])
+            expected = [(int(i), float(full[i, j]), int(rank)) for i, rank in zip(order[:args.k], ranks[:args.k])]
+            if rankings != expected:
+                failures.append(f"{name} company, {size} resumes")
+
+            print(f"{size:8d} resumes  {name:9s}  {elapsed * 1000:8.2f} ms  scored {scored:7d}")
+
+    if failures:
+        print(f"{len(failures)} shortlists differ from the full ranking:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+    print("All shortlists match the full ranking")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Micro-benchmark for the stopword filter in EnhancedResumeParser.extract_skills.
+#
+# Compares the old per-token lookup (stopwords.words('english') reloaded and
+# scanned as a list for every NOUN/PROPN token) with the parser's frozenset,
+# over the tokens of one resume. Without the spaCy model or the NLTK
+# stopwords there are no tokens to compare, so the benchmark is skipped.
+#
+# Usage: python benchmarks/bench_stopwords.py [resume.pdf | resume.txt] [--repeat N]
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_parser import EnhancedResumeParser, ResourceUnavailableError, get_nlp
+
+DEFAULT_RESUME = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'test', 'data', '05-versions-space.pdf'
+)
+
+
+def load_text(parser, path):
+    if path.lower().endswith('.pdf'):
+        return parser.extract_text_from_pdf(path)
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def candidate_tokens(parser, text):
+    # The tokens extract_skills runs the stopword check on
+    doc = get_nlp()(parser.preprocess_text(text))
+    return [token.text.lower() for token in doc if token.pos_ in ['NOUN', 'PROPN']]
+
+
+def list_lookup(tokens):
+    from nltk.corpus import stopwords
+    return sum(1 for token in tokens if token not in stopwords.words('english'))
+
+
+def frozenset_lookup(tokens, stop_words):
+    return sum(1 for token in tokens if token not in stop_words)
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark the extract_skills stopword lookup')
+    arg_parser.add_argument('resume', nargs='?', default=DEFAULT_RESUME)
+    arg_parser.add_argument('--repeat', type=int, default=20)
+    args = arg_parser.parse_args()
+
+    parser = EnhancedResumeParser()
+    try:
+        tokens = candidate_tokens(parser, load_text(parser, args.resume))
+        stop_words = parser.stop_words
+    except ResourceUnavailableError as e:
+        print(f"Warning: {e}; skipping the stopword benchmark")
+        return
+
+    list_time, list_kept = best_of(args.repeat, list_lookup, tokens)
+    set_time, set_kept = best_of(args.repeat, frozenset_lookup, tokens, stop_words)
+
+    if list_kept != set_kept:
+        print(f"Mismatch: list lookup kept {list_kept} tokens, frozenset kept {set_kept}")
+        sys.exit(1)
+
+    print(f"Resume: {os.path.basename(args.resume)} ({len(tokens)} NOUN/PROPN tokens)")
+    print(f"stopwords.words('english') per token: {list_time * 1000:.3f} ms/resume")
+    print(f"parser.stop_words frozenset:          {set_time * 1000:.3f} ms/resume")
+    print(f"Speedup: {list_time / set_time if set_time else float('inf'):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# Synthetic resume corpus for the benchmarks.
+#
+# Resume texts are assembled from the parser's own vocabularies (skills,
+# project keywords, branch aliases, core computer skill terms) in the layouts
+# the extractors look for: contact lines, an education section with one of
+# several GPA formats, skills, projects and, for some, internships with date
+# ranges. The same seed always gives the same corpus. write_pdf() turns a
+# text into a plain single-font PDF that PyPDF2 reads back line by line.
+#
+# Usage: python benchmarks/corpus.py OUT_DIR [--count N] [--seed S] [--text]
+import os
+import sys
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_parser import BRANCH_MAPPING, EnhancedResumeParser
+
+FIRST_NAMES = ['Aarav', 'Diya', 'Ishaan', 'Meera', 'Rohan', 'Sneha', 'Kabir', 'Ananya', 'Vikram', 'Priya']
+LAST_NAMES = ['Sharma', 'Iyer', 'Gupta', 'Reddy', 'Khan', 'Das', 'Mehta', 'Nair', 'Singh', 'Patel']
+DEGREES = ['B.Tech', 'B.E.', 'Bachelor of Technology', 'M.Tech', 'Dual Degree (B.Tech + M.Tech)']
+INSTITUTES = ['Indian Institute of Technology', 'National Institute of Technology', 'State Engineering College']
+COMPANIES = ['Infosys', 'Zomato', 'Flipkart', 'Tata Motors', 'ISRO', 'a fintech startup']
+ROLES = ['Software Intern', 'Research Intern', 'Data Analyst Intern', 'Summer Trainee']
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+VERBS = ['Built', 'Designed', 'Implemented', 'Developed', 'Optimized']
+
+GPA_FORMATS = [
+    lambda gpa: f"CGPA: {gpa:.2f}/10",
+    lambda gpa: f"CPI: {gpa:.2f}",
+    lambda gpa: f"GPA {gpa * 0.4:.2f}/4.0",
+    lambda gpa: f"Cumulative Grade Point Average - {gpa:.1f} / 10",
+    lambda gpa: f"{gpa:.2f} CGPA",
+]
+
+
+class Vocabulary:
+    # The parser word lists the generator draws from
+
+    def __init__(self, parser=None):
+        parser = parser or EnhancedResumeParser()
+        self.skills = sorted(set(parser.skill_set_list))
+        self.keywords = sorted(set(parser.project_keywords_list))
+        self.core_terms = sorted({term for terms in parser.core_computer_skills.values() for term in terms})
+        self.branches = sorted(BRANCH_MAPPING.items())
+
+
+def make_resume_text(rng, vocabulary):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines = [
+        f"{first} {last}",
+        f"Email: {first.lower()}.{last.lower()}{rng.randint(1, 999)}@example.com | "
+        f"Phone: +91 {rng.randint(6, 9)}{rng.randint(0, 999999999):09d}",
+        "",
+        "EDUCATION",
+    ]
+
+    _, aliases = rng.choice(vocabulary.branches)
+    start = rng.randint(2015, 2022)
+    lines.append(f"{rng.choice(DEGREES)} in {rng.choice(aliases).title()}, "
+                 f"{rng.choice(INSTITUTES)} {start} - {start + 4}")
+    if rng.random() < 0.9:
+        lines.append(rng.choice(GPA_FORMATS)(rng.uniform(5.5, 9.9)))
+    lines += ["", "SKILLS"]
+    lines.append(", ".join(rng.sample(vocabulary.skills, rng.randint(4, 20))))
+    if rng.random() < 0.6:
+        lines.append("Coursework: " + ", ".join(rng.sample(vocabulary.core_terms, rng.randint(2, 6))))
+
+    projects = rng.choice([0, 1, 2, 2, 3, 3, 4, 5])
+    if projects:
+        lines += ["", "PROJECTS"]
+    for i in range(projects):
+        keywords = rng.sample(vocabulary.keywords, rng.randint(1, 4))
+        lines.append(f"{i + 1}. {keywords[0].title()} Project | {', '.join(keywords)}")
+        for _ in range(rng.randint(1, 3)):
+            lines.append(f"- {rng.choice(VERBS)} a {rng.choice(keywords)} system using "
+                         f"{rng.choice(vocabulary.skills)} and {rng.choice(vocabulary.skills)}")
+
+    if rng.random() < 0.5:
+        lines += ["", "EXPERIENCE"]
+        for _ in range(rng.randint(1, 2)):
+            year = rng.randint(2018, 2024)
+            lines.append(f"{rng.choice(ROLES)}, {rng.choice(COMPANIES)} "
+                         f"{rng.choice(MONTHS)} {year} - {rng.choice(MONTHS)} {year + rng.randint(0, 1)}")
+            lines.append(f"- {rng.choice(VERBS)} {rng.choice(vocabulary.keywords)} tooling with "
+                         f"{rng.choice(vocabulary.skills)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def make_corpus(count, seed=0, vocabulary=None):
+    # [(file name, text)], the same for the same seed
+    rng = random.Random(seed)
+    vocabulary = vocabulary or Vocabulary()
+    return [(f"resume_{i:05d}.pdf", make_resume_text(rng, vocabulary)) for i in range(count)]
+
+
+def _pdf_string(line):
+    line = line.encode('latin-1', 'replace').decode('latin-1')
+    return "(" + line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def write_pdf(text, path, lines_per_page=60):
+    # One Helvetica text object per page, a line per T* move
+    lines = text.splitlines() or [""]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        None,   # page tree, once the page objects are numbered
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for page in pages:
+        stream = "BT /F1 10 Tf 12 TL 50 790 Td " + " ".join(f"{_pdf_string(line)} Tj T*" for line in page) + " ET"
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        page_ids.append(len(objects))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(page_ids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode('latin-1')
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('latin-1')
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode('latin-1')
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode('latin-1')
+
+    with open(path, 'wb') as f:
+        f.write(out)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Write a synthetic resume corpus')
+    arg_parser.add_argument('out_dir')
+    arg_parser.add_argument('--count', type=int, default=1000)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--text', action='store_true', help='write .txt files instead of PDFs')
+    args = arg_parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for file_name, text in make_corpus(args.count, args.seed):
+        if args.text:
+            with open(os.path.join(args.out_dir, file_name[:-4] + '.txt'), 'w', encoding='utf-8') as f:
+                f.write(text)
+        else:
+            write_pdf(text, os.path.join(args.out_dir, file_name))
+    print(f"Wrote {args.count} resumes to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Golden outputs for the benchmarks.
+#
+# A golden file is JSON lines in benchmarks/golden/: a {"header": {...}} line
+# recording how the outputs were produced (seed, sizes, versions), then one
+# {"key": ..., "value": {...}} line per input. Benchmarks regenerate the same
+# inputs from the header, compare every value and fail on any difference, so
+# an optimization cannot silently change results. --update-golden rewrites
+# the file after an intended change.
+import os
+import json
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden')
+
+
+def golden_path(name):
+    return os.path.join(GOLDEN_DIR, name + '.jsonl')
+
+
+def normalize(values):
+    # Lists in a {field: value} dict sorted, for outputs built from sets
+    # (whose order changes between runs)
+    return {
+        field: sorted(value, key=json.dumps) if isinstance(value, list) else value
+        for field, value in values.items()
+    }
+
+
+def load_golden(name):
+    # (header, {key: value}), or (None, None) when there is no golden file
+    path = golden_path(name)
+    if not os.path.exists(path):
+        return None, None
+    header, values = None, {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if 'header' in record:
+                header = record['header']
+            else:
+                values[record['key']] = record['value']
+    return header, values
+
+
+def write_golden(name, header, values):
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    with open(golden_path(name), 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'header': header}) + "\n")
+        for key, value in values.items():
+            f.write(json.dumps({'key': key, 'value': value}) + "\n")
+
+
+def compare(expected, actual, fields):
+    # [(key, field, expected, actual)] for every difference in the given fields
+    differences = []
+    for key in sorted(set(expected) | set(actual)):
+        want, got = expected.get(key), actual.get(key)
+        if want is None or got is None:
+            differences.append((key, None, want, got))
+            continue
+        for field in fields:
+            if want.get(field) != got.get(field):
+                differences.append((key, field, want.get(field), got.get(field)))
+    return differences
+
+
+def report(name, differences, limit=10):
+    # Prints the differences; True when there are none
+    if not differences:
+        print(f"Golden {name}: all outputs match")
+        return True
+    print(f"Golden {name}: {len(differences)} differences")
+    for key, field, want, got in differences[:limit]:
+        print(f"  {key} {field or '(missing)'}: expected {want!r}, got {got!r}")
+    return False
@@ -0,0 +1,53 @@
+import json
+import struct
+
+# Length-prefixed JSON frames, the protocol of the --worker modes (see
+# utils/framing.js): every message is a 4-byte big-endian byte count
+# followed by that many bytes of UTF-8 JSON. A reader never scans for
+# delimiters, a message of any size is parsed once, and a frame that is not
+# valid JSON does not lose track of the ones after it.
+
+HEADER = struct.Struct('>I')
+MAX_FRAME = 2 ** 32 - 1
+
+
+class FrameError(Exception):
+    # The stream ended inside a frame, so nothing after it can be read
+    pass
+
+
+def _read_exact(stream, size):
+    # Exactly size bytes, or None if the stream ends before the first one
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            if remaining == size:
+                return None
+            raise FrameError(f"Stream ended {remaining} bytes short of a {size}-byte read")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def read_frame(stream):
+    # The next message from a binary stream, or None at the end of the stream.
+    # Raises ValueError for a frame that is not JSON (the stream stays usable)
+    # and FrameError for a truncated one.
+    header = _read_exact(stream, HEADER.size)
+    if header is None:
+        return None
+    size, = HEADER.unpack(header)
+    body = _read_exact(stream, size) if size else b''
+    if body is None:
+        raise FrameError(f"Stream ended before a {size}-byte frame")
+    return json.loads(body)
+
+
+def write_frame(stream, message):
+    body = json.dumps(message).encode('utf-8')
+    if len(body) > MAX_FRAME:
+        raise ValueError(f"Message of {len(body)} bytes does not fit in a frame")
+    stream.write(HEADER.pack(len(body)) + body)
+    stream.flush()
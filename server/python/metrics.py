@@ -0,0 +1,125 @@
+import os
+import json
+import time
+
+# Opt-in wall time per stage and counters for the parsing and scoring code.
+#
+# Code that can be measured takes an optional Metrics and does nothing extra
+# when it is None, so with instrumentation off the cost is an `is not None`
+# check per stage.
+#
+# A Metrics records one operation at a time, from begin() to end(): seconds
+# per stage (added up when a stage runs more than once) and integer counters.
+# end() returns the operation's record
+#     {"operation": "parse_resume", "seconds": s,
+#      "stages": {stage: seconds, ...}, "counters": {name: n, ...}}
+# adds it to running totals and exports it. With a path ending in ".prom"
+# the totals are rewritten in Prometheus text format after every operation
+# (for node_exporter's textfile collector); any other path gets one JSON line
+# per operation. Use JSON lines when several processes share one path.
+#
+# Stages can nest: the "nlp" pass of parse_resume also counts towards the
+# extractor that first needed it.
+
+PROMETHEUS_PREFIX = 'resume_ranking'
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+
+    def __init__(self, path=None, attach=False):
+        # attach: callers add each operation's record to their result
+        self.path = path
+        self.attach = attach
+        self.record = None
+        self.operations = {}    # operation -> [count, seconds]
+        self.stages = {}        # (operation, stage) -> seconds
+        self.counters = {}      # (operation, counter) -> total
+        self._start = None
+        self._out = None
+
+    def begin(self, operation):
+        self.record = {"operation": operation, "seconds": 0.0, "stages": {}, "counters": {}}
+        self._start = time.perf_counter()
+
+    def lap(self, stage, start):
+        # Adds the time since start (a time.perf_counter() value) to stage and
+        # returns the current time, to start the next stage from
+        now = time.perf_counter()
+        if self.record is not None:
+            stages = self.record["stages"]
+            stages[stage] = stages.get(stage, 0.0) + (now - start)
+        return now
+
+    def count(self, name, value=1):
+        if self.record is not None:
+            counters = self.record["counters"]
+            counters[name] = counters.get(name, 0) + value
+
+    def end(self):
+        record, self.record = self.record, None
+        if record is None:
+            return None
+        record["seconds"] = time.perf_counter() - self._start
+
+        operation = record["operation"]
+        totals = self.operations.setdefault(operation, [0, 0.0])
+        totals[0] += 1
+        totals[1] += record["seconds"]
+        for stage, seconds in record["stages"].items():
+            self.stages[(operation, stage)] = self.stages.get((operation, stage), 0.0) + seconds
+        for name, value in record["counters"].items():
+            self.counters[(operation, name)] = self.counters.get((operation, name), 0) + value
+
+        if self.path:
+            self.export(record)
+        return record
+
+    def export(self, record):
+        if self.path.endswith('.prom'):
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.prometheus())
+            os.replace(tmp_path, self.path)
+            return
+
+        if self._out is None:
+            self._out = open(self.path, 'a', encoding='utf-8')
+        self._out.write(json.dumps({"time": time.time(), **record}) + "\n")
+        self._out.flush()
+
+    def prometheus(self):
+        # Running totals in Prometheus text exposition format
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            name = f"{PROMETHEUS_PREFIX}_{name}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{_label(label)}"' for key, label in labels)
+                lines.append(f"{name}{{{label_text}}} {value}")
+
+        metric('operations_total', 'counter', 'Operations measured.', [
+            ((('operation', operation),), count) for operation, (count, _) in sorted(self.operations.items())
+        ])
+        metric('operation_seconds_total', 'counter', 'Wall time of measured operations.', [
+            ((('operation', operation),), seconds) for operation, (_, seconds) in sorted(self.operations.items())
+        ])
+        metric('stage_seconds_total', 'counter', 'Wall time per stage of an operation.', [
+            ((('operation', operation), ('stage', stage)), seconds)
+            for (operation, stage), seconds in sorted(self.stages.items())
+        ])
+        metric('events_total', 'counter', 'Counters recorded by operations.', [
+            ((('operation', operation), ('counter', name)), value)
+            for (operation, name), value in sorted(self.counters.items())
+        ])
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        if self._out is not None:
+            self._out.close()
+            self._out = None
@@ -0,0 +1,84 @@
+import os
+import json
+import hashlib
+
+
+def file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseManifest:
+    # Remembers, per file name, the content hash and parser version a result was
+    # produced with. Records are appended (and flushed) one JSON line at a time,
+    # so an interrupted run loses at most the file it was working on; compact()
+    # rewrites the file with only the latest record per file.
+
+    def __init__(self, path, parser_version):
+        self.path = path
+        self.parser_version = parser_version
+        self.records = {}
+        self._out = None
+        self.load()
+
+    def load(self):
+        self.records = {}
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from an interrupted run
+                    continue
+                if isinstance(record, dict) and 'file_name' in record:
+                    self.records[record['file_name']] = record
+
+    def lookup(self, file_name, digest):
+        # The stored result if the file is unchanged since it was parsed by this
+        # parser version. Errors are never reused, so they get retried.
+        record = self.records.get(file_name)
+        if (
+            record
+            and record.get('sha256') == digest
+            and record.get('parser_version') == self.parser_version
+            and 'error' not in record.get('result', {})
+        ):
+            return record['result']
+        return None
+
+    def record(self, file_name, digest, result):
+        record = {
+            'file_name': file_name,
+            'sha256': digest,
+            'parser_version': self.parser_version,
+            'result': result
+        }
+        self.records[file_name] = record
+
+        if self._out is None:
+            self._out = open(self.path, 'a', encoding='utf-8')
+        self._out.write(json.dumps(record) + "\n")
+        self._out.flush()
+
+    def compact(self, keep=None):
+        # Rewrite the manifest with one record per file, dropping files not in keep
+        self.close()
+        if keep is not None:
+            self.records = {name: record for name, record in self.records.items() if name in keep}
+
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for file_name in sorted(self.records):
+                f.write(json.dumps(self.records[file_name]) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def close(self):
+        if self._out is not None:
+            self._out.close()
+            self._out = None
@@ -0,0 +1,95 @@
+import os
+import json
+import hashlib
+
+import PyPDF2
+
+# Part of every cache key: entries made by another extractor are never reused
+EXTRACTOR_VERSION = f"pypdf2-{PyPDF2.__version__}-1"
+
+
+class PdfTextCache:
+    # On-disk cache of extracted PDF page texts, keyed by the SHA-256 of the file
+    # contents plus EXTRACTOR_VERSION. Entries are small JSON files fanned out
+    # over 256 subdirectories; once the cache grows past max_bytes, the least
+    # recently used entries (by mtime, refreshed on every hit) are evicted down
+    # to 90% of it.
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._size = None
+
+    @classmethod
+    def from_env(cls):
+        # RESUME_TEXT_CACHE_DIR enables the cache; RESUME_TEXT_CACHE_MAX_MB sizes it
+        directory = os.environ.get('RESUME_TEXT_CACHE_DIR')
+        if not directory:
+            return None
+        max_mb = int(os.environ.get('RESUME_TEXT_CACHE_MAX_MB', '256'))
+        return cls(directory, max_mb * 1024 * 1024)
+
+    def key(self, data):
+        digest = hashlib.sha256(data).hexdigest()
+        return hashlib.sha256(f"{EXTRACTOR_VERSION}:{digest}".encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                pages = json.load(f)['pages']
+            os.utime(path)
+            return pages
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key, pages):
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'pages': pages}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        if self._size is not None:
+            self._size += os.path.getsize(path)
+        if self._size is None or self._size > self.max_bytes:
+            self.evict()
+
+    def _entries(self):
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        # Rescans the directory, since other processes may share the cache
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+
+        if total > self.max_bytes:
+            target = self.max_bytes * 0.9
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= target:
+                    break
+
+        self._size = total
@@ -0,0 +1,78 @@
+import re
+
+_BOUNDARY = re.compile(r'\b')
+_END = None          # trie key marking the end of a phrase
+_NO_MATCH = '\x00'   # folded form of a character no phrase can contain
+
+
+class PhraseMatcher:
+    # Finds which phrases of a fixed vocabulary occur in a text in one pass.
+    #
+    # find(text) returns exactly the phrases for which
+    #     re.search(r'\b' + re.escape(phrase) + r'\b', text, re.IGNORECASE)
+    # would match, without compiling or running one regex per phrase: the
+    # phrases live in a character trie that is walked from every word
+    # boundary of the text, and a hit only counts if it also ends on one.
+
+    def __init__(self, phrases):
+        self.phrases = set()
+        self.root = {}
+        alphabet = set()
+
+        for phrase in phrases:
+            if not phrase or phrase in self.phrases:
+                continue
+            self.phrases.add(phrase)
+
+            node = self.root
+            for ch in phrase.lower():
+                alphabet.add(ch)
+                node = node.setdefault(ch, {})
+            node.setdefault(_END, []).append(phrase)
+
+        self._alphabet = sorted(alphabet)
+        self._ascii = all(ch.isascii() for ch in alphabet)
+        self._fold_cache = {}
+
+    def _fold_char(self, ch):
+        # Map a text character onto the vocabulary character it matches under
+        # re.IGNORECASE, so the trie walk agrees with the regex semantics even
+        # for oddities such as the Kelvin sign or the long s
+        folded = self._fold_cache.get(ch)
+        if folded is None:
+            folded = _NO_MATCH
+            for candidate in self._alphabet:
+                if re.fullmatch(re.escape(candidate), ch, re.IGNORECASE):
+                    folded = candidate
+                    break
+            self._fold_cache[ch] = folded
+        return folded
+
+    def _fold(self, text):
+        if self._ascii and text.isascii():
+            return text.lower()
+        return ''.join(self._fold_char(ch) for ch in text)
+
+    def find(self, text):
+        found = set()
+        if not text or not self.root:
+            return found
+
+        folded = self._fold(text)
+        boundaries = {m.start() for m in _BOUNDARY.finditer(text)}
+        length = len(folded)
+        root = self.root
+
+        for start in boundaries:
+            node = root.get(folded[start]) if start < length else None
+            pos = start + 1
+            while node is not None:
+                ends = node.get(_END)
+                if ends is not None and pos in boundaries:
+                    found.update(ends)
+                if pos >= length:
+                    break
+                node = node.get(folded[pos])
+                pos += 1
+
+        return found
@@ -1,16 +1,21 @@
 import sys
 import json
 import re
+import time
 
-def calculate_score(resume_data, company_data):
+# Weight factors for different criteria
+WEIGHTS = {
+    'skills': 0.35,
+    'education': 0.25,
+    'projects': 0.25,
+    'experience': 0.15
+}
+
+def calculate_score(resume_data, company_data, metrics=None):
     # print(resume_data)
-    # Weight factors for different criteria
-    weights = {
-        'skills': 0.35,
-        'education': 0.25,
-        'projects': 0.25,
-        'experience': 0.15
-    }
+    weights = WEIGHTS
+    # With a metrics.Metrics, each component's time is added to its stage
+    start = time.perf_counter() if metrics is not None else None
     
     # Calculate individual component scores
     skills_score = score_skills(
@@ -18,6 +23,8 @@ def calculate_score(resume_data, company_data):
         company_data.get('Skill_Set', []),
         company_data.get('Core_Skills', [])
     )
+    if metrics is not None:
+        start = metrics.lap('skills', start)
     
     education_score = score_education(
         resume_data.get('CPI', 0), 
@@ -25,6 +32,8 @@ def calculate_score(resume_data, company_data):
         company_data.get('Branch', []),
         resume_data.get('Branch', '')
     )
+    if metrics is not None:
+        start = metrics.lap('education', start)
     
     projects_score = score_projects(
         resume_data.get('Projects', 0), 
@@ -32,8 +41,12 @@ def calculate_score(resume_data, company_data):
         company_data.get('Project_Keywords', []),
         resume_data.get('Project_Keywords', [])
     )
+    if metrics is not None:
+        start = metrics.lap('projects', start)
     
     experience_score = score_experience(resume_data.get('Experience', 0))
+    if metrics is not None:
+        metrics.lap('experience', start)
     
     # Calculate weighted total score
     total_score = (
@@ -124,9 +137,212 @@ def score_experience(experience_count):
     else:
         return 0
 
+def calculate_scores(resumes, companies, metrics=None):
+    # Score every resume against every company in one pass. A company that
+    # fails to score leaves None in its cell instead of aborting the batch.
+    # The work is done by score_matrix.CompanyProfiles, which gives the same
+    # numbers as calculate_score with NumPy matrix operations.
+    from score_matrix import CompanyProfiles
+
+    matrix, errors = CompanyProfiles(companies, metrics).score(resumes)
+    scores = matrix.tolist()
+    for error in errors:
+        scores[error["resume"]][error["company"]] = None
+    return scores, errors
+
+def calculate_scores_pairwise(resumes, companies, metrics=None):
+    # Reference implementation of calculate_scores: calculate_score per pair
+    scores = []
+    errors = []
+    for i, resume_data in enumerate(resumes):
+        row = []
+        for j, company_data in enumerate(companies):
+            try:
+                row.append(calculate_score(resume_data, company_data, metrics))
+            except Exception as e:
+                row.append(None)
+                errors.append({"resume": i, "company": j, "error": str(e)})
+        scores.append(row)
+    return scores, errors
+
+def load_batch(source):
+    # Batch payloads are read from a file path or from stdin when source is "-"
+    if source == "-":
+        payload = json.load(sys.stdin)
+    else:
+        with open(source, encoding="utf-8") as f:
+            payload = json.load(f)
+
+    if "resumes" in payload:
+        resumes = payload["resumes"]
+    elif "resume" in payload:
+        resumes = [payload["resume"]]
+    else:
+        raise ValueError("Batch payload needs a 'resume' or 'resumes' field")
+
+    companies = payload.get("companies")
+    if not isinstance(companies, list) or not isinstance(resumes, list):
+        raise ValueError("Batch payload needs 'companies' (and 'resumes') as lists")
+
+    return resumes, companies
+
+def run_batch(source):
+    resumes, companies = load_batch(source)
+    scores, errors = calculate_scores(resumes, companies)
+    return {"scores": scores, "errors": errors}
+
+def rank_resume(index, request, metrics=None):
+    # Scores one resume against the given companies, records each score in
+    # the rank index under the resume's id (replacing its previous one) and
+    # returns its rank among everyone scored for that company
+    resume_id = request["resume_id"]
+    companies = request["companies"]
+    scores, errors = calculate_scores([request["resume"]], companies, metrics)
+    start = time.perf_counter() if metrics is not None else None
+
+    rankings = []
+    for company, score in zip(companies, scores[0]):
+        if score is None:
+            index.remove(company["id"], resume_id)
+            rankings.append(None)
+            continue
+        rank, total = index.set_score(company["id"], resume_id, score)
+        rankings.append({"score": score, "rank": rank, "totalResumes": total})
+    if metrics is not None:
+        metrics.lap('rank_index', start)
+    return {"rankings": rankings, "errors": errors}
+
+def top_resumes(index, request):
+    company = request["company"]
+    return {
+        "rankings": [
+            {"resume": resume, "score": score, "rank": rank}
+            for resume, score, rank in index.top(company, int(request.get("k", 10)))
+        ],
+        "totalResumes": index.total(company)
+    }
+
+def score_request(request, metrics=None):
+    # Scores of every resume against every company, without the rank index
+    scores, errors = calculate_scores(request["resumes"], request["companies"], metrics)
+    return {"scores": scores, "errors": errors}
+
+def handle_index_request(index, request, metrics=None):
+    op = request.get("op")
+    if op == "score":
+        return score_request(request, metrics)
+    if op == "rank":
+        return rank_resume(index, request, metrics)
+    if op == "top":
+        return top_resumes(index, request)
+    if op == "remove_resume":
+        index.remove_resume(request["resume"])
+        return {"ok": True}
+    if op == "drop_company":
+        index.drop_company(request["company"])
+        return {"ok": True}
+    if op == "begin_rebuild":
+        index.begin_rebuild()
+        return {"ok": True}
+    if op == "rebuild":
+        # Rankings from rerank.py: {"rankings": {company: {"resumes": [...],
+        # "scores": [...]}}, "all": true to replace every company's}
+        rankings = {
+            company: (ranking["resumes"], ranking["scores"])
+            for company, ranking in request["rankings"].items()
+        }
+        return {"ok": True, "companies": index.rebuild(rankings, bool(request.get("all")))}
+    raise ValueError(f"Unknown op: {op}")
+
+def run_worker(index_path, metrics=None):
+    # Long-lived mode holding the rank index in memory: one request frame
+    # ({"id": ..., "op": ...}) in on stdin, one reply frame ({"id": ...,
+    # "result": ...}) out on stdout, as length-prefixed JSON (see framing.py).
+    # Run a single worker per index file, since every update is appended to
+    # it: other processes send their changes here ('rebuild') instead of
+    # writing the file. With a metrics.Metrics, every request is measured as an operation
+    # named after its op.
+    from framing import FrameError, read_frame, write_frame
+    from rank_index import RankIndex
+    import score_matrix  # load NumPy before the first request
+
+    requests, replies = sys.stdin.buffer, sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    index = RankIndex(index_path)
+    try:
+        while True:
+            request_id = None
+            if metrics is not None:
+                metrics.begin("request")
+            try:
+                request = read_frame(requests)
+                if request is None:
+                    break
+                request_id = request.get("id")
+                if metrics is not None:
+                    metrics.record["operation"] = str(request.get("op"))
+                result = handle_index_request(index, request, metrics)
+            except FrameError as e:
+                print(f"Worker input ended mid-request: {e}")
+                break
+            except Exception as e:
+                result = {"error": f"Invalid request: {str(e)}"}
+            if metrics is not None:
+                record = metrics.end()
+                if metrics.attach:
+                    result["metrics"] = record
+
+            write_frame(replies, {"id": request_id, "result": result})
+    finally:
+        index.close()
+        if metrics is not None:
+            metrics.close()
+
+def worker_metrics(options):
+    # Metrics for --worker from its trailing [--metrics FILE] [--attach-metrics]
+    path = None
+    if "--metrics" in options:
+        position = options.index("--metrics") + 1
+        if position >= len(options):
+            raise ValueError("--metrics needs a file")
+        path = options[position]
+    attach = "--attach-metrics" in options
+    if path is None and not attach:
+        return None
+
+    from metrics import Metrics
+    return Metrics(path, attach=attach)
+
 if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "--worker":
+        # Usage: python rank_generator.py --worker <rank_index_jsonl> [--metrics FILE] [--attach-metrics]
+        if len(sys.argv) < 3:
+            print(json.dumps({"error": "Missing rank index path. Usage: python rank_generator.py --worker <index_file>"}))
+            sys.exit(1)
+        try:
+            metrics = worker_metrics(sys.argv[3:])
+        except ValueError as e:
+            print(json.dumps({"error": str(e)}))
+            sys.exit(1)
+        run_worker(sys.argv[2], metrics)
+        sys.exit(0)
+
+    if len(sys.argv) >= 2 and sys.argv[1] == "--batch":
+        # Usage: python rank_generator.py --batch [payload_json_file | -]
+        try:
+            source = sys.argv[2] if len(sys.argv) > 2 else "-"
+            print(json.dumps(run_batch(source)))
+        except json.JSONDecodeError as e:
+            print(json.dumps({"error": f"Invalid JSON: {str(e)}"}))
+            sys.exit(1)
+        except Exception as e:
+            print(json.dumps({"error": str(e)}))
+            sys.exit(1)
+        sys.exit(0)
+
     if len(sys.argv) < 3:
-        print(json.dumps({"error": "Missing arguments. Usage: python rank_generator.py <resume_json> <company_json>"}))
+        print(json.dumps({"error": "Missing arguments. Usage: python rank_generator.py <resume_json> <company_json> | --batch [file | -] | --worker <index_file>"}))
         sys.exit(1)
     
     try:
@@ -0,0 +1,216 @@
+import os
+import json
+from bisect import bisect_left, insort
+
+
+class CompanyRanking:
+    # One company's scores as a sorted array of (-score, resume) keys, best
+    # first, plus each resume's current score. The rank of a score (1 + the
+    # number of strictly better scores, so ties share a rank) is one binary
+    # search; adding or moving a resume is a binary search and a memmove.
+
+    __slots__ = ('keys', 'scores')
+
+    def __init__(self):
+        self.keys = []
+        self.scores = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def rank_of(self, score):
+        return bisect_left(self.keys, (-score,)) + 1
+
+    def set(self, resume, score):
+        self.remove(resume)
+        insort(self.keys, (-score, resume))
+        self.scores[resume] = score
+
+    def remove(self, resume):
+        old = self.scores.pop(resume, None)
+        if old is not None:
+            del self.keys[bisect_left(self.keys, (-old, resume))]
+
+    def top(self, k):
+        # [(resume, score, rank)] for the k best scores
+        results = []
+        for i, (negative, resume) in enumerate(self.keys[:k]):
+            rank = results[-1][2] if results and results[-1][1] == -negative else i + 1
+            results.append((resume, -negative, rank))
+        return results
+
+    def replace(self, resumes, scores):
+        self.scores = dict(zip(resumes, scores))
+        self.keys = sorted((-score, resume) for resume, score in self.scores.items())
+
+
+class RankIndex:
+    # Per-company rankings of resume scores, kept in memory and persisted as
+    # a JSON lines log: {"company", "resume", "score"} records set (or, with
+    # a null score, remove) one resume's score, and {"company", "resumes",
+    # "scores"} records replace a company's whole ranking. Like
+    # ParseManifest, records are appended and flushed one at a time; once the
+    # log holds more than twice as many entries as are live (every record
+    # counts: a set or remove as one, a replacement as its resumes or one),
+    # compact() rewrites it as one replacement record per company.
+    #
+    # A rebuild installs rankings scored elsewhere from a snapshot of the
+    # resumes and companies. Between begin_rebuild() and rebuild(), resumes
+    # whose scores change and companies that are dropped are remembered, so
+    # the snapshot's older view of them does not overwrite the live one.
+
+    def __init__(self, path):
+        self.path = path
+        self.companies = {}
+        self._logged = 0
+        self._out = None
+        self._rebuild = None
+        self.load()
+
+    def load(self):
+        self.close()
+        self.companies = {}
+        self._logged = 0
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from an interrupted run
+                    continue
+                if isinstance(record, dict) and 'company' in record:
+                    self._apply(record)
+
+    def _apply(self, record):
+        company = record['company']
+        self._logged += max(1, len(record.get('resumes') or ()))
+        if 'resumes' in record:
+            if record['resumes']:
+                self.ranking(company).replace(record['resumes'], record['scores'])
+            else:
+                self.companies.pop(company, None)
+        elif record.get('score') is None:
+            if company in self.companies:
+                self.companies[company].remove(record['resume'])
+        else:
+            self.ranking(company).set(record['resume'], record['score'])
+
+    def _append(self, record):
+        self._apply(record)
+        if self._rebuild is not None:
+            if 'resume' in record:
+                self._rebuild['resumes'].add(record['resume'])
+            elif not record['resumes']:
+                self._rebuild['companies'].add(record['company'])
+        if self._out is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._out = open(self.path, 'a', encoding='utf-8')
+        self._out.write(json.dumps(record) + "\n")
+        self._out.flush()
+
+        if self._logged > max(1024, 2 * self.size()):
+            self.compact()
+
+    def ranking(self, company):
+        if company not in self.companies:
+            self.companies[company] = CompanyRanking()
+        return self.companies[company]
+
+    def size(self):
+        return sum(len(ranking) for ranking in self.companies.values())
+
+    def set_score(self, company, resume, score):
+        # Records the resume's score and returns (rank, totalResumes)
+        self._append({'company': company, 'resume': resume, 'score': score})
+        ranking = self.companies[company]
+        return ranking.rank_of(score), len(ranking)
+
+    def remove(self, company, resume):
+        self._append({'company': company, 'resume': resume, 'score': None})
+
+    def replace(self, company, resumes, scores):
+        self._append({'company': company, 'resumes': list(resumes), 'scores': list(scores)})
+
+    def replace_all(self, rankings):
+        # Replaces every ranking with {company: (resumes, scores)} and
+        # rewrites the log
+        self.companies = {}
+        for company, (resumes, scores) in rankings.items():
+            if len(resumes):
+                self.ranking(company).replace(resumes, scores)
+        self.compact()
+
+    def remove_resume(self, resume):
+        # Removes the resume from every company's ranking (and from a
+        # rebuild in progress, even if it is in none yet)
+        for company in [company for company, ranking in self.companies.items() if resume in ranking.scores]:
+            self.remove(company, resume)
+        if self._rebuild is not None:
+            self._rebuild['resumes'].add(resume)
+
+    def drop_company(self, company):
+        self.replace(company, [], [])
+
+    def begin_rebuild(self):
+        self._rebuild = {'resumes': set(), 'companies': set()}
+
+    def rebuild(self, rankings, replace_all=False):
+        # Installs {company: (resumes, scores)} from a rebuild started with
+        # begin_rebuild(): the given companies' rankings are replaced, or with
+        # replace_all every ranking is and the log is rewritten. Resumes
+        # updated since begin_rebuild() keep their live scores, and companies
+        # dropped since then stay dropped.
+        changed = self._rebuild or {'resumes': set(), 'companies': set()}
+        self._rebuild = None
+
+        merged = {}
+        for company, (resumes, scores) in rankings.items():
+            if company in changed['companies']:
+                continue
+            pairs = {resume: score for resume, score in zip(resumes, scores) if resume not in changed['resumes']}
+            live = self.companies.get(company)
+            if live is not None:
+                pairs.update((resume, live.scores[resume]) for resume in changed['resumes'] if resume in live.scores)
+            merged[company] = (list(pairs), list(pairs.values()))
+
+        if replace_all:
+            self.replace_all(merged)
+        else:
+            for company, (resumes, scores) in merged.items():
+                self.replace(company, resumes, scores)
+        return len(merged)
+
+    def rank(self, company, score):
+        # (rank, totalResumes) a score would have now, without recording it
+        ranking = self.companies.get(company)
+        if ranking is None:
+            return 1, 0
+        return ranking.rank_of(score), len(ranking)
+
+    def top(self, company, k):
+        ranking = self.companies.get(company)
+        return ranking.top(k) if ranking is not None else []
+
+    def total(self, company):
+        ranking = self.companies.get(company)
+        return len(ranking) if ranking is not None else 0
+
+    def compact(self):
+        self.close()
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for company in sorted(self.companies):
+                scores = self.companies[company].scores
+                f.write(json.dumps({
+                    'company': company, 'resumes': list(scores), 'scores': list(scores.values())
+                }) + "\n")
+        os.replace(tmp_path, self.path)
+        self._logged = self.size()
+
+    def close(self):
+        if self._out is not None:
+            self._out.close()
+            self._out = None
@@ -0,0 +1,281 @@
+import re
+import time
+
+
+class DeadlineExceeded(RuntimeError):
+    pass
+
+
+class LineStart:
+    # Marks a pattern that only matches from the start of the text or of a
+    # line, written without its r'(?:^|\n).*?' prefix (see LineStartPattern)
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+
+
+class KeywordScan:
+    # Marks a pattern keyword + rest that, having failed at one occurrence of
+    # keyword, is known to fail at every occurrence starting inside what
+    # keyword + skip matches there. For keyword + r'[^\n]*...' that is the rest
+    # of the line (see KeywordScanPattern).
+
+    def __init__(self, keyword, rest, skip):
+        self.keyword = keyword
+        self.rest = rest
+        self.skip = skip
+
+
+class PatternStats:
+    # A compiled pattern's name, calls, hits and time spent matching, and the
+    # registry's deadline check; the matching methods are the subclasses'
+
+    __slots__ = ('name', 'regex', 'calls', 'hits', 'seconds', 'registry')
+
+    def __init__(self, name, regex, registry):
+        self.name = name
+        self.regex = regex
+        self.registry = registry
+        self.calls = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+    @property
+    def pattern(self):
+        return self.regex.pattern
+
+    def _check_deadline(self):
+        deadline = self.registry.deadline
+        if deadline is not None and time.perf_counter() > deadline:
+            raise DeadlineExceeded(f"Time budget exceeded before {self.name}")
+
+    def _record(self, start, hits):
+        self.calls += 1
+        self.hits += hits
+        self.seconds += time.perf_counter() - start
+
+
+class TrackedPattern(PatternStats):
+    # A compiled pattern that counts its calls and hits and the time spent
+    # matching. A hit is a successful search/match, or each match found by
+    # findall/finditer.
+
+    __slots__ = ()
+
+    def search(self, text):
+        self._check_deadline()
+        if not self.registry.track:
+            return self.regex.search(text)
+        start = time.perf_counter()
+        match = self.regex.search(text)
+        self._record(start, 1 if match else 0)
+        return match
+
+    def findall(self, text):
+        self._check_deadline()
+        if not self.registry.track:
+            return self.regex.findall(text)
+        start = time.perf_counter()
+        matches = self.regex.findall(text)
+        self._record(start, len(matches))
+        return matches
+
+    def finditer(self, text):
+        # Returns a list so the matching time is measured here, not by the caller
+        self._check_deadline()
+        if not self.registry.track:
+            return list(self.regex.finditer(text))
+        start = time.perf_counter()
+        matches = list(self.regex.finditer(text))
+        self._record(start, len(matches))
+        return matches
+
+    def sub(self, repl, text):
+        self._check_deadline()
+        if not self.registry.track:
+            return self.regex.sub(repl, text)
+        start = time.perf_counter()
+        result, count = self.regex.subn(repl, text)
+        self._record(start, count)
+        return result
+
+    def split(self, text):
+        self._check_deadline()
+        if not self.registry.track:
+            return self.regex.split(text)
+        start = time.perf_counter()
+        parts = self.regex.split(text)
+        self._record(start, len(parts) - 1)
+        return parts
+
+
+class ScanningPattern(PatternStats):
+    # Base for patterns that choose their own match attempts in _scan(text,
+    # limit) instead of letting the re module try every position. There is no
+    # sub or split: the parser only searches with these.
+
+    __slots__ = ()
+
+    def _groups(self, match):
+        if self.regex.groups == 0:
+            return match.group(0)
+        if self.regex.groups == 1:
+            return match.group(1) or ''
+        return match.groups('')
+
+    def search(self, text):
+        matches = self.finditer(text, limit=1)
+        return matches[0] if matches else None
+
+    def findall(self, text):
+        return [self._groups(match) for match in self.finditer(text)]
+
+    def finditer(self, text, limit=None):
+        self._check_deadline()
+        start = time.perf_counter() if self.registry.track else None
+        matches = self._scan(text, limit)
+        if start is not None:
+            self._record(start, len(matches))
+        return matches
+
+
+class LineStartPattern(ScanningPattern):
+    # Matches like re.compile(r'(?:^|\n).*?' + pattern, re.DOTALL) would, as far
+    # as the groups are concerned. The re module runs that form in quadratic
+    # time on text with many lines, retrying a failed scan from every later
+    # line start. A later line start can only ever see a subset of what an
+    # earlier one sees, so scanning here stops at the first one that fails.
+
+    __slots__ = ()
+
+    @property
+    def pattern(self):
+        return r'(?:^|\n).*?' + self.regex.pattern
+
+    def _scan(self, text, limit=None):
+        matches = []
+        start = 0
+        while True:
+            match = self.regex.search(text, start)
+            if match is None:
+                break
+            matches.append(match)
+            if len(matches) == limit:
+                break
+
+            # The next attempt starts from the first newline after this match
+            newline = text.find('\n', match.end())
+            if newline == -1:
+                break
+            start = newline + 1
+        return matches
+
+
+class KeywordScanPattern(ScanningPattern):
+    # Matches exactly like re.compile(keyword + rest) for a KeywordScan. The re
+    # module retries such a pattern at every occurrence of the keyword, each
+    # time scanning as far as the rest allows, which is quadratic on a long
+    # line (or word) full of keywords. Here a failed attempt skips the
+    # occurrences it has already ruled out.
+
+    __slots__ = ('keyword_regex', 'skip_regex')
+
+    def __init__(self, name, regex, registry, keyword_regex, skip_regex):
+        super().__init__(name, regex, registry)
+        self.keyword_regex = keyword_regex
+        self.skip_regex = skip_regex
+
+    def _scan(self, text, limit=None):
+        matches = []
+        position = 0
+        while position <= len(text):
+            keyword = self.keyword_regex.search(text, position)
+            if keyword is None:
+                break
+
+            match = self.regex.match(text, keyword.start())
+            if match is None:
+                skipped = self.skip_regex.match(text, keyword.start())
+                position = max(skipped.end(), keyword.start() + 1)
+                continue
+
+            matches.append(match)
+            if len(matches) == limit:
+                break
+            position = match.end() if match.end() > match.start() else match.end() + 1
+        return matches
+
+
+class RegexRegistry:
+    # Every pattern the parser uses, compiled once at construction under a
+    # dotted name ('gpa.table', 'projects.bullet', ...). Lists of patterns are
+    # registered as groups and come back as lists of TrackedPatterns in the
+    # same order. stats() reports per-pattern calls, hits and cumulative time.
+    #
+    # While deadline (a time.perf_counter() value) is set, every pattern call
+    # after it raises DeadlineExceeded. The check happens between calls: a
+    # single match is never interrupted, which is why the patterns themselves
+    # must not backtrack catastrophically.
+
+    def __init__(self, track=True):
+        self.track = track
+        self.deadline = None
+        self.patterns = {}
+        self.groups = {}
+
+    def add(self, name, pattern, flags=0):
+        if name in self.patterns:
+            raise ValueError(f"Pattern already registered: {name}")
+        if isinstance(pattern, LineStart):
+            tracked = LineStartPattern(name, re.compile(pattern.pattern, flags | re.DOTALL), self)
+        elif isinstance(pattern, KeywordScan):
+            tracked = KeywordScanPattern(
+                name, re.compile(pattern.keyword + pattern.rest, flags), self,
+                re.compile(pattern.keyword, flags), re.compile(pattern.keyword + pattern.skip, flags)
+            )
+        else:
+            tracked = TrackedPattern(name, re.compile(pattern, flags), self)
+        self.patterns[name] = tracked
+        return tracked
+
+    def add_group(self, name, patterns, flags=0):
+        if name in self.groups:
+            raise ValueError(f"Pattern group already registered: {name}")
+        self.groups[name] = [
+            self.add(f"{name}.{i}", pattern, flags) for i, pattern in enumerate(patterns)
+        ]
+        return self.groups[name]
+
+    def __getitem__(self, name):
+        if name in self.groups:
+            return self.groups[name]
+        return self.patterns[name]
+
+    def reset(self):
+        for tracked in self.patterns.values():
+            tracked.calls = 0
+            tracked.hits = 0
+            tracked.seconds = 0.0
+
+    def stats(self):
+        return {
+            name: {
+                'pattern': tracked.pattern,
+                'calls': tracked.calls,
+                'hits': tracked.hits,
+                'seconds': tracked.seconds
+            }
+            for name, tracked in self.patterns.items()
+        }
+
+    def totals(self):
+        # (calls, hits) over every pattern
+        calls = hits = 0
+        for tracked in self.patterns.values():
+            calls += tracked.calls
+            hits += tracked.hits
+        return calls, hits
+
+    def slowest(self, limit=10):
+        ranked = sorted(self.patterns.values(), key=lambda tracked: tracked.seconds, reverse=True)
+        return [(tracked.name, tracked.seconds, tracked.calls, tracked.hits) for tracked in ranked[:limit]]
@@ -0,0 +1,152 @@
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+from score_matrix import CHUNK_ROWS, CompanyProfiles
+
+# Full re-rank: scores every resume against every company and writes each
+# company's complete ranking.
+#
+# Input is JSON lines (a file, or stdin with "-"). The first line is
+#     {"companies": [{"id": ..., <rank_generator company fields>}, ...]}
+# and every further line is one resume: {"id": ..., <rank_generator resume
+# fields>}. Resumes are scored CHUNK_ROWS at a time as they are read, so only
+# their ids and scores are kept in memory.
+#
+# Output is JSON lines on stdout, ready for bulk database updates:
+#     {"company": id, "totalResumes": n, "offset": k,
+#      "rankings": [{"resume": id, "score": s, "rank": r}, ...]}
+# with at most --chunk-size rankings per line, best score first, then one
+#     {"resume": id, "company": id, "error": ...}
+# per pair that failed to score (left out of that company's ranking), and a
+# final {"done": true, ...} summary.
+#
+# The rank index is not touched here: its only writer is the rank_generator.py
+# worker, which gets these rankings from the caller ('rebuild' op).
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def competition_ranks(sorted_scores):
+    # Ranks for scores sorted best first, ties sharing the best rank and the
+    # next score skipping past them: [9, 9, 7] -> [1, 1, 3]
+    count = len(sorted_scores)
+    if count == 0:
+        return np.zeros(0, dtype=np.int64)
+    starts = np.ones(count, dtype=bool)
+    starts[1:] = sorted_scores[1:] != sorted_scores[:-1]
+    return np.maximum.accumulate(np.where(starts, np.arange(count), 0)) + 1
+
+
+def read_input(source):
+    # (companies, iterator over resume dicts) from a JSON lines file or stdin
+    f = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    header = f.readline()
+    if not header.strip():
+        raise ValueError("Re-rank input is empty")
+    companies = json.loads(header).get("companies")
+    if not isinstance(companies, list):
+        raise ValueError("First input line needs 'companies' as a list")
+
+    def resumes():
+        try:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+    return companies, resumes()
+
+
+def score_stream(profiles, resumes):
+    # (resume ids, scores, errors) with scores as one resumes x companies array
+    ids, blocks, errors = [], [], []
+    chunk = []
+
+    def flush():
+        scores, chunk_errors = profiles.score(chunk)
+        for error in chunk_errors:
+            errors.append({**error, "resume": error["resume"] + len(ids)})
+        ids.extend(resume.get("id") if isinstance(resume, dict) else None for resume in chunk)
+        blocks.append(scores)
+        chunk.clear()
+
+    for resume in resumes:
+        chunk.append(resume)
+        if len(chunk) == CHUNK_ROWS:
+            flush()
+    if chunk:
+        flush()
+
+    scores = np.vstack(blocks) if blocks else np.zeros((0, len(profiles.companies)))
+    return ids, scores, errors
+
+
+def rank_company(scores):
+    # (resume indices best first, their ranks) for one company's column.
+    # Unscored (NaN) resumes are left out; ties keep input order.
+    scored = np.flatnonzero(~np.isnan(scores))
+    order = scored[np.argsort(-scores[scored], kind="stable")]
+    return order, competition_ranks(scores[order])
+
+
+def write_rankings(out, company_ids, resume_ids, scores, chunk_size):
+    for j, company_id in enumerate(company_ids):
+        order, ranks = rank_company(scores[:, j])
+        total = len(order)
+        for offset in range(0, total, chunk_size):
+            rankings = [
+                {"resume": resume_ids[i], "score": float(scores[i, j]), "rank": int(rank)}
+                for i, rank in zip(order[offset:offset + chunk_size], ranks[offset:offset + chunk_size])
+            ]
+            out.write(json.dumps({
+                "company": company_id, "totalResumes": total, "offset": offset, "rankings": rankings
+            }) + "\n")
+
+
+def run_rerank(source, chunk_size=DEFAULT_CHUNK_SIZE, out=sys.stdout):
+    start = time.perf_counter()
+    companies, resumes = read_input(source)
+    company_ids = [company.get("id") if isinstance(company, dict) else None for company in companies]
+
+    profiles = CompanyProfiles(companies)
+    resume_ids, scores, errors = score_stream(profiles, resumes)
+    write_rankings(out, company_ids, resume_ids, scores, chunk_size)
+
+    for error in errors:
+        out.write(json.dumps({
+            "resume": resume_ids[error["resume"]],
+            "company": company_ids[error["company"]],
+            "error": error["error"]
+        }) + "\n")
+
+    out.write(json.dumps({
+        "done": True,
+        "resumes": len(resume_ids),
+        "companies": len(company_ids),
+        "errors": len(errors),
+        "seconds": round(time.perf_counter() - start, 3)
+    }) + "\n")
+    out.flush()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='Re-rank every resume for every company')
+    arg_parser.add_argument('input', nargs='?', default='-', help='JSON lines input file, or - for stdin')
+    arg_parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                            help='rankings per output line')
+    args = arg_parser.parse_args()
+
+    try:
+        run_rerank(args.input, max(1, args.chunk_size))
+    except json.JSONDecodeError as e:
+        print(json.dumps({"error": f"Invalid JSON: {str(e)}"}))
+        sys.exit(1)
+    except Exception as e:
+        print(json.dumps({"error": str(e)}))
+        sys.exit(1)
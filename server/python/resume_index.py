@@ -0,0 +1,447 @@
+import os
+import sys
+import json
+import math
+import time
+import argparse
+from bisect import bisect_left, insort
+
+import numpy as np
+
+from vocabulary import BRANCH_MAPPING, VOCABULARIES, headers
+
+# Inverted index over parse_resume results, for requirement filters like
+# "python AND docker, CPI >= 7.5, branch CSE or IT" without a scan.
+#
+# Every indexed resume gets a document number. Term fields (skills, project
+# keywords, core computer skills, branch) map each lowercased term to the
+# sorted document numbers holding it; numeric fields (CPI, project count,
+# experience) are columns by document number, with a sorted copy built on
+# demand for range queries. Boolean queries are merges of sorted integer
+# arrays, so their cost follows the posting lengths, not the index size.
+#
+# Like RankIndex, the index lives in memory and is persisted as a JSON lines
+# log: {"resume": id, "fields": {...}} sets a resume's indexed fields and
+# {"resume": id, "fields": null} removes it. Records are appended and
+# flushed one at a time; once stale records outnumber live ones, compact()
+# rewrites the log with one record per resume.
+#
+# Term fields are logged as vocabulary ids (see vocabulary.py): a hex bitset
+# per list, or [bitset, term, ...] with the terms outside the vocabulary,
+# and the branch id (a string when it has none). A {"vocabulary": {...}}
+# record with the vocabularies' headers comes first; records before any such
+# record (older logs) hold plain term lists.
+
+# Index field -> parse_resume column
+TERM_FIELDS = {
+    'skills': 'Skills',
+    'keywords': 'Project_Keywords',
+    'core': 'Core_Computer_Skills',
+    'branch': 'Branch'
+}
+RANGE_FIELDS = {
+    'cpi': 'CPI/GPA',
+    'projects': 'No_of_Projects',
+    'experience': 'Experience'
+}
+
+_branch_aliases = None
+
+
+def _terms(value):
+    # Lowercased, de-duplicated terms from a list or a comma-joined string
+    if isinstance(value, str):
+        value = value.split(',')
+    if not isinstance(value, (list, tuple)):
+        return []
+    return sorted({term.strip().lower() for term in value if isinstance(term, str) and term.strip()})
+
+
+def _number(value):
+    if value in ('Yes', 'No'):
+        return 1.0 if value == 'Yes' else 0.0
+    if isinstance(value, str):
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+    if isinstance(value, (int, float)) and math.isfinite(value):
+        return float(value)
+    return None
+
+
+def index_fields(result):
+    # The indexed fields of one parse_resume result, or None for a failed parse
+    if not isinstance(result, dict) or 'error' in result:
+        return None
+    branch = result.get('Branch')
+    fields = {
+        'skills': _terms(result.get('Skills')),
+        'keywords': _terms(result.get('Project_Keywords')),
+        'core': _terms(result.get('Core_Computer_Skills')),
+        'branch': canonical_branch(branch) if isinstance(branch, str) and branch.strip() else None
+    }
+    for field, column in RANGE_FIELDS.items():
+        fields[field] = _number(result.get(column))
+    return fields
+
+
+def canonical_branch(name):
+    # A branch name as indexed and queried: lowercased, with parser aliases
+    # such as "cse" or "it" resolved to the branch names extract_branch
+    # returns, so either spelling on either side matches
+    global _branch_aliases
+    if _branch_aliases is None:
+        _branch_aliases = {}
+        for branch, aliases in BRANCH_MAPPING.items():
+            for alias in aliases:
+                _branch_aliases.setdefault(alias, branch.lower())
+            _branch_aliases[branch.lower()] = branch.lower()
+    term = name.strip().lower()
+    return _branch_aliases.get(term, term)
+
+
+def branch_terms(names):
+    # Query branch names to indexed branches
+    return sorted({canonical_branch(name) for name in names})
+
+
+def pack_fields(fields):
+    # Indexed fields as logged: term fields as vocabulary ids
+    packed = dict(fields)
+    for field in ('skills', 'keywords', 'core'):
+        packed[field] = VOCABULARIES[field].pack(fields[field])
+    branch = fields['branch']
+    if branch is not None:
+        branch_id = VOCABULARIES['branch'].id(branch)
+        packed['branch'] = branch if branch_id is None else branch_id
+    return packed
+
+
+def unpack_fields(packed):
+    fields = dict(packed)
+    for field in ('skills', 'keywords', 'core'):
+        fields[field] = sorted(VOCABULARIES[field].unpack(packed[field]))
+    if isinstance(packed['branch'], int):
+        fields['branch'] = VOCABULARIES['branch'].terms[packed['branch']]
+    elif isinstance(packed['branch'], str):
+        # Logged before branches were canonicalized
+        fields['branch'] = canonical_branch(packed['branch'])
+    return fields
+
+
+class ResumeIndex:
+
+    def __init__(self, path):
+        self.path = path
+        self._out = None
+        self.load()
+
+    def _reset(self):
+        self.fields = {}            # resume id -> indexed fields
+        self.docs = {}              # resume id -> document number
+        self.ids = []               # document number -> resume id (None once removed)
+        self.postings = {field: {} for field in TERM_FIELDS}
+        self.columns = {field: np.full(1024, np.nan) for field in RANGE_FIELDS}
+        self._arrays = {}           # (field, term) -> postings as an array
+        self._sorted = {}           # field -> (values, documents) sorted by value
+        self._records = 0
+        self._headers = None        # vocabulary headers of the log's last records
+
+    def load(self):
+        self.close()
+        self._reset()
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from an interrupted run
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                if 'vocabulary' in record:
+                    self._check_headers(record['vocabulary'])
+                elif 'resume' in record:
+                    if self._headers is not None and record.get('fields') is not None:
+                        record['fields'] = unpack_fields(record['fields'])
+                    self._apply(record)
+
+    def _check_headers(self, logged):
+        for field, header in logged.items():
+            vocabulary = VOCABULARIES.get(field)
+            if vocabulary is None or not vocabulary.compatible(header):
+                raise ValueError(f"{self.path} was written with another {field} vocabulary; rebuild the index")
+        self._headers = logged
+
+    def __len__(self):
+        return len(self.docs)
+
+    def __contains__(self, resume):
+        return resume in self.docs
+
+    def _apply(self, record):
+        resume, fields = record['resume'], record.get('fields')
+        self._records += 1
+        doc = self.docs.get(resume)
+        if doc is not None:
+            self._unindex(doc, self.fields[resume])
+
+        if fields is None:
+            if doc is not None:
+                del self.docs[resume]
+                del self.fields[resume]
+                self.ids[doc] = None
+            return
+
+        if doc is None:
+            doc = len(self.ids)
+            self.ids.append(resume)
+            self.docs[resume] = doc
+            if doc == len(self.columns['cpi']):
+                self._grow()
+        self.fields[resume] = fields
+
+        for field in TERM_FIELDS:
+            for term in self._field_terms(fields, field):
+                posting = self.postings[field].setdefault(term, [])
+                if not posting or posting[-1] < doc:
+                    posting.append(doc)
+                else:
+                    insort(posting, doc)
+                self._arrays.pop((field, term), None)
+        for field in RANGE_FIELDS:
+            value = fields.get(field)
+            self.columns[field][doc] = np.nan if value is None else value
+            self._sorted.pop(field, None)
+
+    def _unindex(self, doc, fields):
+        for field in TERM_FIELDS:
+            for term in self._field_terms(fields, field):
+                posting = self.postings[field][term]
+                del posting[bisect_left(posting, doc)]
+                if not posting:
+                    del self.postings[field][term]
+                self._arrays.pop((field, term), None)
+        for field in RANGE_FIELDS:
+            self.columns[field][doc] = np.nan
+            self._sorted.pop(field, None)
+
+    def _field_terms(self, fields, field):
+        value = fields.get(field)
+        if value is None:
+            return []
+        return [value] if isinstance(value, str) else value
+
+    def _grow(self):
+        for field, column in self.columns.items():
+            grown = np.full(len(column) * 2, np.nan)
+            grown[:len(column)] = column
+            self.columns[field] = grown
+
+    def _append(self, record):
+        self._apply(record)
+        if self._out is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._out = open(self.path, 'a', encoding='utf-8')
+        current = headers()
+        if self._headers != current:
+            self._out.write(json.dumps({'vocabulary': current}) + "\n")
+            self._headers = current
+        if record['fields'] is not None:
+            record = {'resume': record['resume'], 'fields': pack_fields(record['fields'])}
+        self._out.write(json.dumps(record) + "\n")
+        self._out.flush()
+
+        if self._records - len(self.docs) > max(1024, len(self.docs)):
+            self.compact()
+
+    def add(self, resume, result):
+        # Indexes (or re-indexes) one parse_resume result; a failed parse
+        # removes the resume. Unchanged results are not logged again.
+        fields = index_fields(result)
+        if fields is None:
+            self.remove(resume)
+        elif self.fields.get(resume) != fields:
+            self._append({'resume': resume, 'fields': fields})
+
+    def remove(self, resume):
+        if resume in self.docs:
+            self._append({'resume': resume, 'fields': None})
+
+    def posting(self, field, term):
+        # Sorted document numbers holding term in field
+        key = (field, term)
+        array = self._arrays.get(key)
+        if array is None:
+            array = np.array(self.postings[field].get(term, ()), dtype=np.int64)
+            self._arrays[key] = array
+        return array
+
+    def sorted_column(self, field):
+        # (values, documents) of every document with a value, ascending
+        if field not in self._sorted:
+            column = self.columns[field][:len(self.ids)]
+            docs = np.flatnonzero(~np.isnan(column))
+            order = np.argsort(column[docs], kind='stable')
+            self._sorted[field] = (column[docs][order], docs[order])
+        return self._sorted[field]
+
+    def live_documents(self):
+        return np.array(sorted(self.docs.values()), dtype=np.int64)
+
+    def query(self, spec):
+        # Resume ids matching every clause of spec, in indexing order:
+        #     {"skills": {"all": [...], "any": [...], "none": [...]},
+        #      "keywords": ..., "core": ..., "branch": [...],
+        #      "cpi": {"min": 7.5, "max": 10}, "projects": {"min": 2},
+        #      "experience": true}
+        # A plain list is "all" for skills, keywords and core, and "any"
+        # for branch. Range bounds are inclusive.
+        return [self.ids[doc] for doc in self.query_documents(spec)]
+
+    def query_documents(self, spec):
+        if not isinstance(spec, dict):
+            raise ValueError("Query must be a JSON object")
+        unknown = set(spec) - set(TERM_FIELDS) - set(RANGE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown query fields: {', '.join(sorted(unknown))}")
+
+        candidates = None
+        excluded = []
+
+        def narrow(docs):
+            nonlocal candidates
+            candidates = docs if candidates is None else np.intersect1d(candidates, docs, assume_unique=True)
+
+        for field in TERM_FIELDS:
+            clause = spec.get(field)
+            if clause is None:
+                continue
+            if not isinstance(clause, dict):
+                clause = {('any' if field == 'branch' else 'all'): clause}
+
+            for operator, names in clause.items():
+                if operator not in ('all', 'any', 'none'):
+                    raise ValueError(f"Unknown operator for {field}: {operator}")
+                if isinstance(names, str):
+                    names = [names]
+                terms = branch_terms(names) if field == 'branch' else _terms(list(names))
+                arrays = [self.posting(field, term) for term in terms]
+                if operator == 'all':
+                    # Shortest postings first keeps every intersection small
+                    for array in sorted(arrays, key=len):
+                        narrow(array)
+                elif operator == 'any':
+                    narrow(np.unique(np.concatenate(arrays)) if arrays else np.zeros(0, dtype=np.int64))
+                elif arrays:
+                    excluded.append(np.unique(np.concatenate(arrays)))
+
+        for field in RANGE_FIELDS:
+            clause = spec.get(field)
+            if clause is None:
+                continue
+            if isinstance(clause, dict):
+                low, high = clause.get('min', -np.inf), clause.get('max', np.inf)
+            else:
+                low = high = float(clause)
+
+            if candidates is not None:
+                # Already narrowed by postings: check the column directly
+                values = self.columns[field][candidates]
+                candidates = candidates[(values >= low) & (values <= high)]
+            else:
+                values, docs = self.sorted_column(field)
+                start = np.searchsorted(values, low, side='left')
+                end = np.searchsorted(values, high, side='right')
+                candidates = np.sort(docs[start:end])
+
+        if candidates is None:
+            candidates = self.live_documents()
+        for docs in excluded:
+            candidates = np.setdiff1d(candidates, docs, assume_unique=True)
+        return candidates
+
+    def compact(self):
+        self.close()
+        tmp_path = self.path + '.tmp'
+        current = headers()
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'vocabulary': current}) + "\n")
+            for doc in sorted(self.docs.values()):
+                resume = self.ids[doc]
+                f.write(json.dumps({'resume': resume, 'fields': pack_fields(self.fields[resume])}) + "\n")
+        os.replace(tmp_path, self.path)
+        self._records = len(self.docs)
+        self._headers = current
+
+    def close(self):
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+
+
+def add_results(index, source, key):
+    # Indexes parse_resume results from a JSON lines file (resume_parser.py
+    # --jsonl output), keyed by their key column
+    count = 0
+    with open(source, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            if isinstance(result, dict) and result.get(key) is not None:
+                index.add(result[key], result)
+                count += 1
+    return count
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='Inverted index over parsed resumes')
+    arg_parser.add_argument('index', help='index file (JSON lines)')
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    add_command = commands.add_parser('add', help='index parse results from a JSON lines file')
+    add_command.add_argument('results')
+    add_command.add_argument('--key', default='file_name', help='result column used as the resume id')
+
+    remove_command = commands.add_parser('remove', help='remove resumes from the index')
+    remove_command.add_argument('resumes', nargs='+')
+
+    query_command = commands.add_parser('query', help='list resumes matching a JSON query')
+    query_command.add_argument('query')
+    query_command.add_argument('--limit', type=int, help='list at most this many resumes')
+
+    commands.add_parser('compact', help='rewrite the index file with one record per resume')
+    args = arg_parser.parse_args()
+
+    try:
+        index = ResumeIndex(args.index)
+        if args.command == 'add':
+            count = add_results(index, args.results, args.key)
+            print(json.dumps({"indexed": count, "size": len(index)}))
+        elif args.command == 'remove':
+            for resume in args.resumes:
+                index.remove(resume)
+            print(json.dumps({"size": len(index)}))
+        elif args.command == 'query':
+            start = time.perf_counter()
+            resumes = index.query(json.loads(args.query))
+            print(json.dumps({
+                "count": len(resumes),
+                "resumes": resumes if args.limit is None else resumes[:max(0, args.limit)],
+                "ms": round((time.perf_counter() - start) * 1000, 3)
+            }))
+        else:
+            index.compact()
+            print(json.dumps({"size": len(index)}))
+        index.close()
+    except json.JSONDecodeError as e:
+        print(json.dumps({"error": f"Invalid JSON: {str(e)}"}))
+        sys.exit(1)
+    except Exception as e:
+        print(json.dumps({"error": str(e)}))
+        sys.exit(1)
@@ -1,206 +1,204 @@
+import io
 import os
+import contextlib
 import re
 import json
 import sys
+import time
 from PyPDF2 import PdfReader
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-import pandas as pd
-import spacy
-from torch import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-
-# Ensure all required NLTK resources are downloaded
-try:
-    nltk.download('punkt')
-    nltk.download('stopwords')
-    nltk.download('wordnet')
-    nltk.download('omw-1.4')  
-except Exception as e:
-    print(f"Warning: Failed to download NLTK resources: {e}")
-
-
-try:
-    nlp = spacy.load("en_core_web_sm")
-except:
-    print("Downloading spaCy model...")
-    import subprocess
-    subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-    nlp = spacy.load("en_core_web_sm")
-
-class EnhancedResumeParser:
-    def __init__(self):
-        # Defining skill set list from provided data
-        self.skill_set_list = [
-            # Programming Languages
-            'java', 'python', 'c++', 'c#', 'javascript', 'html', 'css', 'php', 'sql', 'r', 'apex',
-            'swift', 'kotlin', 'rust', 'typescript', 'perl', 'scala', 'go', 'ruby', 'matlab',
-            # Tools and Frameworks
-            'aws', 'amazon web services', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins',
-            'git', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring boot',
-            'hibernate', 'asp.net', '.net', 'tensorflow', 'pytorch', 'keras', 'salesforce',
-            'tableau', 'power bi', 'excel', 'microsoft excel',
-            # Databases
-            'mysql', 'postgresql', 'mongodb', 'oracle', 'cassandra', 'redis', 'sqlite',
-            # Concepts
-            'artificial intelligence', 'ai', 'machine learning', 'ml', 'data science',
-            'deep learning', 'natural language processing', 'nlp', 'computer vision',
-            'cloud computing', 'devops', 'development operations', 'automation', 'cybersecurity',
-            'networking', 'data analysis', 'data structures', 'algorithms', 'oop', 'object-oriented programming',
-            'database management', 'embedded systems', 'internet of things', 'iot', 'rest api',
-            'web development', 'full-stack', 'front-end', 'back-end', 'agile', 'scrum',
-            'user interface', 'ui', 'user experience', 'ux', 'testing', 'qa', 'quality assurance',
-            'security', 'risk analysis', 'risk management', 'data analytics', 'big data',
-            'business intelligence', 'seo', 'sem', 'digital marketing', 'consulting', 'audit',
-            'finance', 'banking', 'automotive', 'electrical engineering', 'mechanical engineering',
-            'civil engineering', 'chemical engineering', 'petroleum engineering',
-            # Domain-specific
-            'consulting', 'automobile engineering', 'banking', 'information technology',
-            'chemical engineering', 'civil', 'mechanical', 'cloud computing', 'cybersecurity',
-            'data analysis', 'structured query language', 'embedded systems', 'energy',
-            'finance', 'risk analysis', 'trading', 'gas pipeline engineering', 'salesforce lightning',
-            'salesforce visualforce', 'digital transformation', 'business analysis',
-            'strategic planning', 'process improvement', 'technical consulting', 'troubleshooting',
-            'system integration', 'design thinking', 'prototyping', 'engineering fundamentals',
-            'process engineering', 'research', 'technical analysis', 'communication', 'curriculum design',
-            'teaching', 'analytical skills', 'computer-aided design', 'teamwork', 'client management',
-            'coordination', 'electrical engineering', 'product development', 'market research',
-            'credit risk', 'financial modeling', 'advanced programming', 'digital solutions',
-            'electronics design', 'circuit analysis', 'debugging', 'business development', 'sales',
-            'engineering', 'metallurgy', 'technical problem solving', 'engineering skills',
-            'technical design', 'project management', 'technical proficiency', 'automotive technology',
-            'threat analysis', 'information technology infrastructure', 'system administration',
-            'system programming', 'operating system', 'graphics processing unit', 'gpu',
-            'search engine optimization', 'seo', 'search engine marketing', 'sem', 'revenue management',
-            'research and development', 'innovation', 'android development', 'software/hardware integration',
-            'object-oriented programming', 'process optimization', 'system design', 'information technology strategy',
-            'digital transformation', 'enterprise architecture', 'power systems', 'html', 'cascading style sheets', 'css',
-            'responsive design', 'industrial automation', 'rest application programming interfaces',
-            'representational state transfer', 'marketing', 'networking', 'node.js', 'django',
-            'oil and gas', 'power systems'
-        ]
-
-        # Organize skills into categories for better recognition
-        self.skill_categories = {
-            'programming_languages': ['java', 'python', 'c++', 'c#', 'javascript', 'typescript', 'php', 'ruby', 'perl',
-                                     'scala', 'swift', 'kotlin', 'r', 'matlab', 'go', 'rust', 'cobol', 'fortran', 'bash',
-                                     'powershell', 'assembly', 'lisp', 'prolog', 'dart', 'apex'],
-
-            'web_development': ['html', 'css', 'javascript', 'react', 'angular', 'vue', 'django', 'flask', 'node.js',
-                               'express', 'php', 'laravel', 'symfony', 'ruby on rails', 'bootstrap', 'jquery', 'asp.net',
-                               'spring mvc', 'wordpress', 'gatsby', 'sass', 'less', 'webpack', 'babel'],
-
-            'data_science': ['python', 'r', 'sql', 'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy',
-                            'matplotlib', 'seaborn', 'tableau', 'power bi', 'excel', 'spss', 'sas', 'hadoop', 'spark',
-                            'big data', 'data mining', 'data analytics', 'statistical analysis', 'machine learning', 'ai',
-                            'deep learning', 'nlp', 'computer vision'],
-
-            'databases': ['sql', 'mysql', 'postgresql', 'oracle', 'sql server', 'mongodb', 'cassandra', 'redis',
-                         'dynamodb', 'firebase', 'neo4j', 'sqlite', 'mariadb', 'couchdb', 'dbms', 'database management'],
-
-            'cloud_devops': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab',
-                            'terraform', 'ansible', 'puppet', 'chef', 'bitbucket', 'jira', 'confluence', 'ci/cd',
-                            'cloud computing', 'devops', 'microservices', 'serverless'],
-
-            'mobile_development': ['android', 'ios', 'swift', 'kotlin', 'flutter', 'react native', 'xamarin',
-                                  'mobile app development', 'objective-c', 'cordova', 'ionic'],
-
-            'system_concepts': ['algorithms', 'data structures', 'oop', 'design patterns', 'architecture', 'system design',
-                               'microservices', 'restful api', 'soap', 'graphql', 'mvc', 'mvvm', 'operating systems',
-                               'networking', 'distributed systems', 'concurrency', 'multithreading', 'memory management'],
-
-            'cybersecurity': ['security', 'encryption', 'cryptography', 'penetration testing', 'ethical hacking',
-                             'firewall', 'vpn', 'intrusion detection', 'malware analysis', 'siem', 'forensics',
-                             'cybersecurity', 'network security', 'authentication', 'authorization'],
-
-            'business_finance': ['finance', 'accounting', 'banking', 'trading', 'investment', 'risk management',
-                                'credit risk', 'financial modeling', 'fintech', 'blockchain', 'cryptocurrency',
-                                'consulting', 'audit', 'compliance', 'business analysis', 'strategic planning']
-        }
+from phrase_matcher import PhraseMatcher
+from parse_manifest import ParseManifest, file_digest
+from framing import FrameError, read_frame, write_frame
+from metrics import Metrics
+from slow_capture import SlowCapture
+from pdf_text_cache import PdfTextCache
+from vocabulary import SKILL_SET, SKILL_CATEGORIES, PROJECT_KEYWORDS, BRANCH_MAPPING, CORE_COMPUTER_SKILLS
+from resume_index import ResumeIndex
+from regex_registry import RegexRegistry, LineStart, KeywordScan, DeadlineExceeded
+
+# NLP resources are loaded lazily and from local installs only: importing this
+# module never touches the network, and regex-only extractors (email, phone,
+# GPA, ...) never pay for spaCy/NLTK start-up.
+SPACY_MODEL = "en_core_web_sm"
+
+# Bump whenever extraction output changes, so incremental runs re-parse
+PARSER_VERSION = "3"
+
+# count_projects keeps at most this many blank lines in a row
+MAX_BLANK_LINES = 32
+
+# Cheap per-page checks used to stop reading a long PDF once the sections
+# the extractors need have all been seen
+PAGE_SECTION_MARKERS = {
+    'contact': re.compile(r'[\w\.-]+@[\w\.-]+\.\w+|\b(?:phone|mobile|contact)\b', re.IGNORECASE),
+    'education': re.compile(r'\b(?:education|academic|qualifications?|cgpa|cpi|gpa)\b', re.IGNORECASE),
+    'skills': re.compile(r'\b(?:skills|technologies|competencies)\b', re.IGNORECASE),
+    'projects': re.compile(r'\bprojects?\b', re.IGNORECASE),
+    'experience': re.compile(r'\b(?:experience|internships?|employment)\b', re.IGNORECASE)
+}
+
+_nlp = None
+_stopwords = None
+
+
+class ResourceUnavailableError(RuntimeError):
+    pass
+
+
+def get_nlp():
+    global _nlp
+    if _nlp is None:
+        try:
+            import spacy
+        except ImportError as e:
+            raise ResourceUnavailableError("spaCy is not installed; run: pip install -r requirements.txt") from e
 
-        # Add project keywords from the provided data
-        self.project_keywords_list = [
-            'ai', 'ml', 'rpa', 'python', 'automation', 'audit', 'financial analysis', 'risk assessment',
-            'cad', 'solidworks', 'vehicle dynamics', 'dsa', 'java', 'aws', 'system design', 'data analysis',
-            'finance', 'sql', 'risk analysis', 'tech', 'data security', 'chemical simulation', 'matlab',
-            'oil & gas', 'structural design', 'autocad', 'construction', 'azure', '.net', 'javascript',
-            'kubernetes', 'devops', 'docker', 'cloud', 'web dev', 'react', 'business analysis', 'excel',
-            'power bi', 'networking', 'cybersecurity', 'firewalls', 'r', 'big data', 'oop', 'software development',
-            'competitive programming', 'dbms', 'oracle', 'embedded c', 'hardware', 'iot', 'fpga', 'microcontrollers',
-            'vlsi', 'renewable energy', 'scada', 'data visualization', 'tableau', 'fintech', 'quantitative analysis',
-            'risk modeling', 'risk assessment', 'investment banking', 'power systems', 'electrical engineering',
-            'salesforce', 'crm', 'apex programming', 'full stack', 'digital strategy', 'analytics', 'it consulting',
-            'business strategy', 'process optimization', 'it systems', 'technical support', 'erp', 'energytech',
-            'system design', 'research', 'visualization', 'debugging', 'git', 'software dev', 'prototyping',
-            'design thinking', 'ux research', 'process engineering', 'industrial safety', 'technical research',
-            'wireless networks', 'telecom', 'curriculum design', 'teaching', 'problem-solving', 'mechanical design',
-            'engineering design', 'product development', 'client communication', 'market analysis', 'control systems',
-            'market research', 'credit risk', 'agile development', 'full-stack', 'process safety', 'pcb design',
-            'debugging', 'sdlc', 'sales strategies', 'metallurgical analysis', 'material science', 'material testing',
-            'civil engineering', 'construction management', 'automotive engineering', 'automotive software',
-            'business intelligence', 'political analytics', 'business operations', 'network security', 'ethical hacking',
-            'siem', 'cloud computing', 'system administration', 'cuda', 'gpu computing', 'os', 'seo', 'sem',
-            'google ads', 'marketing analytics', 'revenue optimization', 'teaching skills', 'curriculum development',
-            'r&d', 'innovation', 'engineering design', 'android', 'kotlin', 'ui/ux', 'software-hardware integration',
-            'financial modeling', 'algorithm', 'c++', 'data analysis', 'electrical', 'power systems', 'energy engineering',
-            'project planning', 'customer service', 'territory management', 'html', 'css', 'responsive design',
-            'industrial automation', 'robotics', 'embedded systems', 'ai/ml', 'software engineering', 'rest apis',
-            'r&d', 'software development', 'data analysis', 'system design', 'web development', 'testing',
-            'marketing', 'product design', 'it solutions', 'sql', 'chemical engineering', 'petroleum engineering',
-            'energy', 'dsa', 'algorithms', 'system design', 'software development', 'software engineering',
-            'risk management', 'banking', 'finance', 'sap', 'consulting', 'it services', 'qa', 'digital design',
-            'javascript'
-        ]
+        try:
+            # Only POS tags and sentence boundaries are used
+            _nlp = spacy.load(SPACY_MODEL, disable=["ner", "lemmatizer"])
+        except OSError as e:
+            raise ResourceUnavailableError(
+                f"spaCy model '{SPACY_MODEL}' is not installed locally; run: python -m spacy download {SPACY_MODEL}"
+            ) from e
+    return _nlp
+
+
+def get_stopwords():
+    # English stopwords as a frozenset, loaded once per process
+    global _stopwords
+    if _stopwords is None:
+        try:
+            import nltk
+        except ImportError as e:
+            raise ResourceUnavailableError("NLTK is not installed; run: pip install -r requirements.txt") from e
 
-        # Branch mapping with standardized names and aliases
-        self.branch_mapping = {
-            'Computer Science': ['cse', 'computer science', 'computer science and engineering', 'cs', 'computer',
-                                'computer engineering', 'software engineering', 'computation', 'computing'],
-            'Information Technology': ['it', 'information technology', 'information systems', 'information science'],
-            'Electronics and Communication': ['ece', 'electronics and communication', 'electronics', 'communication engineering',
-                                             'electronics and communication engineering', 'electronic engineering'],
-            'Electrical Engineering': ['ee', 'electrical', 'electrical engineering', 'electrical and electronics',
-                                      'eee', 'electrical and electronics engineering', 'power systems'],
-            'Mechanical Engineering': ['mech', 'mechanical', 'mechanical engineering', 'mechanics'],
-            'Civil Engineering': ['civil', 'civil engineering', 'structural engineering'],
-            'Chemical Engineering': ['chem', 'chemical', 'chemical engineering', 'chemistry engineering'],
-            'Petroleum Engineering': ['petroleum', 'petro', 'petroleum engineering', 'oil and gas'],
-            'Aerospace Engineering': ['aerospace', 'aeronautical', 'aeronautical engineering', 'aerospace engineering'],
-            'Automobile Engineering': ['automobile', 'automotive engineering', 'automotive'],
-            'Mathematics and Computing': ['maths & computing', 'mathematics and computing', 'mathematical computing',
-                                         'math and cs', 'mathematics and computer science']
-        }
+        try:
+            nltk.data.find('corpora/stopwords')
+        except LookupError as e:
+            raise ResourceUnavailableError(
+                "NLTK 'stopwords' corpus is not installed locally; run: python -m nltk.downloader stopwords"
+            ) from e
+
+        from nltk.corpus import stopwords
+        _stopwords = frozenset(stopwords.words('english'))
+    return _stopwords
+
+class ResumeContext:
+    # Per-resume analysis shared by all extractors in parse_resume. Each view of
+    # the text (lowercased, preprocessed, located sections, the spaCy Doc) is
+    # computed at most once, on first use.
+    def __init__(self, parser, text):
+        self.parser = parser
+        self.text = text
+        self._lower = None
+        self._preprocessed = None
+        self._doc = None
+        self._sections = {}
+
+    @property
+    def lower(self):
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def preprocessed(self):
+        if self._preprocessed is None:
+            self._preprocessed = self.parser.preprocess_text(self.text)
+        return self._preprocessed
+
+    @property
+    def doc(self):
+        # One spaCy pass over the preprocessed text
+        if self._doc is None:
+            metrics = self.parser.metrics
+            if metrics is None:
+                self._doc = get_nlp()(self.preprocessed)
+            else:
+                start = time.perf_counter()
+                self._doc = get_nlp()(self.preprocessed)
+                metrics.lap('nlp', start)
+                metrics.count('tokens', len(self._doc))
+        return self._doc
+
+    def find_section_matches(self, group, source):
+        # Matches of a registered section pattern group over one view of the
+        # text ('lower' or 'preprocessed'), cached per group
+        key = (source, group)
+        if key not in self._sections:
+            target = getattr(self, source)
+            matches = []
+            for pattern in self.parser.patterns[group]:
+                matches.extend(pattern.finditer(target))
+            self._sections[key] = matches
+        return self._sections[key]
+
+    def find_sections(self, group, source):
+        return [match.group(1) or '' for match in self.find_section_matches(group, source)]
+
+    def section_docs(self, group, source='preprocessed'):
+        # Slices of the shared Doc covering each located section
+        if source != 'preprocessed':
+            raise ValueError("Doc slices are only available for the preprocessed text")
+
+        spans = []
+        for match in self.find_section_matches(group, source):
+            start, end = match.span(1)
+            if start < end:
+                span = self.doc.char_span(start, end, alignment_mode='expand')
+                if span is not None:
+                    spans.append(span)
+        return spans
 
-        # Core computer skills mapping
-        self.core_computer_skills = {
-            'OS': ['operating system', 'os', 'windows', 'linux', 'unix', 'macos', 'android', 'ios', 'embedded os',
-                  'real-time os', 'rtos', 'operating systems', 'system administration'],
-            'Networks': ['networking', 'network', 'tcp/ip', 'dns', 'dhcp', 'router', 'switch', 'firewall', 'vpn',
-                        'lan', 'wan', 'network security', 'network administration', 'cisco', 'network architecture'],
-            'DBMS': ['database management system', 'dbms', 'sql', 'mysql', 'postgresql', 'oracle', 'mongodb',
-                    'database design', 'er diagram', 'normalization', 'acid', 'transaction', 'sql server', 'nosql',
-                    'database administration', 'data modeling'],
-            'OOP': ['object oriented programming', 'oop', 'object-oriented', 'inheritance', 'polymorphism',
-                   'encapsulation', 'abstraction', 'class', 'object', 'java', 'c++', 'c#', 'design patterns'],
-            'Computer Architecture': ['computer architecture', 'processor design', 'memory hierarchy', 'cache',
-                                    'pipelining', 'instruction sets', 'cpu', 'alu', 'von neumann', 'harvard architecture',
-                                    'risc', 'cisc', 'assembly language', 'microprocessors']
-        }
 
-        # Improved CGPA/GPA patterns
+class EnhancedResumeParser:
+    def __init__(self, text_cache=None, max_pages=None, max_chars=None, time_budget=None,
+                 stop_when_found=None, extractor_timeout=None, metrics=None,
+                 slow_capture=None):
+        # Optional PdfTextCache; by default configured from RESUME_TEXT_CACHE_DIR
+        self.text_cache = text_cache if text_cache is not None else PdfTextCache.from_env()
+
+        # Bounds on PDF extraction (None = unlimited): pages read, characters
+        # kept, seconds spent, and a set of PAGE_SECTION_MARKERS names after
+        # which reading stops once all have been seen
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.time_budget = time_budget
+        self.stop_when_found = tuple(stop_when_found) if stop_when_found else None
+
+        # Seconds each extractor in parse_resume may spend (None = unlimited)
+        self.extractor_timeout = extractor_timeout
+
+        # Optional metrics.Metrics timing each parse_resume stage (None = off)
+        self.metrics = metrics
+
+        # Optional slow_capture.SlowCapture profiling parses over its
+        # threshold (None = off)
+        self.slow_capture = slow_capture
+
+        # Copies of the shared vocabulary lists (see vocabulary.py), lowercased below
+        self.skill_set_list = list(SKILL_SET)
+        self.skill_categories = {category: list(skills) for category, skills in SKILL_CATEGORIES.items()}
+        self.project_keywords_list = list(PROJECT_KEYWORDS)
+        self.branch_mapping = {branch: list(aliases) for branch, aliases in BRANCH_MAPPING.items()}
+        self.core_computer_skills = {skill: list(keywords) for skill, keywords in CORE_COMPUTER_SKILLS.items()}
+
+        # Improved CGPA/GPA patterns. These are only ever used with search(),
+        # so a number may not start inside a longer run of digits (the match
+        # from the start of the run comes first anyway), and a scan after a
+        # keyword stops at the next keyword (which leads to the same number).
+        # Both keep long digit runs and repeated keywords linear.
         self.gpa_patterns = [
             r'(?:cgpa|cpi|gpa)\s*[:/]?\s*(\d+\.\d+)[/\s]*\d+',
             r'(?:cgpa|cpi|gpa)(?:\s*|\:)(\d+\.\d+)',
-            r'(\d+\.\d+)\s*\/\s*10',
-            r'(\d+\.\d+)(?:\s*/\s*|\s+out\s+of\s+)(?:10|4)',
-            r'(\d+\.\d+)[/]?[10]?',
+            r'(?<!\d)(\d+\.\d+)\s*\/\s*10',
+            r'(?<!\d)(\d+\.\d+)(?:\s*/\s*|\s+out\s+of\s+)(?:10|4)',
+            r'(?<!\d)(\d+\.\d+)[/]?[10]?',
             r'cgpa\s*[-:/]?\s*(\d+\.\d+)',
-            r'(\d+\.\d+)\s*/\s*10',
-            r'(?<=cgpa).*?(\d+\.\d+)',
-            r'(?<=cpi).*?(\d+\.\d+)',
-            r'(?<=gpa).*?(\d+\.\d+)',
+            r'(?<!\d)(\d+\.\d+)\s*/\s*10',
+            r'(?<=cgpa)(?:(?!cgpa).)*?(\d+\.\d+)',
+            r'(?<=cpi)(?:(?!cpi).)*?(\d+\.\d+)',
+            r'(?<=gpa)(?:(?!gpa).)*?(\d+\.\d+)',
             r'\b(\d+\.\d+)\/10\b',
             r'upto\s+\d+\/10\s+sem\)?[\s:]*(\d+\.\d+)\/10',
             r'awarded\s+grade\s+(\d+)\/10'
@@ -208,12 +206,14 @@ class EnhancedResumeParser:
 
         # Specific patterns for tables in academic sections
         self.table_gpa_patterns = [
-            r'(?:cgpa|cpi|gpa)[^\d]*(\d+\.\d+)\/10',
-            r'(\d+\.\d+)\/10',
+            r'(?:cgpa|cpi|gpa)(?:(?!cgpa|cpi|gpa)[^\d])*(\d+\.\d+)\/10',
+            r'(?<!\d)(\d+\.\d+)\/10',
             r'grade\s+(\d+)\/10'
         ]
 
-        self.email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
+        # Starts at the beginning of a run of address characters, so a long run
+        # without an '@' is scanned once rather than once per character
+        self.email_pattern = r'(?<![\w\.-])[\w\.-]+@[\w\.-]+\.\w+'
 
         self.phone_patterns = [
             r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3,4}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
@@ -221,6 +221,19 @@ class EnhancedResumeParser:
             r'(?:\+\d{1,3}[-.\s]?)?\d{3,4}[-.\s]?\d{3}[-.\s]?\d{4}'
         ]
 
+        # Verbs that mark a project description in count_projects
+        self.project_action_verbs = [
+            'developed', 'implemented', 'designed', 'created',
+            'built', 'authored', 'engineered', 'conducted',
+            'architected', 'programmed', 'researched', 'analyzed'
+        ]
+
+        # Job titles that indicate work experience in has_experience
+        self.job_titles = [
+            'engineer', 'developer', 'programmer', 'analyst', 'consultant', 'manager', 'associate',
+            'intern', 'trainee', 'lead', 'architect', 'administrator', 'specialist', 'executive'
+        ]
+
         # Convert all lists to lowercase for case-insensitive matching
         self.skill_set_list = [skill.lower() for skill in self.skill_set_list]
         self.project_keywords_list = [keyword.lower() for keyword in self.project_keywords_list]
@@ -234,6 +247,168 @@ class EnhancedResumeParser:
         for skill, keywords in self.core_computer_skills.items():
             self.core_computer_skills[skill] = [keyword.lower() for keyword in keywords]
 
+        # Loaded on first use by the stop_words property
+        self._stop_words = None
+
+        # Precompiled single-pass matchers over the vocabularies above
+        self.skill_matcher = PhraseMatcher(self.skill_set_list)
+        self.category_skill_matcher = PhraseMatcher(
+            skill for category_skills in self.skill_categories.values() for skill in category_skills
+        )
+        self.project_keyword_matcher = PhraseMatcher(self.project_keywords_list)
+        self.core_skill_matcher = PhraseMatcher(
+            keyword for keywords in self.core_computer_skills.values() for keyword in keywords
+        )
+        self.branch_alias_matcher = PhraseMatcher(
+            alias for aliases in self.branch_mapping.values() for alias in aliases
+        )
+
+        # Every regex the extractors use, compiled once. Call/hit/time counters
+        # are off unless patterns.track is set (see --regex-stats).
+        self.patterns = RegexRegistry(track=False)
+        self._register_patterns()
+
+    def _register_patterns(self):
+        patterns = self.patterns
+        section = re.DOTALL | re.IGNORECASE
+
+        patterns.add('preprocess.punctuation', r'[^\w\s]')
+        patterns.add('preprocess.whitespace', r'\s+')
+
+        # extract_gpa
+        patterns.add_group('gpa.academic_section', [
+            r'academic(?:\s+profile|\s+qualifications?)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'education(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'(?:qualification|degree)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)'
+        ], section)
+        patterns.add_group('gpa.table', self.table_gpa_patterns, re.IGNORECASE)
+        patterns.add_group('gpa.pattern', self.gpa_patterns, re.IGNORECASE)
+        patterns.add('gpa.grade', r'grade\s+(\d+)\/10', re.IGNORECASE)
+
+        # extract_skills
+        patterns.add_group('skills.section', [
+            r'(?:technical\s+)?skills\s*:(.+?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'(?:technical\s+)?skills(?:\s+include)?(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'(?:technologies|programming\s+languages|languages|tools|frameworks|platforms)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)'
+        ], section)
+
+        # extract_branch
+        patterns.add_group('branch.education_section', [
+            r'education(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'academic(?:\s+qualification|\s+background)?(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'qualification(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)'
+        ], section)
+        patterns.add_group('branch.degree_context', [
+            KeywordScan(r'(?:bachelor|master|b\.tech|m\.tech|b\.e|m\.e|degree)', r'[^\n]*(?:in|of)[^\n]*([\w\s&]+)', r'[^\n]*'),
+            KeywordScan(r'(?:major|specialization|branch|discipline)', r'[^\n]*(?:in|of)[^\n]*([\w\s&]+)', r'[^\n]*')
+        ], re.IGNORECASE)
+
+        # count_projects. Section ends allow up to two words before the next
+        # heading, written so that a long word is not split every possible way.
+        patterns.add('projects.horizontal_whitespace', r'[^\S\n]+')
+        patterns.add('projects.blank_lines', r'(?:\n ?){%d,}' % (MAX_BLANK_LINES + 2))
+        patterns.add_group('projects.section', [
+            r'(?:^|\s)(?:projects?|academic\s+projects?|technical\s+projects?|selected\s+work)(?:\s*:|\n)(.*?)(?:\n\s*(?:[a-z0-9]+\s*|[a-z0-9]+\s+[a-z]+\s*)?(?:education|experience|skills|achievements|awards|publications|certifications|references|activities|additional|interests|languages)|$)',
+            r'(?:^|\s)(?:projects?\s+experience|project\s+work|portfolio|initiatives?)(?:\s*:|\n)(.*?)(?:\n\s*(?:[a-z0-9]+\s*|[a-z0-9]+\s+[a-z]+\s*)?(?:education|experience|skills|achievements|awards|publications|certifications|references|activities|additional|interests|languages)|$)'
+        ], re.IGNORECASE | re.DOTALL)
+        patterns.add_group('projects.header', [
+            r'\s(?:m\.?tech|b\.?tech|undergraduate|master\'?s|senior|final\s+year)\s+project',
+            r'\sdesign\s+lab',
+            r'\s(?:research|course|major|minor|team)\s+project',
+            r'\sproject\s+\d+',
+            r'\scapstone(?:\s+project)?'
+        ])
+        patterns.add_group('projects.title', [
+            r'(?:^|\s)title\s*:\s*([^\n]{10,})',
+            r'(?:^|\s)project\s*(?:title|name)\s*:\s*([^\n]{10,})',
+            r'(?:^|\n)[^\S\n]*(?:[•\*\-]\s*)?([a-z][^\n]{10,}?)(?=:\s*(?:20|19)\d{2}|,\s*(?:20|19)\d{2})'
+        ], re.IGNORECASE | re.MULTILINE)
+        patterns.add('projects.month', r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\b')
+        patterns.add('projects.bullet', r'\n\s*[•\*\-]\s+[^\n]+')
+        patterns.add('projects.fragment_break', r'[.!?\n]')
+        patterns.add_group('projects.verb_context', [
+            r'[^.!?\n]{5,100}\b' + verb + r'\b[^.!?\n]{5,100}' for verb in self.project_action_verbs
+        ])
+        patterns.add('projects.word', r'\b\w{4,}\b')
+        patterns.add_group('projects.guide', [
+            r'\s(?:guide|supervisor|advisor)\s*:\s*(?:prof\.?|dr\.?)?',
+            r'\s(?:mentor|professor|instructor)\s*:\s*'
+        ])
+        patterns.add_group('projects.date', [
+            r'\s(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s*\'?(?:\d{2}|\d{4})\s*-\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|present|current|now)',
+            r'\s(?:20|19)\d{2}\s*-\s*(?:(?:20|19)\d{2}|present|current|now)',
+            r'\s(?:duration|period)\s*:\s*(?:(?!\s(?:duration|period)[^\S\n]*:)[^\n])*?(?:months?|years?)'
+        ])
+        patterns.add('projects.block', r'(?:\n[^\S\n]*\n|[-_=]{3,})([^\n]{100,})(?=\n[^\S\n]*\n|[-_=]{3,})')
+        patterns.add('projects.block_subject', r'\b(?:project|application|system|platform|software|website|mobile|tool)\b')
+        patterns.add('projects.block_verb', r'\b(?:developed|implemented|created|designed|built)\b')
+        patterns.add('projects.block_year', r'\b(?:20|19)\d{2}\b')
+        patterns.add('projects.block_tech', r'\b(?:technology|framework|language|library|stack|database)\b')
+
+        # extract_project_keywords
+        patterns.add_group('project_keywords.section', [
+            r'projects?(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'(?:academic|major|minor|technical)\s+projects?(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'b\.tech\s+project(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'm\.tech\s+project(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+        ], section)
+
+        # extract_mobile_number
+        patterns.add_group('mobile.contact_section', [
+            r'(?:phone|mobile|contact|ph|tel|contact details)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            LineStart(r'(?:phone|mobile|contact|ph|tel)(?:\s*:|:?\s*\n|\s*-\s*)(.*?)(?:\n|$)')
+        ], section)
+        patterns.add_group('mobile.phone', self.phone_patterns)
+        patterns.add('mobile.non_digit', r'[^\d+]')
+
+        # extract_email
+        patterns.add_group('email.contact_section', [
+            r'(?:email|e-mail|mail|contact|contact details)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            LineStart(r'(?:email|e-mail|mail)(?:\s*:|:?\s*\n|\s*-\s*)(.*?)(?:\n|$)')
+        ], section)
+        patterns.add('email.address', self.email_pattern)
+
+        # has_experience
+        patterns.add_group('experience.section', [
+            r'(?:work\s+)?experience(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'(?:professional|industry|job)\s+experience(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'(?:employment|work\s+history)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'(?:internship|intern)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)'
+        ], section)
+        patterns.add_group('experience.job_title', [
+            r'\b' + re.escape(title) + r'\b' for title in self.job_titles
+        ], re.IGNORECASE)
+        # Phrases that put a job title in an educational context
+        patterns.add('experience.exclusion', r'student|pursuing|looking for|seeking', re.IGNORECASE)
+        patterns.add_group('experience.company', [
+            r'(?:worked at|at|with|for)\s+([A-Z][A-Za-z]*(?:\s+[A-Z][A-Za-z]*)?)',
+            r'(?:^|\n)([A-Z][A-Za-z]*(?:\s+[A-Z][A-Za-z]*)?)\s+(?:Inc\.|LLC|Ltd\.|Limited|Corp\.|Corporation)'
+        ], re.IGNORECASE)
+        patterns.add('experience.date_range', KeywordScan(
+            r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',
+            r'[a-z]*[\s\'\-](?:20\d{2}|19\d{2})[\s\-\–\—]+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|present|current)',
+            r'[a-z]*'
+        ), re.IGNORECASE)
+
+        # extract_core_computer_skills
+        patterns.add_group('core_skills.section', [
+            r'(?:technical|core|computer)\s+skills(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'(?:programming|software|technical)\s+knowledge(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
+            r'(?:technical|core)\s+competencies(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)'
+        ], section)
+
+    @property
+    def stop_words(self):
+        if self._stop_words is None:
+            self._stop_words = get_stopwords()
+        return self._stop_words
+
+    def analyze(self, text):
+        # Extractors accept either raw text or a ResumeContext shared across them
+        if isinstance(text, ResumeContext):
+            return text
+        return ResumeContext(self, text)
+
     def preprocess_text(self, text):
        if not text:
            return ""
@@ -242,49 +417,124 @@ class EnhancedResumeParser:
        text = text.lower()
 
        # Replace special characters with space (fix the regex)
-       text = re.sub(r'[^\w\s]', ' ', text)  # Keep alphanumeric and whitespace
+       text = self.patterns['preprocess.punctuation'].sub(' ', text)  # Keep alphanumeric and whitespace
 
        # Replace multiple spaces with a single space
-       text = re.sub(r'\s+', ' ', text)
+       text = self.patterns['preprocess.whitespace'].sub(' ', text)
 
        return text.strip()
 
 
     def extract_text_from_pdf(self, pdf_path):
+        return self.read_pdf_text(pdf_path)[0]
+
+    def read_pdf_text(self, pdf_path):
+        # Reads pages lazily within the configured limits. Returns the text and
+        # the name of the limit that cut it short, or None if it was read whole.
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            page_count, pages = self.open_pdf_pages(pdf_path)
+        except Exception as e:
+            print(f"Error extracting text from {pdf_path}: {e}")
+            return "", None
+
+        kept = []
+        chars = 0
+        found = set()
+        truncated = None
+        start = time.monotonic()
+
+        try:
+            for page in pages:
+                if self.max_chars is not None and chars + len(page) > self.max_chars:
+                    page = page[:self.max_chars - chars]
+                    truncated = 'max_chars'
+
+                kept.append(page + "\n")
+                chars += len(page)
+
+                if truncated:
+                    break
+                if len(kept) >= page_count:
+                    # Last page: let the stream finish so it can be cached
+                    continue
+                if self.max_pages is not None and len(kept) >= self.max_pages:
+                    truncated = 'max_pages'
+                    break
+                if self.time_budget is not None and time.monotonic() - start > self.time_budget:
+                    truncated = 'time_budget'
+                    break
+                if self.stop_when_found:
+                    found.update(
+                        name for name in self.stop_when_found
+                        if name not in found and PAGE_SECTION_MARKERS[name].search(page)
+                    )
+                    if len(found) == len(self.stop_when_found):
+                        truncated = 'sections_found'
+                        break
         except Exception as e:
             print(f"Error extracting text from {pdf_path}: {e}")
-            return ""
+            return "", None
+        finally:
+            pages.close()
+            if self.metrics is not None:
+                self.metrics.count('pages', len(kept))
+
+        return "".join(kept), truncated
+
+    def open_pdf_pages(self, pdf_path):
+        # (page_count, generator of page texts). Pages are decoded only as the
+        # generator is advanced; a full pass is stored in the text cache.
+        if self.text_cache is None:
+            reader = PdfReader(pdf_path)
+            return len(reader.pages), (page.extract_text() for page in reader.pages)
+
+        with open(pdf_path, 'rb') as f:
+            data = f.read()
+
+        key = self.text_cache.key(data)
+        pages = self.text_cache.get(key)
+        if pages is not None:
+            return len(pages), (page for page in pages)
+
+        reader = PdfReader(io.BytesIO(data))
+
+        def extract():
+            extracted = []
+            for page in reader.pages:
+                extracted.append(page.extract_text())
+                yield extracted[-1]
+            self.text_cache.put(key, extracted)
+
+        return len(reader.pages), extract()
+
+    def parser_options(self):
+        # Constructor arguments that reproduce this parser in another process
+        return {
+            "text_cache": self.text_cache,
+            "max_pages": self.max_pages,
+            "max_chars": self.max_chars,
+            "time_budget": self.time_budget,
+            "stop_when_found": self.stop_when_found,
+            "extractor_timeout": self.extractor_timeout,
+            "slow_capture": self.slow_capture
+        }
 
 
     # [All the other methods remain the same]
 
     def extract_gpa(self, text):
-        text = text.lower()
+        context = self.analyze(text)
+        text = context.lower
 
         # First look for academic/education sections
-        academic_section_patterns = [
-            r'academic(?:\s+profile|\s+qualifications?)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'education(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:qualification|degree)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)'
-        ]
-
-        academic_sections = []
-        for pattern in academic_section_patterns:
-            sections = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-            academic_sections.extend(sections)
+        academic_sections = context.find_sections('gpa.academic_section', 'lower')
 
         # Create a combined section text
         section_text = "\n".join(academic_sections) if academic_sections else text
 
         # Try table patterns first in academic sections
-        for pattern in self.table_gpa_patterns:
-            match = re.search(pattern, section_text, re.IGNORECASE)
+        for pattern in self.patterns['gpa.table']:
+            match = pattern.search(section_text)
             if match:
                 try:
                     gpa = float(match.group(1))
@@ -293,8 +543,8 @@ class EnhancedResumeParser:
                     continue
 
         # Try all patterns in academic sections
-        for pattern in self.gpa_patterns:
-            match = re.search(pattern, section_text, re.IGNORECASE)
+        for pattern in self.patterns['gpa.pattern']:
+            match = pattern.search(section_text)
             if match:
                 try:
                     gpa = float(match.group(1))
@@ -306,8 +556,8 @@ class EnhancedResumeParser:
                     continue
 
         # If not found in academic sections, try the full text
-        for pattern in self.gpa_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.patterns['gpa.pattern']:
+            match = pattern.search(text)
             if match:
                 try:
                     gpa = float(match.group(1))
@@ -319,7 +569,7 @@ class EnhancedResumeParser:
                     continue
 
         # Look for integers that might be CGPA as 10/10
-        grade_match = re.search(r'grade\s+(\d+)\/10', text, re.IGNORECASE)
+        grade_match = self.patterns['gpa.grade'].search(text)
         if grade_match:
             try:
                 return float(grade_match.group(1))
@@ -330,36 +580,26 @@ class EnhancedResumeParser:
 
     # [Other extraction methods remain the same]
     def extract_skills(self, text):
-        text = self.preprocess_text(text)
+        context = self.analyze(text)
+        text = context.preprocessed
         found_skills = set()
-        doc = nlp(text)
+        doc = context.doc
 
         # 1. Extract skills explicitly mentioned in skills sections
-        skills_section_patterns = [
-            r'(?:technical\s+)?skills\s*:(.+?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:technical\s+)?skills(?:\s+include)?(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:technologies|programming\s+languages|languages|tools|frameworks|platforms)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)'
-        ]
-
-        skills_sections = []
-        for pattern in skills_section_patterns:
-            sections = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-            skills_sections.extend(sections)
+        skills_sections = context.find_sections('skills.section', 'preprocessed')
 
         # Create a combined section text
         section_text = " ".join(skills_sections) if skills_sections else text
 
         # 2. Direct pattern matching for skills in our list
-        for skill in self.skill_set_list:
-            # Create a word boundary pattern and search
-            if re.search(r'\b' + re.escape(skill) + r'\b', section_text, re.IGNORECASE):
-                found_skills.add(skill)
+        found_skills.update(self.skill_matcher.find(section_text))
 
         # 3. Use entity recognition for unlisted skills
+        stop_words = self.stop_words
         for sent in doc.sents:
             for token in sent:
                 # Check for programming languages, technologies, and tools
-                if token.pos_ in ['NOUN', 'PROPN'] and token.text.lower() not in stopwords.words('english'):
+                if token.pos_ in ['NOUN', 'PROPN'] and token.text.lower() not in stop_words:
                     if token.text.lower() in self.skill_set_list:
                         found_skills.add(token.text.lower())
                     # Special handling for multi-word technologies
@@ -367,38 +607,22 @@ class EnhancedResumeParser:
                         found_skills.add((token.text + " " + doc[token.i + 1].text).lower())
 
         # 4. Check for skills by category for better organization
-        for category, category_skills in self.skill_categories.items():
-            for skill in category_skills:
-                if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE):
-                    found_skills.add(skill)
+        found_skills.update(self.category_skill_matcher.find(text))
 
         return list(found_skills)
 
     def extract_branch(self, text):
-      text = self.preprocess_text(text)
+      context = self.analyze(text)
+      text = context.preprocessed
 
       # Extract education section
-      education_section_patterns = [
-          r'education(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-          r'academic(?:\s+qualification|\s+background)?(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-          r'qualification(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)'
-      ]
-
-      education_sections = []
-      for pattern in education_section_patterns:
-          sections = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-          education_sections.extend(sections)
+      education_sections = context.find_sections('branch.education_section', 'preprocessed')
 
       section_text = " ".join(education_sections) if education_sections else text
 
       # PRIORITY 1: Check for complete phrases in context of degree
-      degree_context_patterns = [
-          r'(?:bachelor|master|b\.tech|m\.tech|b\.e|m\.e|degree)[^\n]*(?:in|of)[^\n]*([\w\s&]+)',
-          r'(?:major|specialization|branch|discipline)[^\n]*(?:in|of)[^\n]*([\w\s&]+)'
-      ]
-
-      for pattern in degree_context_patterns:
-          matches = re.findall(pattern, section_text, re.IGNORECASE)
+      for pattern in self.patterns['branch.degree_context']:
+          matches = pattern.findall(section_text)
           for match in matches:
               match_text = match.strip().lower()
               # Check each branch with all its aliases
@@ -410,10 +634,11 @@ class EnhancedResumeParser:
                               return branch_name
 
       # PRIORITY 2: Check for exact multi-word matches in branch aliases
+      matched_aliases = self.branch_alias_matcher.find(section_text)
       all_matched_branches = []
       for branch_name, aliases in self.branch_mapping.items():
           for alias in aliases:
-              if len(alias.split()) > 1 and re.search(r'\b' + re.escape(alias) + r'\b', section_text, re.IGNORECASE):
+              if len(alias.split()) > 1 and alias in matched_aliases:
                   all_matched_branches.append((branch_name, alias, len(alias)))
 
       # Sort matches by length of the alias (longer matches first)
@@ -425,7 +650,7 @@ class EnhancedResumeParser:
       all_single_matches = []
       for branch_name, aliases in self.branch_mapping.items():
           for alias in aliases:
-              if len(alias.split()) == 1 and re.search(r'\b' + re.escape(alias) + r'\b', section_text, re.IGNORECASE):
+              if len(alias.split()) == 1 and alias in matched_aliases:
                   all_single_matches.append((branch_name, alias))
 
       # If single matches found, prioritize Computer Science last (it's often a false positive)
@@ -439,20 +664,19 @@ class EnhancedResumeParser:
       return None
 
     def count_projects(self, text):
-      # Normalize text
-      text = re.sub(r'\s+', ' ', text)
-      text = text.replace('\n', ' <NL> ').lower()
+      context = self.analyze(text)
+
+      # Normalize whitespace within lines; newlines are kept as line boundaries.
+      # Long runs of blank lines are cut short: the section and bullet patterns
+      # rescan a run from each of its newlines.
+      text = self.patterns['projects.horizontal_whitespace'].sub(' ', context.text).lower()
+      text = self.patterns['projects.blank_lines'].sub('\n' * (MAX_BLANK_LINES + 1), text)
 
       # STAGE 1: Document Structure Analysis
       # Extract project sections with flexible boundary detection
-      project_section_patterns = [
-          r'(?:<NL>|\s+|^)(?:projects?|academic\s+projects?|technical\s+projects?|selected\s+work)(?:\s*:|<NL>)(.*?)(?:<NL>\s*(?:[a-z0-9]*\s*[a-z]*\s*(?:education|experience|skills|achievements|awards|publications|certifications|references|activities|additional|interests|languages))|$)',
-          r'(?:<NL>|\s+|^)(?:projects?\s+experience|project\s+work|portfolio|initiatives?)(?:\s*:|<NL>)(.*?)(?:<NL>\s*(?:[a-z0-9]*\s*[a-z]*\s*(?:education|experience|skills|achievements|awards|publications|certifications|references|activities|additional|interests|languages))|$)'
-      ]
-
       project_section = None
-      for pattern in project_section_patterns:
-          match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+      for pattern in self.patterns['projects.section']:
+          match = pattern.search(text)
           if match:
               project_section = match.group(1)
               break
@@ -463,55 +687,38 @@ class EnhancedResumeParser:
       confidence_scores = {}
 
       # Strategy 1: Section Header Pattern Analysis (30% weight)
-      header_patterns = [
-          r'(?:<NL>|\s+)(?:m\.?tech|b\.?tech|undergraduate|master\'?s|senior|final\s+year)\s+project',
-          r'(?:<NL>|\s+)design\s+lab',
-          r'(?:<NL>|\s+)(?:research|course|major|minor|team)\s+project',
-          r'(?:<NL>|\s+)project\s+\d+',
-          r'(?:<NL>|\s+)capstone(?:\s+project)?'
-      ]
-
       header_count = 0
-      for pattern in header_patterns:
-          matches = re.findall(pattern, analysis_text)
+      for pattern in self.patterns['projects.header']:
+          matches = pattern.findall(analysis_text)
           header_count += len(matches)
 
       if header_count > 0:
           confidence_scores['section_header'] = (header_count, 0.30)
 
       # Strategy 2: Title-Year Pattern Matching (25% weight)
-      title_patterns = [
-          r'(?:<NL>|\s+)title\s*:\s*([^<NL>]{10,})',
-          r'(?:<NL>|\s+)project\s*(?:title|name)\s*:\s*([^<NL>]{10,})',
-          r'(?:<NL>|\s+|^)(?:[•\*\-]\s*)?([A-Z][^<NL>]{10,})(?=<NL>|:\s*(?:20|19)\d{2}|,\s*(?:20|19)\d{2})'
-      ]
-
       title_count = 0
-      for pattern in title_patterns:
-          matches = re.findall(pattern, analysis_text, re.IGNORECASE)
-          title_count += len([t for t in matches if len(t.strip()) > 10 and not re.search(r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\b', t.lower())])
+      month = self.patterns['projects.month']
+      for pattern in self.patterns['projects.title']:
+          matches = pattern.findall(analysis_text)
+          title_count += len([t for t in matches if len(t.strip()) > 10 and not month.search(t.lower())])
 
       if title_count > 0:
           confidence_scores['title_year'] = (title_count, 0.25)
 
       # Strategy 3: Bullet Structure Pattern (20% weight)
-      bullet_pattern = r'(?:<NL>\s*)[•\*\-]\s+[^<NL>]+'
-      bullet_matches = re.findall(bullet_pattern, analysis_text)
-
-      # Group bullets into clusters by proximity
+      # Group bullets into clusters by proximity, using each match's own offsets
       bullet_clusters = []
       current_cluster = []
-      last_pos = -1
+      last_end = -1
 
-      for bullet in bullet_matches:
-          curr_pos = analysis_text.find(bullet)
-          if last_pos == -1 or curr_pos - last_pos < 300:  # Close enough to be same project
-              current_cluster.append(bullet)
+      for match in self.patterns['projects.bullet'].finditer(analysis_text):
+          if last_end == -1 or match.start() - last_end < 300:  # Close enough to be same project
+              current_cluster.append(match.group(0))
           else:
               if len(current_cluster) >= 2:  # Need multiple bullets for a project
                   bullet_clusters.append(current_cluster)
-              current_cluster = [bullet]
-          last_pos = curr_pos + len(bullet)
+              current_cluster = [match.group(0)]
+          last_end = match.end()
 
       if current_cluster and len(current_cluster) >= 2:
           bullet_clusters.append(current_cluster)
@@ -521,54 +728,44 @@ class EnhancedResumeParser:
           confidence_scores['bullet_structure'] = (bullet_count, 0.20)
 
       # Strategy 4: Project Verb Analysis (15% weight)
-      action_verbs = [
-          r'\bdeveloped\b', r'\bimplemented\b', r'\bdesigned\b', r'\bcreated\b',
-          r'\bbuilt\b', r'\bauthored\b', r'\bengineered\b', r'\bconducted\b',
-          r'\barchitected\b', r'\bprogrammed\b', r'\bresearched\b', r'\banalyzed\b'
-      ]
+      # A context never crosses a sentence or line break, so the search only
+      # runs on the fragments that contain the verb at all
+      fragments = self.patterns['projects.fragment_break'].split(analysis_text)
 
       verb_contexts = []
-      for verb in action_verbs:
-          contexts = re.findall(r'[^.!?<NL>]{5,100}' + verb + r'[^.!?<NL>]{5,100}', analysis_text)
-          for context in contexts:
-              if len(context) > 40:  # Substantial context
-                  verb_contexts.append(context)
-
-      # Deduplicate similar contexts
-      unique_contexts = []
-      for context in verb_contexts:
-          if not any(self._text_similarity(context, existing) > 0.6 for existing in unique_contexts):
-              unique_contexts.append(context)
-
-      if unique_contexts:
+      for verb, verb_pattern in zip(self.project_action_verbs, self.patterns['projects.verb_context']):
+          for fragment in fragments:
+              if verb not in fragment:
+                  continue
+              for context_text in verb_pattern.findall(fragment):
+                  if len(context_text) > 40:  # Substantial context
+                      verb_contexts.append(context_text)
+
+      # Deduplicate similar contexts; each context is tokenized once
+      unique_word_sets = []
+      for context_text in verb_contexts:
+          words = self._word_set(context_text)
+          if not any(self._word_set_similarity(words, existing) > 0.6 for existing in unique_word_sets):
+              unique_word_sets.append(words)
+
+      if unique_word_sets:
           # Cap at reasonable number
-          verb_count = min(len(unique_contexts), 8)
+          verb_count = min(len(unique_word_sets), 8)
           confidence_scores['project_verbs'] = (verb_count, 0.15)
 
       # Strategy 5: Supervision/Guide Pattern (20% weight)
-      guide_patterns = [
-          r'(?:<NL>|\s+)(?:guide|supervisor|advisor)\s*:\s*(?:prof\.?|dr\.?)?',
-          r'(?:<NL>|\s+)(?:mentor|professor|instructor)\s*:\s*'
-      ]
-
       guide_count = 0
-      for pattern in guide_patterns:
-          guide_matches = re.findall(pattern, analysis_text)
+      for pattern in self.patterns['projects.guide']:
+          guide_matches = pattern.findall(analysis_text)
           guide_count += len(guide_matches)
 
       if guide_count > 0:
           confidence_scores['guide_pattern'] = (guide_count, 0.20)
 
       # Strategy 6: Date Pattern Analysis (15% weight)
-      date_patterns = [
-          r'(?:<NL>|\s+)(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s*\'?(?:\d{2}|\d{4})\s*-\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|present|current|now)',
-          r'(?:<NL>|\s+)(?:20|19)\d{2}\s*-\s*(?:(?:20|19)\d{2}|present|current|now)',
-          r'(?:<NL>|\s+)(?:duration|period)\s*:\s*.*?(?:months?|years?)'
-      ]
-
       date_count = 0
-      for pattern in date_patterns:
-          date_matches = re.findall(pattern, analysis_text)
+      for pattern in self.patterns['projects.date']:
+          date_matches = pattern.findall(analysis_text)
           date_count += len(date_matches)
 
       if date_count > 0:
@@ -576,20 +773,19 @@ class EnhancedResumeParser:
 
       # Strategy 7: Structural Format Detection (30% weight)
       # This handles project formats with visual boundaries but without explicit markers
-      block_pattern = r'(?:<NL>\s*<NL>|\s{3,}|[-_=]{3,})([^<NL>]{100,})(?:<NL>\s*<NL>|\s{3,}|[-_=]{3,})'
-      block_matches = re.findall(block_pattern, analysis_text)
+      block_matches = self.patterns['projects.block'].findall(analysis_text)
 
       project_blocks = 0
       for block in block_matches:
           score = 0
           # Check for project characteristics
-          if re.search(r'\b(?:project|application|system|platform|software|website|mobile|tool)\b', block):
+          if self.patterns['projects.block_subject'].search(block):
               score += 2
-          if re.search(r'\b(?:developed|implemented|created|designed|built)\b', block):
+          if self.patterns['projects.block_verb'].search(block):
               score += 2
-          if re.search(r'\b(?:20|19)\d{2}\b', block):
+          if self.patterns['projects.block_year'].search(block):
               score += 1
-          if re.search(r'\b(?:technology|framework|language|library|stack|database)\b', block):
+          if self.patterns['projects.block_tech'].search(block):
               score += 1
 
           if score >= 3:
@@ -625,206 +821,165 @@ class EnhancedResumeParser:
       # No projects found
       return 0
 
-    def _text_similarity(self, text1, text2):
-        # Simple word overlap score
-        words1 = set(re.findall(r'\b\w{4,}\b', text1.lower()))
-        words2 = set(re.findall(r'\b\w{4,}\b', text2.lower()))
+    def _word_set(self, text):
+        return set(self.patterns['projects.word'].findall(text.lower()))
 
+    def _word_set_similarity(self, words1, words2):
+        # Simple word overlap score
         if not words1 or not words2:
             return 0
 
         overlap = len(words1.intersection(words2))
         return overlap / min(len(words1), len(words2))
 
+    def _text_similarity(self, text1, text2):
+        return self._word_set_similarity(self._word_set(text1), self._word_set(text2))
+
     def extract_project_keywords(self, text):
-        text = self.preprocess_text(text)
+        context = self.analyze(text)
+        text = context.preprocessed
         found_keywords = set()
 
         # Look for project sections
-        project_section_patterns = [
-            r'projects?(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:academic|major|minor|technical)\s+projects?(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'b\.tech\s+project(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'm\.tech\s+project(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-        ]
-
-        project_sections = []
-        for pattern in project_section_patterns:
-            sections = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-            project_sections.extend(sections)
+        project_sections = context.find_sections('project_keywords.section', 'preprocessed')
 
         # Create a combined section text
         section_text = "\n".join(project_sections) if project_sections else text
 
         # Match keywords
-        for keyword in self.project_keywords_list:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', section_text, re.IGNORECASE):
-                found_keywords.add(keyword)
+        found_keywords.update(self.project_keyword_matcher.find(section_text))
 
         # Use NLP to find additional relevant terms in project sections
-        if project_sections:
-            doc = nlp(section_text)
-            for token in doc:
+        for doc in context.section_docs('project_keywords.section', 'preprocessed'):
+            for i, token in enumerate(doc):
                 if token.pos_ in ['NOUN', 'PROPN'] and token.text.lower() in self.project_keywords_list:
                     found_keywords.add(token.text.lower())
                 # Check for bigrams and trigrams (e.g., "machine learning")
-                if token.i < len(doc) - 1:
-                    bigram = token.text + " " + doc[token.i + 1].text
+                if i < len(doc) - 1:
+                    bigram = token.text + " " + doc[i + 1].text
                     if bigram.lower() in self.project_keywords_list:
                         found_keywords.add(bigram.lower())
-                if token.i < len(doc) - 2:
-                    trigram = token.text + " " + doc[token.i + 1].text + " " + doc[token.i + 2].text
+                if i < len(doc) - 2:
+                    trigram = token.text + " " + doc[i + 1].text + " " + doc[i + 2].text
                     if trigram.lower() in self.project_keywords_list:
                         found_keywords.add(trigram.lower())
 
         return list(found_keywords)
 
     def extract_mobile_number(self, text):
-        text = text.lower()
+        context = self.analyze(text)
+        text = context.lower
 
         # Look for phone/mobile/contact sections first
-        contact_section_patterns = [
-            r'(?:phone|mobile|contact|ph|tel|contact details)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:^|\n).*?(?:phone|mobile|contact|ph|tel)(?:\s*:|:?\s*\n|\s*-\s*)(.*?)(?:\n|$)'
-        ]
-
-        contact_sections = []
-        for pattern in contact_section_patterns:
-            sections = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-            contact_sections.extend(sections)
+        contact_sections = context.find_sections('mobile.contact_section', 'lower')
 
         # Search in contact sections first
         for section in contact_sections:
-            for pattern in self.phone_patterns:
-                phone_match = re.search(pattern, section)
+            for pattern in self.patterns['mobile.phone']:
+                phone_match = pattern.search(section)
                 if phone_match:
                     # Clean the phone number
-                    phone = re.sub(r'[^\d+]', '', phone_match.group(0))
+                    phone = self.patterns['mobile.non_digit'].sub('', phone_match.group(0))
                     return phone
 
         # If not found in sections, look in entire text
-        for pattern in self.phone_patterns:
-            phone_matches = re.findall(pattern, text)
+        for pattern in self.patterns['mobile.phone']:
+            phone_matches = pattern.findall(text)
             if phone_matches:
                 # Clean the first phone number found
-                phone = re.sub(r'[^\d+]', '', phone_matches[0])
+                phone = self.patterns['mobile.non_digit'].sub('', phone_matches[0])
                 return phone
 
         return None
 
     def extract_email(self, text):
-        text = text.lower()
+        context = self.analyze(text)
+        text = context.lower
 
         # Look for email/contact sections first
-        contact_section_patterns = [
-            r'(?:email|e-mail|mail|contact|contact details)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:^|\n).*?(?:email|e-mail|mail)(?:\s*:|:?\s*\n|\s*-\s*)(.*?)(?:\n|$)'
-        ]
-
-        contact_sections = []
-        for pattern in contact_section_patterns:
-            sections = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-            contact_sections.extend(sections)
+        contact_sections = context.find_sections('email.contact_section', 'lower')
 
         # Search in contact sections first
         for section in contact_sections:
-            email_match = re.search(self.email_pattern, section)
+            email_match = self.patterns['email.address'].search(section)
             if email_match:
                 return email_match.group(0)
 
         # If not found in sections, look in entire text
-        email_matches = re.findall(self.email_pattern, text)
-        if email_matches:
-            return email_matches[0]
+        email_match = self.patterns['email.address'].search(text)
+        if email_match:
+            return email_match.group(0)
 
         return None
 
     def has_experience(self, text):
-        text = self.preprocess_text(text)
+        context = self.analyze(text)
+        text = context.preprocessed
 
         # Look for experience sections
-        experience_section_patterns = [
-            r'(?:work\s+)?experience(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:professional|industry|job)\s+experience(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:employment|work\s+history)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:internship|intern)(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)'
-        ]
-
-        experience_sections = []
-        for pattern in experience_section_patterns:
-            sections = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-            experience_sections.extend(sections)
+        experience_sections = context.find_sections('experience.section', 'preprocessed')
 
         # If we found experience sections with substantial content
         section_text = "\n".join(experience_sections)
         if section_text and len(section_text) > 50:  # Arbitrary threshold for meaningful content
             return 'Yes'
 
-        # Look for job titles
-        job_titles = [
-            'engineer', 'developer', 'programmer', 'analyst', 'consultant', 'manager', 'associate',
-            'intern', 'trainee', 'lead', 'architect', 'administrator', 'specialist', 'executive'
-        ]
-
-        for title in job_titles:
-            # Exclude titles that are part of educational context
-            pattern = r'\b' + re.escape(title) + r'\b(?!.*(?:student|pursuing|looking for|seeking))'
-            if re.search(pattern, text, re.IGNORECASE):
-                return 'Yes'
+        # Look for job titles, unless an educational phrase follows them on the
+        # same line. Only the last such phrase on a line matters, so each line
+        # is scanned once instead of once per title occurrence.
+        for line in text.split('\n'):
+            exclusions = self.patterns['experience.exclusion'].finditer(line)
+            last_exclusion = exclusions[-1].start() if exclusions else -1
+            for pattern in self.patterns['experience.job_title']:
+                if any(match.end() > last_exclusion for match in pattern.finditer(line)):
+                    return 'Yes'
 
         # Look for company names followed by designations
-        company_patterns = [
-            r'(?:worked at|at|with|for)\s+([A-Z][A-Za-z]*(?:\s+[A-Z][A-Za-z]*)?)',
-            r'(?:^|\n)([A-Z][A-Za-z]*(?:\s+[A-Z][A-Za-z]*)?)\s+(?:Inc\.|LLC|Ltd\.|Limited|Corp\.|Corporation)'
-        ]
-
-        for pattern in company_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in self.patterns['experience.company']:
+            if pattern.search(text):
                 return 'Yes'
 
         # Look for date ranges typical of work experience
-        date_range_pattern = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[\s\'\-](?:20\d{2}|19\d{2})[\s\-\–\—]+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|present|current)'
-        if re.search(date_range_pattern, text, re.IGNORECASE):
+        if self.patterns['experience.date_range'].search(text):
             return 'Yes'
 
         # Default to No if no experience indicators found
         return 'No'
 
     def extract_core_computer_skills(self, text):
-        text = self.preprocess_text(text)
+        context = self.analyze(text)
+        text = context.preprocessed
         found_skills = set()
 
         # Look for skills sections
-        skills_section_patterns = [
-            r'(?:technical|core|computer)\s+skills(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:programming|software|technical)\s+knowledge(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)',
-            r'(?:technical|core)\s+competencies(?:\s*:|:?\s*\n)(.*?)(?:\n\s*\n|\n\s*[A-Z]|\Z)'
-        ]
-
-        skills_sections = []
-        for pattern in skills_section_patterns:
-            sections = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
-            skills_sections.extend(sections)
+        skills_sections = context.find_sections('core_skills.section', 'preprocessed')
 
         # Create a combined section text
         section_text = "\n".join(skills_sections) if skills_sections else text
 
         # Check each core skill category
+        matched_keywords = self.core_skill_matcher.find(section_text)
         for skill_category, keywords in self.core_computer_skills.items():
-            for keyword in keywords:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', section_text, re.IGNORECASE):
-                    found_skills.add(skill_category)
-                    break  # One match in category is enough
+            if any(keyword in matched_keywords for keyword in keywords):
+                found_skills.add(skill_category)
 
         # Return comma-separated list or None
         if found_skills:
             return ", ".join(sorted(found_skills))
         return None
 
-    def evaluate_text_similarity(self, text1, text2):
+    def evaluate_text_similarity(self, text1, text2, model=None):
         if not text1 or not text2:
             return 0.0
 
+        # Prefer a corpus-wide text_similarity.TextModel; fitting on just the
+        # two texts gives every shared word the same IDF
+        if model is not None:
+            return model.similarity(text1, text2)
+
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+
         # Create a TF-IDF vectorizer
         vectorizer = TfidfVectorizer(stop_words='english')
 
@@ -839,7 +994,41 @@ class EnhancedResumeParser:
             return 0.0
 
     def parse_resume(self, pdf_path):
-        text = self.extract_text_from_pdf(pdf_path)
+        if self.slow_capture is None:
+            return self._measured_parse(pdf_path)
+
+        start = time.perf_counter()
+        result = self._measured_parse(pdf_path)
+        self.slow_capture.observe(self, pdf_path, time.perf_counter() - start)
+        return result
+
+    def _measured_parse(self, pdf_path):
+        metrics = self.metrics
+        if metrics is None:
+            return self._parse_resume(pdf_path)
+
+        metrics.begin('parse_resume')
+        regex_totals = self.patterns.totals() if self.patterns.track else None
+        try:
+            result = self._parse_resume(pdf_path)
+        finally:
+            if regex_totals is not None:
+                calls, hits = self.patterns.totals()
+                metrics.count('regex_calls', calls - regex_totals[0])
+                metrics.count('regex_hits', hits - regex_totals[1])
+            record = metrics.end()
+
+        if metrics.attach:
+            result["Metrics"] = record
+        return result
+
+    def _parse_resume(self, pdf_path):
+        metrics = self.metrics
+        start = time.perf_counter() if metrics is not None else None
+        text, truncated = self.read_pdf_text(pdf_path)
+        if metrics is not None:
+            metrics.lap('pdf_text', start)
+            metrics.count('characters', len(text))
 
         if not text:
             return {
@@ -847,53 +1036,162 @@ class EnhancedResumeParser:
                 "error": "Failed to extract text from PDF"
             }
 
-        # Extract only the required 9 columns
-        gpa = self.extract_gpa(text)
-        skills = self.extract_skills(text)
-        branch = self.extract_branch(text)
-        project_count = self.count_projects(text)
-        project_keywords = self.extract_project_keywords(text)
-        mobile_number = self.extract_mobile_number(text)
-        email = self.extract_email(text)
-        experience = self.has_experience(text)
-        core_computer_skills = self.extract_core_computer_skills(text)
+        # One shared analysis of the text for all extractors
+        context = self.analyze(text)
 
-        return {
-            "file_name": os.path.basename(pdf_path),
-            "CPI/GPA": gpa,
-            "Skills": skills,
-            "Branch": branch,
-            "No_of_Projects": project_count,
-            "Project_Keywords": project_keywords,
-            "Mobile_Number": mobile_number,
-            "Email_ID": email,
-            "Experience": experience,
-            "Core_Computer_Skills": core_computer_skills
-        }
+        result = {"file_name": os.path.basename(pdf_path)}
+        degraded = []
+        for column, extractor in self.extractors():
+            if metrics is not None:
+                start = time.perf_counter()
+            try:
+                result[column] = self.run_extractor(extractor, context)
+            except DeadlineExceeded:
+                # Keep the other columns; this one is unknown rather than empty
+                result[column] = None
+                degraded.append(column)
+            if metrics is not None:
+                metrics.lap(column, start)
+
+        # Only present when extraction stopped at one of the configured limits
+        if truncated:
+            result["Text_Truncated"] = truncated
+
+        # Only present when an extractor ran out of its time budget
+        if degraded:
+            result["Degraded"] = degraded
+
+        return result
+
+    def extractors(self):
+        # (column, extractor) for the required 9 columns, in output order
+        return [
+            ("CPI/GPA", self.extract_gpa),
+            ("Skills", self.extract_skills),
+            ("Branch", self.extract_branch),
+            ("No_of_Projects", self.count_projects),
+            ("Project_Keywords", self.extract_project_keywords),
+            ("Mobile_Number", self.extract_mobile_number),
+            ("Email_ID", self.extract_email),
+            ("Experience", self.has_experience),
+            ("Core_Computer_Skills", self.extract_core_computer_skills)
+        ]
 
-    def parse_resumes_in_directory(self, directory_path, output_path=None):
-        if not os.path.exists(directory_path):
-            raise ValueError(f"Directory not found: {directory_path}")
+    def run_extractor(self, extractor, context):
+        # The pattern registry raises DeadlineExceeded on its next call once the
+        # budget is spent. Work between pattern calls (spaCy, phrase matching)
+        # is not interrupted, so an extractor can overrun by one such step.
+        if self.extractor_timeout is None:
+            return extractor(context)
 
-        results = []
-        pdf_files = [f for f in os.listdir(directory_path) if f.lower().endswith('.pdf')]
+        self.patterns.deadline = time.perf_counter() + self.extractor_timeout
+        try:
+            return extractor(context)
+        finally:
+            self.patterns.deadline = None
+
+    def parse_resumes_in_directory(self, directory_path, output_path=None, workers=1, chunk_size=8,
+                                   manifest_path=None, index_path=None):
+        pdf_files = self.list_pdf_files(directory_path)
 
         if not pdf_files:
             print(f"No PDF files found in {directory_path}")
             return None
 
-        for pdf_file in pdf_files:
-            pdf_path = os.path.join(directory_path, pdf_file)
-            try:
-                result = self.parse_resume(pdf_path)
-                results.append(result)
-                print(f"Processed: {pdf_file}")
-            except Exception as e:
-                print(f"Error processing {pdf_file}: {e}")
-                results.append({
-                    "file_name": pdf_file,
-                    "error": str(e)
-                })
+        results = [
+            result for _, result in
+            self._directory_results(directory_path, pdf_files, workers, chunk_size, manifest_path, index_path)
+        ]
+
+        df = self.results_to_dataframe(results)
+
+        # Save results if output path provided
+        if output_path:
+            self.save_dataframe(df, output_path)
+
+        return df
+
+    def stream_resumes_in_directory(self, directory_path, jsonl_path, workers=1, chunk_size=8,
+                                    manifest_path=None, index_path=None):
+        # Writes each parsed resume to jsonl_path as one JSON line as soon as it
+        # is done, so memory stays flat and a crash keeps everything written so far
+        pdf_files = self.list_pdf_files(directory_path)
+
+        if not pdf_files:
+            print(f"No PDF files found in {directory_path}")
+            return 0
+
+        count = 0
+        with open(jsonl_path, 'w', encoding='utf-8') as out:
+            for _, result in self._directory_results(directory_path, pdf_files, workers, chunk_size,
+                                                     manifest_path, index_path):
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+                count += 1
+
+        return count
+
+    def list_pdf_files(self, directory_path):
+        if not os.path.exists(directory_path):
+            raise ValueError(f"Directory not found: {directory_path}")
+
+        # Sorted so results come out in the same order on every run
+        return sorted(f for f in os.listdir(directory_path) if f.lower().endswith('.pdf'))
+
+    def _directory_results(self, directory_path, pdf_files, workers=1, chunk_size=8, manifest_path=None,
+                           index_path=None):
+        # Yields (pdf_file, result) in the order of pdf_files. With a manifest,
+        # files whose content hash and parser version are unchanged reuse their
+        # stored result, and every new result is recorded as soon as it exists.
+        # With an index, every result (reused or new) is indexed by file name.
+        manifest = ParseManifest(manifest_path, PARSER_VERSION) if manifest_path else None
+        index = ResumeIndex(index_path) if index_path else None
+        digests = {}
+        cached = {}
+
+        if manifest:
+            for pdf_file in pdf_files:
+                digests[pdf_file] = file_digest(os.path.join(directory_path, pdf_file))
+                result = manifest.lookup(pdf_file, digests[pdf_file])
+                if result is not None:
+                    cached[pdf_file] = result
+
+        pending = [pdf_file for pdf_file in pdf_files if pdf_file not in cached]
+        parsed = self._parse_files(directory_path, pending, workers, chunk_size)
+
+        try:
+            for pdf_file in pdf_files:
+                if pdf_file in cached:
+                    if index is not None:
+                        index.add(pdf_file, cached[pdf_file])
+                    yield pdf_file, cached[pdf_file]
+                    continue
+
+                result = next(parsed)
+                if manifest:
+                    manifest.record(pdf_file, digests[pdf_file], result)
+                if index is not None:
+                    index.add(pdf_file, result)
+
+                if "error" in result:
+                    print(f"Error processing {pdf_file}: {result['error']}")
+                else:
+                    print(f"Processed: {pdf_file}")
+
+                yield pdf_file, result
+
+            if manifest:
+                manifest.compact(keep=set(pdf_files))
+                print(f"Reused {len(cached)} unchanged results, parsed {len(pending)} files")
+        finally:
+            parsed.close()
+            if manifest:
+                manifest.close()
+            if index is not None:
+                index.close()
+
+    def results_to_dataframe(self, results):
+        import pandas as pd
 
         # Convert results to DataFrame
         df = pd.DataFrame(results)
@@ -905,81 +1203,264 @@ class EnhancedResumeParser:
         if 'Project_Keywords' in df.columns:
             df['Project_Keywords'] = df['Project_Keywords'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
 
-        # Save results if output path provided
-        if output_path:
-            if output_path.lower().endswith('.csv'):
-                df.to_csv(output_path, index=False)
-                print(f"Results saved to {output_path}")
-            elif output_path.lower().endswith(('.xls', '.xlsx')):
-                df.to_excel(output_path, index=False)
-                print(f"Results saved to {output_path}")
-            else:
-                df.to_csv(output_path + '.csv', index=False)
-                print(f"Results saved to {output_path}.csv")
+        if 'Degraded' in df.columns:
+            df['Degraded'] = df['Degraded'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
+
+        return df
 
+    def save_dataframe(self, df, output_path):
+        if output_path.lower().endswith('.csv'):
+            df.to_csv(output_path, index=False)
+            print(f"Results saved to {output_path}")
+        elif output_path.lower().endswith(('.xls', '.xlsx')):
+            df.to_excel(output_path, index=False)
+            print(f"Results saved to {output_path}")
+        else:
+            df.to_csv(output_path + '.csv', index=False)
+            print(f"Results saved to {output_path}.csv")
+
+    def export_jsonl(self, jsonl_path, output_path):
+        # Optional post-processing of a streamed run into CSV/XLSX
+        results = []
+        with open(jsonl_path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    results.append(json.loads(line))
+
+        df = self.results_to_dataframe(results)
+        self.save_dataframe(df, output_path)
         return df
 
-    def parse_single_file(self, file_path):
-           if not os.path.exists(file_path):
-               error_msg = f"File not found: {file_path}"
-               print(json.dumps({"error": error_msg}))
-               return None
-               
-           if not file_path.lower().endswith('.pdf'):
-               error_msg = f"Not a PDF file: {file_path}"
-               print(json.dumps({"error": error_msg}))
-               return None
-               
-           try:
-               # Parse the single resume
-               result = self.parse_resume(file_path)
-               
-               # Convert to DataFrame for consistent output format
-               df = pd.DataFrame([result])
-               
-               # Clean up DataFrame
-               if 'Skills' in df.columns:
-                   df['Skills'] = df['Skills'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
-
-               if 'Project_Keywords' in df.columns:
-                   df['Project_Keywords'] = df['Project_Keywords'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
-               
-               # Hardcoded output path in the same directory as the input file
-               output_dir = os.path.dirname(file_path)
-               output_filename = "parsed_resume_" + os.path.basename(file_path).replace('.pdf', '.csv')
-               output_path = os.path.join(output_dir, output_filename)
-               
-               # Save to CSV
-               df.to_csv(output_path, index=False)
-               print(f"Results saved to {output_path}")
-               
-               # Also print the result as JSON for direct consumption
-               print(json.dumps(result))
-               
-               return result
-               
-           except Exception as e:
-               error_msg = f"Error processing {file_path}: {str(e)}"
-               print(json.dumps({"error": error_msg}))
-               return None
+    def parse_directory_file(self, directory_path, pdf_file):
+        try:
+            return self.parse_resume(os.path.join(directory_path, pdf_file))
+        except Exception as e:
+            return {
+                "file_name": pdf_file,
+                "error": str(e)
+            }
+
+    def _parse_files(self, directory_path, pdf_files, workers=1, chunk_size=8):
+        # Yields one result per file, in the order of pdf_files. With more than
+        # one worker the files are spread over a process pool in chunks; each
+        # process builds its own parser and spaCy pipeline once.
+        if workers == 0:
+            workers = os.cpu_count() or 1
+
+        if workers <= 1 or len(pdf_files) <= 1:
+            for pdf_file in pdf_files:
+                yield self.parse_directory_file(directory_path, pdf_file)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(pdf_files)),
+            initializer=_init_directory_worker,
+            initargs=(type(self), self.parser_options())
+        ) as executor:
+            yield from executor.map(
+                _parse_directory_file,
+                [directory_path] * len(pdf_files),
+                pdf_files,
+                chunksize=max(1, chunk_size)
+            )
+
+    def parse_single_file(self, file_path, export_path=None):
+        # Prints the result (or an error) as JSON; with export_path the result
+        # is also written there as CSV/XLSX
+        result = self.parse_file(file_path)
+        if export_path and "error" not in result:
+            try:
+                # Keep stdout to the one JSON document
+                with contextlib.redirect_stdout(sys.stderr):
+                    self.save_dataframe(self.results_to_dataframe([result]), export_path)
+            except Exception as e:
+                result = {"error": f"Error exporting {file_path}: {str(e)}"}
+        print(json.dumps(result))
+        return None if "error" in result else result
+
+    def parse_file(self, file_path):
+        # The result of one PDF, or an error dict
+        if not file_path or not os.path.exists(file_path):
+            return {"error": f"File not found: {file_path}"}
+
+        if not file_path.lower().endswith('.pdf'):
+            return {"error": f"Not a PDF file: {file_path}"}
+
+        try:
+            return self.parse_resume(file_path)
+        except Exception as e:
+            return {"error": f"Error processing {file_path}: {str(e)}"}
+
+
+# Per-process state for parallel directory parsing
+_directory_parser = None
+
+
+def _init_directory_worker(parser_class, parser_kwargs):
+    global _directory_parser
+    _directory_parser = parser_class(**parser_kwargs)
+    try:
+        get_nlp()
+        get_stopwords()
+    except ResourceUnavailableError:
+        # Reported per file by parse_directory_file
+        pass
+
+
+def _parse_directory_file(directory_path, pdf_file):
+    return _directory_parser.parse_directory_file(directory_path, pdf_file)
+
+
+def run_worker(parser):
+    # Long-lived mode: one request frame ({"id": ..., "path": ...}) in on stdin,
+    # one reply frame ({"id": ..., "result": ...}) out on stdout, as
+    # length-prefixed JSON (see framing.py). The parser and the spaCy pipeline
+    # stay loaded between requests. Anything the extractors print goes to
+    # stderr so it cannot corrupt the reply stream.
+    requests, replies = sys.stdin.buffer, sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    # Load the NLP resources before the first request arrives; if they are
+    # missing, every request reports the same clear error instead
+    try:
+        get_nlp()
+        get_stopwords()
+    except ResourceUnavailableError as e:
+        print(f"Warning: {e}")
+
+    try:
+        while True:
+            request_id = None
+            try:
+                request = read_frame(requests)
+                if request is None:
+                    break
+                request_id = request.get("id")
+                result = parser.parse_file(request.get("path"))
+            except FrameError as e:
+                print(f"Worker input ended mid-request: {e}")
+                break
+            except Exception as e:
+                result = {"error": f"Invalid request: {str(e)}"}
+
+            write_frame(replies, {"id": request_id, "result": result})
+    finally:
+        # However the worker stops, the metrics sink is flushed and closed
+        if parser.metrics is not None:
+            parser.metrics.close()
 
 
 if __name__ == "__main__":
-    parser = EnhancedResumeParser()
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Parse a resume PDF or a directory of resume PDFs")
+    arg_parser.add_argument("path", nargs="?", help="PDF file or directory of PDFs")
+    arg_parser.add_argument("--worker", action="store_true",
+                            help="serve length-prefixed JSON requests on stdin/stdout (see framing.py)")
+    arg_parser.add_argument("--workers", type=int, default=1,
+                            help="processes for directory parsing (0 = one per CPU)")
+    arg_parser.add_argument("--chunk-size", type=int, default=8,
+                            help="files handed to a worker process at a time")
+    arg_parser.add_argument("--jsonl", metavar="FILE",
+                            help="stream directory results to FILE as JSON lines")
+    arg_parser.add_argument("--export", metavar="FILE",
+                            help="write the results of a PDF or of streamed JSON lines to CSV/XLSX FILE")
+    arg_parser.add_argument("--text-cache", metavar="DIR",
+                            help="cache extracted PDF text in DIR (default: $RESUME_TEXT_CACHE_DIR)")
+    arg_parser.add_argument("--max-pages", type=int, help="read at most this many pages per PDF")
+    arg_parser.add_argument("--max-chars", type=int, help="keep at most this many characters per PDF")
+    arg_parser.add_argument("--time-budget", type=float, help="seconds of PDF text extraction per file")
+    arg_parser.add_argument("--extractor-timeout", type=float,
+                            help="seconds each field extractor may spend before its column is marked degraded")
+    arg_parser.add_argument("--stop-when-found", nargs="+", choices=sorted(PAGE_SECTION_MARKERS),
+                            help="stop reading pages once all of these sections have been seen")
+    arg_parser.add_argument("--incremental", nargs="?", const="", metavar="MANIFEST",
+                            help="skip unchanged files using a manifest (default: <dir>/.parse_manifest.jsonl)")
+    arg_parser.add_argument("--index", metavar="FILE",
+                            help="add directory results to this resume index (see resume_index.py)")
+    arg_parser.add_argument("--metrics", metavar="FILE",
+                            help="record per-stage times and counters of each parse to FILE "
+                                 "(Prometheus text if it ends in .prom, else JSON lines; "
+                                 "not collected inside --workers processes)")
+    arg_parser.add_argument("--attach-metrics", action="store_true",
+                            help="add each parse's times and counters to its result as Metrics")
+    arg_parser.add_argument("--regex-stats", metavar="FILE",
+                            help="write per-pattern call, hit and time counts to FILE as JSON "
+                                 "(not collected inside --workers processes)")
+    arg_parser.add_argument("--capture-slow", metavar="THRESHOLD",
+                            help="profile parses slower than THRESHOLD seconds, or than THRESHOLD "
+                                 "times the running median with an x suffix (e.g. 50x), into --capture-dir")
+    arg_parser.add_argument("--capture-dir", metavar="DIR", default="slow_captures",
+                            help="directory for --capture-slow captures (default: slow_captures)")
+    arg_parser.add_argument("--capture-limit", type=int, default=50,
+                            help="most captures written per process (default: 50)")
+    args = arg_parser.parse_args()
+
+    slow_capture = None
+    if args.capture_slow:
+        try:
+            slow_capture = SlowCapture(args.capture_dir, args.capture_slow, limit=args.capture_limit)
+        except ValueError as e:
+            print(json.dumps({"error": str(e)}))
+            sys.exit(1)
+
+    parser = EnhancedResumeParser(
+        text_cache=PdfTextCache(args.text_cache) if args.text_cache else None,
+        max_pages=args.max_pages,
+        max_chars=args.max_chars,
+        time_budget=args.time_budget,
+        stop_when_found=args.stop_when_found,
+        extractor_timeout=args.extractor_timeout,
+        metrics=Metrics(args.metrics, attach=args.attach_metrics) if args.metrics or args.attach_metrics else None,
+        slow_capture=slow_capture
+    )
+    parser.patterns.track = bool(args.regex_stats or parser.metrics)
     
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]
+    if args.worker:
+        run_worker(parser)
+
+    elif args.path:
+        file_path = args.path
+
+        manifest_path = None
+        if args.incremental is not None:
+            manifest_path = args.incremental or os.path.join(file_path, ".parse_manifest.jsonl")
         
         # Check if the path is a file
         if os.path.isfile(file_path) and file_path.lower().endswith('.pdf'):
-            parser.parse_single_file(file_path)
+            parser.parse_single_file(file_path, args.export)
         
+        # Convert an earlier streamed run
+        elif os.path.isfile(file_path) and file_path.lower().endswith('.jsonl') and args.export:
+            try:
+                parser.export_jsonl(file_path, args.export)
+            except Exception as e:
+                print(json.dumps({"error": str(e)}))
+
+        # Stream a directory to JSON lines
+        elif os.path.isdir(file_path) and args.jsonl:
+            try:
+                count = parser.stream_resumes_in_directory(
+                    file_path, args.jsonl, workers=args.workers, chunk_size=args.chunk_size,
+                    manifest_path=manifest_path, index_path=args.index
+                )
+                print(f"Processed {count} resumes. Results streamed to {args.jsonl}")
+                if count and args.export:
+                    parser.export_jsonl(args.jsonl, args.export)
+            except Exception as e:
+                print(json.dumps({"error": str(e)}))
+
         # Check if the path is a directory
         elif os.path.isdir(file_path):
             # Hardcoded output path in the same directory
             output_path = os.path.join(file_path, "parsed_resumes.csv")
             try:
-                results_df = parser.parse_resumes_in_directory(file_path)
+                results_df = parser.parse_resumes_in_directory(
+                    file_path, workers=args.workers, chunk_size=args.chunk_size,
+                    manifest_path=manifest_path, index_path=args.index
+                )
                 if results_df is not None:
                     results_df.to_csv(output_path, index=False)
                     print(f"Processed {len(results_df)} resumes. Results saved to {output_path}")
@@ -990,3 +1471,10 @@ if __name__ == "__main__":
             print(json.dumps({"error": f"Invalid path: {file_path} - not a PDF file or directory"}))
     else:
         print(json.dumps({"error": "No path provided"}))
+
+    if args.regex_stats:
+        with open(args.regex_stats, 'w', encoding='utf-8') as f:
+            json.dump(parser.patterns.stats(), f, indent=2)
+
+    if parser.metrics is not None:
+        parser.metrics.close()
@@ -0,0 +1,329 @@
+import math
+import time
+
+import numpy as np
+
+from rank_generator import WEIGHTS, calculate_score
+
+# Resumes are scored this many at a time, which bounds the size of the
+# resume x vocabulary indicator matrices
+CHUNK_ROWS = 4096
+
+# Largest integer every float64 holds exactly
+_MAX_EXACT_INT = 2 ** 53
+
+
+def _number(value):
+    # value as a float if the scoring functions would treat it as a plain
+    # finite number, otherwise None
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, int):
+        return float(value) if abs(value) < _MAX_EXACT_INT else None
+    if isinstance(value, float) and math.isfinite(value):
+        return value
+    return None
+
+
+def _strings(value):
+    # value lowercased as a list if it is falsy or a list/tuple of strings,
+    # otherwise None
+    if not value:
+        return []
+    if not isinstance(value, (list, tuple)) or not all(isinstance(item, str) for item in value):
+        return None
+    return [item.lower() for item in value]
+
+
+def encode_resume(resume):
+    # (skills, keywords, branch, cpi, projects, experience) as the score
+    # arrays need them, strings lowercased, or None if the resume has to be
+    # scored pairwise
+    if not isinstance(resume, dict):
+        return None
+    skills = _strings(resume.get('Skill_Set', []))
+    # score_projects iterates these even when they are falsy
+    keywords = resume.get('Project_Keywords', [])
+    keywords = _strings(keywords) if isinstance(keywords, (list, tuple)) else None
+    branch = resume.get('Branch', '')
+    cpi = resume.get('CPI', 0)
+    cpi = _number(cpi) if cpi else 0.0
+    projects = _number(resume.get('Projects', 0))
+    experience = _number(resume.get('Experience', 0))
+    if (skills is None or keywords is None or cpi is None or projects is None
+            or experience is None or (branch and not isinstance(branch, str))):
+        return None
+    return skills, keywords, branch.lower() if branch else '', cpi, projects, experience
+
+
+def round_scores(values):
+    # round(x, 2) for every element, exactly as Python's round does it.
+    # np.round scales by 100 and rounds half to even, which can only differ
+    # from Python's correctly rounded result when the scaled value sits next
+    # to a half; those few elements are rounded by Python instead.
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_half = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    for index in zip(*np.nonzero(near_half)):
+        rounded[index] = round(float(values[index]), 2)
+    return rounded
+
+
+class CompanyProfiles:
+    # Company requirements compiled once into arrays, so that a batch of
+    # resumes is scored against every company with a few matrix operations
+    # instead of calculate_score per pair.
+    #
+    # Skills and project keywords are interned into vocabularies shared by
+    # all companies; each company becomes a column of occurrence counts over
+    # them (duplicates count, as in score_skills). A resume becomes a row of
+    # 0/1 over the same vocabularies, so matches for every company come out
+    # of one matrix product. The scores are the same float64 operations in
+    # the same order as score_skills, score_education, score_projects and
+    # score_experience, so score() returns exactly calculate_score's numbers.
+    #
+    # A company or resume with a field the arrays do not model (a non-string
+    # skill, a CPI that is not a number, ...) is scored pair by pair with
+    # calculate_score instead, errors included.
+    #
+    # With a metrics.Metrics, compiling, encoding, each score component and
+    # the pairwise fallback are timed as stages of the current operation.
+
+    def __init__(self, companies, metrics=None):
+        self.metrics = metrics
+        start = time.perf_counter() if metrics is not None else None
+        self.companies = list(companies)
+        self.skill_ids = {}
+        self.keyword_ids = {}
+        self.pairwise_columns = []
+        self._keyword_hits = {}
+
+        profiles = []
+        for j, company in enumerate(self.companies):
+            profile = self._compile(company)
+            if profile is None:
+                self.pairwise_columns.append(j)
+            profiles.append(profile)
+
+        count = len(self.companies)
+        self.skill_weights = np.zeros((len(self.skill_ids), count), dtype=np.float32)
+        self.core_weights = np.zeros((len(self.skill_ids), count), dtype=np.float32)
+        self.keyword_weights = np.zeros((len(self.keyword_ids), count), dtype=np.float32)
+        self.skill_count = np.zeros(count)
+        self.core_count = np.zeros(count)
+        self.keyword_count = np.zeros(count)
+        self.min_cpi = np.zeros(count)
+        self.min_projects = np.zeros(count)
+        self.branches = []
+        self._branch_matches = {}
+
+        for j, profile in enumerate(profiles):
+            if profile is None:
+                self.branches.append(None)
+                continue
+            skills, core, keywords, min_cpi, branches, min_projects = profile
+
+            # Core skills only count when the company lists any skills at all
+            if skills:
+                for skill in skills:
+                    self.skill_weights[self.skill_ids[skill], j] += 1
+                for skill in core:
+                    self.core_weights[self.skill_ids[skill], j] += 1
+                self.skill_count[j] = len(skills)
+                self.core_count[j] = len(core)
+
+            for keyword in keywords:
+                self.keyword_weights[self.keyword_ids[keyword], j] += 1
+            self.keyword_count[j] = len(keywords)
+            self.min_cpi[j] = min_cpi
+            self.min_projects[j] = min_projects
+            self.branches.append(branches)
+
+        self.branch_required = np.array([
+            bool(profile and profile[4] is not None) for profile in profiles
+        ], dtype=bool)
+        if metrics is not None:
+            metrics.lap('compile', start)
+
+    def _compile(self, company):
+        # (skills, core, keywords, min_cpi, branches, min_projects) with
+        # strings lowercased, or None if the company has to be scored pairwise
+        if not isinstance(company, dict):
+            return None
+        skills = _strings(company.get('Skill_Set', []))
+        core = _strings(company.get('Core_Skills', []))
+        keywords = _strings(company.get('Project_Keywords', []))
+        min_cpi = _number(company.get('CPI', 0))
+        min_projects = _number(company.get('Min_Projects', 0))
+        branches = company.get('Branch', [])
+        if (skills is None or core is None or keywords is None or min_cpi is None
+                or min_projects is None or (branches and not isinstance(branches, (list, tuple)))):
+            return None
+
+        for skill in skills + core:
+            self.skill_ids.setdefault(skill, len(self.skill_ids))
+        for keyword in keywords:
+            self.keyword_ids.setdefault(keyword, len(self.keyword_ids))
+
+        # score_education only requires a branch when the list is non-empty,
+        # and skips entries that are not strings
+        if branches:
+            branches = [branch.lower() for branch in branches if isinstance(branch, str)]
+        else:
+            branches = None
+        return skills, core, keywords, min_cpi, branches, min_projects
+
+    def keyword_hits(self, resume_keyword):
+        # Ids of the company keywords that occur in one resume keyword
+        hits = self._keyword_hits.get(resume_keyword)
+        if hits is None:
+            hits = [i for keyword, i in self.keyword_ids.items() if keyword in resume_keyword]
+            self._keyword_hits[resume_keyword] = hits
+        return hits
+
+    def branch_matches(self, branch):
+        # Per company, whether score_education gives a resume with this
+        # (lowercased) branch the branch points
+        matches = self._branch_matches.get(branch)
+        if matches is None:
+            matches = np.array([
+                branches is not None and any(required in branch or branch in required for required in branches)
+                for branches in self.branches
+            ])
+            self._branch_matches[branch] = matches
+        return matches
+
+    def _score_rows(self, rows):
+        # Scores for encoded resumes against every company; columns that are
+        # scored pairwise come out as garbage and are overwritten by score()
+        metrics = self.metrics
+        start = time.perf_counter() if metrics is not None else None
+        n = len(rows)
+        skill_rows, skill_cols, keyword_rows, keyword_cols = [], [], [], []
+        cpi, projects, experience = np.zeros(n), np.zeros(n), np.zeros(n)
+        has_skills = np.zeros(n, dtype=bool)
+        branch_match = np.zeros((n, len(self.companies)), dtype=bool)
+
+        for i, (skills, keywords, branch, resume_cpi, resume_projects, resume_experience) in enumerate(rows):
+            has_skills[i] = bool(skills)
+            for skill in set(skills):
+                skill_id = self.skill_ids.get(skill)
+                if skill_id is not None:
+                    skill_rows.append(i)
+                    skill_cols.append(skill_id)
+            hits = set()
+            for keyword in keywords:
+                hits.update(self.keyword_hits(keyword))
+            keyword_rows.extend([i] * len(hits))
+            keyword_cols.extend(hits)
+            branch_match[i] = self.branch_matches(branch)
+            cpi[i], projects[i], experience[i] = resume_cpi, resume_projects, resume_experience
+
+        resume_skills = np.zeros((n, len(self.skill_ids)), dtype=np.float32)
+        resume_skills[skill_rows, skill_cols] = 1
+        resume_keywords = np.zeros((n, len(self.keyword_ids)), dtype=np.float32)
+        resume_keywords[keyword_rows, keyword_cols] = 1
+        if metrics is not None:
+            start = metrics.lap('match', start)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # score_skills
+            skill_matches = (resume_skills @ self.skill_weights).astype(np.float64)
+            core_matches = (resume_skills @ self.core_weights).astype(np.float64)
+            skills_score = (skill_matches / self.skill_count) * 70
+            core_score = np.where(self.core_count > 0, (core_matches / self.core_count) * 30, 0)
+            skills_score = np.where(
+                has_skills[:, None] & (self.skill_count > 0), skills_score + core_score, 0
+            )
+            if metrics is not None:
+                start = metrics.lap('skills', start)
+
+            # score_education
+            cpi_column = cpi[:, None]
+            cpi_score = np.where(
+                cpi_column >= self.min_cpi, 70,
+                np.where(self.min_cpi > 0, (cpi_column / self.min_cpi) * 70, 0)
+            )
+            branch_score = np.where(~self.branch_required | branch_match, 30, 0)
+            education_score = np.where(cpi_column != 0, cpi_score + branch_score, 0)
+            if metrics is not None:
+                start = metrics.lap('education', start)
+
+            # score_projects
+            projects_column = projects[:, None]
+            count_score = np.where(
+                projects_column >= self.min_projects, 50,
+                np.where(self.min_projects > 0, (projects_column / self.min_projects) * 50, 0)
+            )
+            keyword_matches = (resume_keywords @ self.keyword_weights).astype(np.float64)
+            keyword_score = np.where(
+                self.keyword_count > 0, np.minimum(50, (keyword_matches / self.keyword_count) * 50), 50
+            )
+            projects_score = np.where(projects_column != 0, count_score + keyword_score, 0)
+            if metrics is not None:
+                start = metrics.lap('projects', start)
+
+        # score_experience
+        experience_score = np.select(
+            [experience >= 3, experience == 2, experience == 1], [100, 80, 60], 0
+        ).astype(np.float64)[:, None]
+        if metrics is not None:
+            start = metrics.lap('experience', start)
+
+        total = (
+            WEIGHTS['skills'] * skills_score +
+            WEIGHTS['education'] * education_score +
+            WEIGHTS['projects'] * projects_score +
+            WEIGHTS['experience'] * experience_score
+        )
+        total = round_scores(total)
+        if metrics is not None:
+            metrics.lap('total', start)
+        return total
+
+    def score(self, resumes):
+        # (scores, errors) for resumes x companies. Cells that failed to score
+        # are NaN and listed in errors as {"resume", "company", "error"}, in
+        # row-major order like calculate_scores_pairwise.
+        metrics = self.metrics
+        resumes = list(resumes)
+        scores = np.full((len(resumes), len(self.companies)), np.nan)
+        pairwise_rows = []
+
+        for start in range(0, len(resumes), CHUNK_ROWS):
+            if metrics is not None:
+                encode_start = time.perf_counter()
+            indices, rows = [], []
+            for i in range(start, min(start + CHUNK_ROWS, len(resumes))):
+                row = encode_resume(resumes[i])
+                if row is None:
+                    pairwise_rows.append(i)
+                else:
+                    indices.append(i)
+                    rows.append(row)
+            if metrics is not None:
+                metrics.lap('encode', encode_start)
+            if rows:
+                scores[indices] = self._score_rows(rows)
+
+        errors = []
+        cells = [(i, j) for i in pairwise_rows for j in range(len(self.companies))]
+        pairwise_row_set = set(pairwise_rows)
+        cells += [
+            (i, j) for i in range(len(resumes)) if i not in pairwise_row_set for j in self.pairwise_columns
+        ]
+        start = time.perf_counter() if metrics is not None else None
+        for i, j in cells:
+            try:
+                scores[i, j] = calculate_score(resumes[i], self.companies[j])
+            except Exception as e:
+                scores[i, j] = np.nan
+                errors.append({"resume": i, "company": j, "error": str(e)})
+        if metrics is not None:
+            metrics.lap('pairwise', start)
+            metrics.count('scores', scores.size)
+            metrics.count('pairwise_scores', len(cells))
+            metrics.count('errors', len(errors))
+
+        errors.sort(key=lambda error: (error["resume"], error["company"]))
+        return scores, errors
@@ -0,0 +1,303 @@
+import sys
+import json
+import math
+import heapq
+import argparse
+
+import numpy as np
+
+from rank_generator import WEIGHTS, score_experience
+from rerank import competition_ranks, read_input
+from score_matrix import CompanyProfiles, encode_resume
+from vocabulary import SKILLS
+
+# Top-k resumes for a company without scoring the whole pool.
+#
+# Every resume gets an upper bound on its score, built from the caps of the
+# four components. For resumes that share a skill with the company, found
+# through a skill -> resumes inverted index, the skills component is exact
+# (computed from the posting counts), and so are education (CPI and branch),
+# the project-count half of the projects component and experience; only the
+# project-keyword half is capped at its 50 points. Resumes sharing no skill
+# get nothing for skills, and are bounded a bucket at a time: buckets hold
+# resumes with the same experience and project count and a CPI in the same
+# 0.1 step, and assume the top of the step, a matching branch and every
+# project keyword. Resumes are scored exactly (with CompanyProfiles) best
+# bound first until no bound left can reach the k-th best score so far, so
+# for a company whose shortlist is decided by its skills, only the resumes
+# holding those skills are ever looked at.
+#
+# Ties are broken by the order resumes were added, as in rerank.py, so the
+# result is exactly the first k of the full ranking.
+
+DEFAULT_K = 50
+SCORE_BATCH = 256
+
+# A bound this far below the k-th score cannot round up to it
+_ROUNDING_MARGIN = 0.005 + 1e-9
+
+
+def score_bounds(profiles, skills_score, cpi, projects, experience_score, branch_ok):
+    # Upper bounds of the total for one compiled company, component by
+    # component in calculate_score's order. Everything but the project
+    # keyword points is exact for the given (array) inputs.
+    min_cpi, min_projects = profiles.min_cpi[0], profiles.min_projects[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cpi_score = np.where(cpi >= min_cpi, 70, np.where(min_cpi > 0, (cpi / min_cpi) * 70, 0))
+        branch_score = np.where(~profiles.branch_required[0] | branch_ok, 30, 0)
+        education_score = np.where(cpi != 0, cpi_score + branch_score, 0)
+        count_score = np.where(
+            projects >= min_projects, 50, np.where(min_projects > 0, (projects / min_projects) * 50, 0)
+        )
+        projects_score = np.where(projects != 0, count_score + 50, 0)
+    return (
+        WEIGHTS['skills'] * skills_score +
+        WEIGHTS['education'] * education_score +
+        WEIGHTS['projects'] * projects_score +
+        WEIGHTS['experience'] * experience_score
+    )
+
+
+class ResumePool:
+    # The resumes a shortlist is drawn from, indexed for top_k(). Resumes are
+    # kept in insertion order (their position), which also breaks ties.
+    # add() with an id already in the pool replaces that resume in place.
+
+    def __init__(self):
+        self.ids = []
+        self.resumes = []
+        self.positions = {}
+        self.postings = {}          # lowercased skill -> positions
+        self.buckets = {}           # (cpi step top, projects, experience score) -> positions
+        self.irregular = {}         # positions that are always scored
+        self.branches = []          # lowercased branches, by branch id
+        self._branch_ids = {}
+        self._skills = []           # position -> SKILLS.encode() of its lowercased skills
+        self._arrays = {}
+
+        # Per-position columns for vectorized bounds, grown by doubling
+        self._cpi = np.zeros(1024)
+        self._projects = np.zeros(1024)
+        self._experience = np.zeros(1024)
+        self._branch = np.zeros(1024, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _grow(self):
+        size = len(self._cpi) * 2
+        for name in ('_cpi', '_projects', '_experience', '_branch'):
+            column = getattr(self, name)
+            grown = np.zeros(size, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
+    def add(self, resume_id, resume):
+        position = self.positions.get(resume_id)
+        if position is None:
+            position = len(self.ids)
+            self.ids.append(resume_id)
+            self.resumes.append(None)
+            self._skills.append(None)
+            self.positions[resume_id] = position
+            if position == len(self._cpi):
+                self._grow()
+        else:
+            self._unindex(position)
+
+        self.resumes[position] = resume
+        row = encode_resume(resume)
+        # Bucket bounds round CPI and project counts up, which is only an
+        # upper bound for non-negative values
+        if row is None or row[3] < 0 or row[4] < 0:
+            self.irregular[position] = None
+            return
+
+        skills, _, branch, cpi, projects, experience = row
+        if branch not in self._branch_ids:
+            self._branch_ids[branch] = len(self.branches)
+            self.branches.append(branch)
+        self._cpi[position] = cpi
+        self._projects[position] = projects
+        self._experience[position] = score_experience(experience)
+        self._branch[position] = self._branch_ids[branch]
+
+        skills = set(skills)
+        self._skills[position] = SKILLS.encode(skills)
+        for skill in skills:
+            self.postings.setdefault(skill, []).append(position)
+            self._arrays.pop(skill, None)
+        self.buckets.setdefault(self._bucket(position), {})[position] = None
+
+    def _bucket(self, position):
+        return (
+            math.ceil(self._cpi[position] * 10) / 10,
+            math.ceil(self._projects[position]),
+            float(self._experience[position])
+        )
+
+    def remove(self, resume_id):
+        position = self.positions.pop(resume_id, None)
+        if position is not None:
+            self._unindex(position)
+            self.resumes[position] = None
+
+    def _unindex(self, position):
+        if position in self.irregular:
+            del self.irregular[position]
+            return
+        for skill in SKILLS.decode(*self._skills[position]):
+            self.postings[skill].remove(position)
+            self._arrays.pop(skill, None)
+        self._skills[position] = None
+        bucket = self._bucket(position)
+        del self.buckets[bucket][position]
+        if not self.buckets[bucket]:
+            del self.buckets[bucket]
+
+    def posting_array(self, skill):
+        array = self._arrays.get(skill)
+        if array is None:
+            array = np.array(sorted(self.postings.get(skill, ())), dtype=np.int64)
+            self._arrays[skill] = array
+        return array
+
+    def matched_bounds(self, profiles):
+        # (positions, bounds) for every resume sharing a skill with the one
+        # compiled company
+        skill_count, core_count = profiles.skill_count[0], profiles.core_count[0]
+        arrays = [self.posting_array(skill) for skill in profiles.skill_ids]
+        if skill_count == 0 or not arrays:
+            # score_skills gives everyone 0 without company skills
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        skill_ids = list(profiles.skill_ids.values())
+        lengths = [len(array) for array in arrays]
+        positions, inverse = np.unique(np.concatenate(arrays), return_inverse=True)
+        if len(positions) == 0:
+            return positions, np.zeros(0)
+        skill_matches = np.bincount(inverse, np.repeat(profiles.skill_weights[skill_ids, 0], lengths).astype(np.float64))
+        core_matches = np.bincount(inverse, np.repeat(profiles.core_weights[skill_ids, 0], lengths).astype(np.float64))
+
+        # Same operations as score_skills / CompanyProfiles
+        skills_score = (skill_matches / skill_count) * 70
+        if core_count > 0:
+            skills_score = skills_score + (core_matches / core_count) * 30
+
+        branch_ok = np.array([profiles.branch_matches(branch)[0] for branch in self.branches], dtype=bool)
+        return positions, score_bounds(
+            profiles, skills_score, self._cpi[positions], self._projects[positions],
+            self._experience[positions], branch_ok[self._branch[positions]]
+        )
+
+    def top_k(self, company, k=DEFAULT_K):
+        # (rankings, scored): the k best [(resume id, score, rank)] and how
+        # many resumes had to be scored exactly to find them
+        profiles = CompanyProfiles([company])
+        if profiles.pairwise_columns:
+            # Nothing to bound with; score everyone
+            return self._select(profiles, list(self.positions.values()), k, None)
+
+        positions, bounds = self.matched_bounds(profiles)
+        order = np.lexsort((positions, -bounds))
+
+        keys = list(self.buckets)
+        bucket_bounds = score_bounds(
+            profiles, 0,
+            np.array([key[0] for key in keys]), np.array([key[1] for key in keys], dtype=np.float64),
+            np.array([key[2] for key in keys]), True
+        ) if keys else np.zeros(0)
+
+        def matched_items():
+            for i in order:
+                yield float(bounds[i]), int(positions[i])
+
+        def unmatched_items():
+            # Resumes without a shared skill, best bucket bound first
+            matched = None
+            for i in np.argsort(-bucket_bounds, kind='stable'):
+                if matched is None:
+                    matched = set(positions.tolist())
+                bound = float(bucket_bounds[i])
+                for position in self.buckets[keys[i]]:
+                    if position not in matched:
+                        yield bound, position
+
+        bounded = heapq.merge(matched_items(), unmatched_items(), key=lambda item: -item[0])
+        return self._select(profiles, list(self.irregular), k, bounded)
+
+    def _select(self, profiles, always, k, bounded):
+        # Scores the always list, then bounded (an iterator of (bound,
+        # position), best first) until its bounds cannot reach the k-th score
+        best = []          # min-heap of (score, -position) holding the top k
+        scored = 0
+
+        def score(batch):
+            nonlocal scored
+            scored += len(batch)
+            scores, errors = profiles.score([self.resumes[position] for position in batch])
+            failed = {error["resume"] for error in errors}
+            for i, position in enumerate(batch):
+                if i in failed:
+                    continue
+                item = (float(scores[i, 0]), -position)
+                if len(best) < k:
+                    heapq.heappush(best, item)
+                elif item > best[0]:
+                    heapq.heapreplace(best, item)
+
+        for start in range(0, len(always), SCORE_BATCH):
+            score(always[start:start + SCORE_BATCH])
+
+        if bounded is not None:
+            batch = []
+            for bound, position in bounded:
+                if len(best) == k and bound < best[0][0] - _ROUNDING_MARGIN:
+                    break
+                batch.append(position)
+                if len(batch) == SCORE_BATCH:
+                    score(batch)
+                    batch = []
+            if batch:
+                score(batch)
+
+        ranked = sorted(best, reverse=True)
+        ranks = competition_ranks(np.array([score for score, _ in ranked]))
+        rankings = [
+            (self.ids[-negative], score, int(rank)) for (score, negative), rank in zip(ranked, ranks)
+        ]
+        return rankings, scored
+
+
+def run_shortlist(source, k, out=sys.stdout):
+    # Same input as rerank.py; one {"company", "rankings", "scored"} line per company
+    companies, resumes = read_input(source)
+    pool = ResumePool()
+    for resume in resumes:
+        pool.add(resume.get("id") if isinstance(resume, dict) else None, resume)
+
+    for company in companies:
+        rankings, scored = pool.top_k(company, k)
+        out.write(json.dumps({
+            "company": company.get("id") if isinstance(company, dict) else None,
+            "rankings": [{"resume": resume, "score": score, "rank": rank} for resume, score, rank in rankings],
+            "scored": scored,
+            "poolSize": len(pool)
+        }) + "\n")
+    out.flush()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='Shortlist the k best resumes for each company')
+    arg_parser.add_argument('input', nargs='?', default='-', help='rerank.py-style JSON lines input, or - for stdin')
+    arg_parser.add_argument('-k', type=int, default=DEFAULT_K, help='resumes per company')
+    args = arg_parser.parse_args()
+
+    try:
+        run_shortlist(args.input, max(1, args.k))
+    except json.JSONDecodeError as e:
+        print(json.dumps({"error": f"Invalid JSON: {str(e)}"}))
+        sys.exit(1)
+    except Exception as e:
+        print(json.dumps({"error": str(e)}))
+        sys.exit(1)
@@ -0,0 +1,174 @@
+import io
+import os
+import re
+import json
+import time
+import pstats
+import hashlib
+import cProfile
+import statistics
+from collections import deque
+
+# Capture of pathological parse_resume inputs.
+#
+# Every parse is timed; one that is slower than the threshold (seconds, or a
+# multiple of the running median) is parsed again under cProfile, with the
+# text cache bypassed so PDF extraction is profiled too. The capture is a
+# directory <time>-<text digest>/ holding:
+#     text.txt        the extracted text with contact details masked
+#     profile.pstats  the cProfile stats (python -m pstats, snakeviz, ...)
+#     hotspots.txt    the top functions by own and by cumulative time
+#     capture.json    timings, sizes, the top functions and regex patterns
+# Masking keeps the text's length, case and layout (letters become x/X,
+# digits 0), so the extractors take the same paths on it. Each distinct text
+# is captured once, and at most `limit` captures are written per process.
+
+# Durations kept for the running median, and how many are needed first
+MEDIAN_WINDOW = 500
+MEDIAN_MIN_SAMPLES = 20
+
+HOTSPOT_COUNT = 25
+
+_EMAIL = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_URL = re.compile(r'(?:https?://|www\.)\S+|\b(?:linkedin|github)\.com/\S+', re.IGNORECASE)
+_PHONE = re.compile(r'\+?\d[\d \t().-]{8,}\d')
+
+
+def _mask(text):
+    return re.sub(r'[A-Za-z0-9]', lambda m: '0' if m.group().isdigit() else ('X' if m.group().isupper() else 'x'), text)
+
+
+def redact(text):
+    # Emails, URLs, phone numbers (10-15 digits) and the first non-blank line
+    # (usually the name), masked character by character
+    def mask_phone(match):
+        digits = sum(c.isdigit() for c in match.group())
+        return _mask(match.group()) if 10 <= digits <= 15 else match.group()
+
+    text = _EMAIL.sub(lambda m: _mask(m.group()), text)
+    text = _URL.sub(lambda m: _mask(m.group()), text)
+    text = _PHONE.sub(mask_phone, text)
+    match = re.search(r'\S[^\n]*', text)
+    if match:
+        text = text[:match.start()] + _mask(match.group()) + text[match.end():]
+    return text
+
+
+def parse_threshold(value):
+    # "2.5" -> (2.5, None) seconds; "50x" -> (None, 50.0) times the median
+    value = str(value).strip().lower()
+    if value.endswith('x'):
+        factor = float(value[:-1])
+        if factor <= 1:
+            raise ValueError(f"Median factor must be above 1: {value}")
+        return None, factor
+    seconds = float(value)
+    if seconds <= 0:
+        raise ValueError(f"Threshold must be positive: {value}")
+    return seconds, None
+
+
+class SlowCapture:
+
+    def __init__(self, directory, threshold, limit=50):
+        self.directory = directory
+        self.threshold = threshold
+        self.seconds, self.factor = parse_threshold(threshold)
+        self.limit = limit
+        self.captured = 0
+        self.durations = deque(maxlen=MEDIAN_WINDOW)
+
+    def __getstate__(self):
+        # Sent to --workers processes; each keeps its own history and count
+        return {'directory': self.directory, 'threshold': self.threshold, 'limit': self.limit}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def is_slow(self, seconds):
+        if self.seconds is not None:
+            return seconds > self.seconds
+        if len(self.durations) < MEDIAN_MIN_SAMPLES:
+            return False
+        return seconds > self.factor * statistics.median(self.durations)
+
+    def observe(self, parser, pdf_path, seconds):
+        # Called after every parse_resume; captures it if it was slow
+        slow = self.is_slow(seconds)
+        self.durations.append(seconds)
+        if not slow or self.captured >= self.limit:
+            return None
+        try:
+            return self.capture(parser, pdf_path, seconds)
+        except Exception as e:
+            # Capturing must never fail the parse it is looking at
+            print(f"Slow capture of {pdf_path} failed: {e}")
+            return None
+
+    def capture(self, parser, pdf_path, seconds):
+        # Parses pdf_path again under cProfile and writes the capture
+        # directory; returns its path, or None for a text captured before
+        text_cache, metrics, track = parser.text_cache, parser.metrics, parser.patterns.track
+        parser.text_cache, parser.metrics, parser.patterns.track = None, None, True
+        regex_before = {name: (stat['calls'], stat['seconds']) for name, stat in parser.patterns.stats().items()}
+        profiler = cProfile.Profile()
+        try:
+            start = time.perf_counter()
+            result = profiler.runcall(parser._parse_resume, pdf_path)
+            rerun_seconds = time.perf_counter() - start
+            text, truncated = parser.read_pdf_text(pdf_path)
+        finally:
+            parser.text_cache, parser.metrics, parser.patterns.track = text_cache, metrics, track
+
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+        os.makedirs(self.directory, exist_ok=True)
+        if any(name.endswith('-' + digest) for name in os.listdir(self.directory)):
+            return None
+        path = os.path.join(self.directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{digest}")
+        os.makedirs(path)
+        self.captured += 1
+
+        with open(os.path.join(path, 'text.txt'), 'w', encoding='utf-8') as f:
+            f.write(redact(text))
+        profiler.dump_stats(os.path.join(path, 'profile.pstats'))
+
+        report = io.StringIO()
+        stats = pstats.Stats(profiler, stream=report)
+        for key in ('tottime', 'cumulative'):
+            report.write(f"=== Top {HOTSPOT_COUNT} by {key} ===\n")
+            stats.sort_stats(key).print_stats(HOTSPOT_COUNT)
+        with open(os.path.join(path, 'hotspots.txt'), 'w', encoding='utf-8') as f:
+            f.write(report.getvalue())
+
+        hotspots = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:HOTSPOT_COUNT]
+        regex = []
+        for name, stat in parser.patterns.stats().items():
+            calls, spent = regex_before.get(name, (0, 0.0))
+            if stat['calls'] > calls:
+                regex.append({'pattern': name, 'calls': stat['calls'] - calls, 'seconds': stat['seconds'] - spent})
+        regex.sort(key=lambda entry: entry['seconds'], reverse=True)
+
+        with open(os.path.join(path, 'capture.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'file_name': os.path.basename(pdf_path),
+                'seconds': seconds,
+                'rerun_seconds': rerun_seconds,
+                'threshold': self.threshold,
+                'median_seconds': statistics.median(self.durations) if self.durations else None,
+                'characters': len(text),
+                'text_truncated': truncated,
+                'degraded': result.get('Degraded') if isinstance(result, dict) else None,
+                'hotspots': [
+                    {
+                        'function': f"{file_name}:{line}({function})",
+                        'calls': calls,
+                        'own_seconds': own,
+                        'cumulative_seconds': cumulative
+                    }
+                    for (file_name, line, function), (_, calls, own, cumulative, _) in hotspots
+                ],
+                'regex': regex[:HOTSPOT_COUNT]
+            }, f, indent=2)
+
+        print(f"Captured slow parse of {os.path.basename(pdf_path)} ({seconds:.2f}s) in {path}")
+        return path
@@ -0,0 +1,176 @@
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+from rerank import read_input
+from score_matrix import CHUNK_ROWS
+
+# Resume <-> job description text similarity in one corpus-wide TF-IDF
+# space.
+#
+# TextModel is a TfidfVectorizer fitted once over every resume text and
+# company description, then saved with joblib. Its vectors are L2-normalized
+# sparse rows, so cosine similarity is a dot product and a whole chunk of
+# resumes against every company is one sparse matrix product. This replaces
+# fitting a vectorizer on each pair, where every word the two texts share
+# gets the same IDF.
+#
+# Input is rerank.py's JSON lines: a {"companies": [...]} header whose
+# companies carry "id" and "description", then one {"id", "resumeText"} line
+# per resume. `fit` saves the model; `score` writes one
+#     {"resume": id, "similarities": {company id: similarity, ...}}
+# line per resume, leaving out similarities below --min-similarity.
+
+MODEL_VERSION = 1
+DEFAULT_MIN_SIMILARITY = 0.01
+
+
+def _text(value):
+    return value if isinstance(value, str) else ""
+
+
+def resume_text(resume):
+    return _text(resume.get("resumeText")) if isinstance(resume, dict) else ""
+
+
+def company_text(company):
+    return _text(company.get("description")) if isinstance(company, dict) else ""
+
+
+class TextModel:
+
+    def __init__(self, vectorizer):
+        self.vectorizer = vectorizer
+
+    @classmethod
+    def fit(cls, texts):
+        # texts may be any iterable; it is read once
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        vectorizer = TfidfVectorizer(stop_words='english', dtype=np.float32)
+        vectorizer.fit(text for text in texts if text)
+        return cls(vectorizer)
+
+    @classmethod
+    def load(cls, path):
+        import joblib
+
+        stored = joblib.load(path)
+        if not isinstance(stored, dict) or stored.get("version") != MODEL_VERSION:
+            raise ValueError(f"{path} is not a version {MODEL_VERSION} text model; fit it again")
+        return cls(stored["vectorizer"])
+
+    def save(self, path):
+        import joblib
+
+        joblib.dump({"version": MODEL_VERSION, "vectorizer": self.vectorizer}, path)
+
+    def vectors(self, texts):
+        # Sparse CSR rows, one per text (all zero for empty texts)
+        return self.vectorizer.transform([_text(text) for text in texts]).tocsr()
+
+    def similarity(self, text1, text2):
+        vectors = self.vectors([text1, text2])
+        return float(vectors[0].multiply(vectors[1]).sum())
+
+
+def similarity_matrix(resume_vectors, company_vectors, min_similarity=0.0, batch_rows=CHUNK_ROWS):
+    # Sparse resumes x companies cosine similarities, batch_rows resumes at a
+    # time, without entries below min_similarity
+    from scipy import sparse
+
+    company_columns = company_vectors.T.tocsc()
+    blocks = []
+    for start in range(0, resume_vectors.shape[0], batch_rows):
+        block = (resume_vectors[start:start + batch_rows] @ company_columns).tocsr()
+        block.sort_indices()
+        if min_similarity > 0:
+            block.data[block.data < min_similarity] = 0
+            block.eliminate_zeros()
+        blocks.append(block)
+    if not blocks:
+        return sparse.csr_matrix((0, company_vectors.shape[0]), dtype=np.float32)
+    return sparse.vstack(blocks, format='csr')
+
+
+def run_fit(source, model_path):
+    start = time.perf_counter()
+    companies, resumes = read_input(source)
+    counts = {"resumes": 0}
+
+    def texts():
+        for company in companies:
+            yield company_text(company)
+        for resume in resumes:
+            counts["resumes"] += 1
+            yield resume_text(resume)
+
+    model = TextModel.fit(texts())
+    model.save(model_path)
+    print(json.dumps({
+        "model": model_path,
+        "resumes": counts["resumes"],
+        "companies": len(companies),
+        "terms": len(model.vectorizer.vocabulary_),
+        "seconds": round(time.perf_counter() - start, 3)
+    }))
+
+
+def run_score(source, model_path, min_similarity=DEFAULT_MIN_SIMILARITY, out=sys.stdout):
+    model = TextModel.load(model_path)
+    companies, resumes = read_input(source)
+    company_ids = [company.get("id") if isinstance(company, dict) else None for company in companies]
+    company_vectors = model.vectors([company_text(company) for company in companies])
+    chunk = []
+
+    def flush():
+        rows = similarity_matrix(model.vectors([resume_text(resume) for resume in chunk]),
+                                 company_vectors, min_similarity)
+        for i, resume in enumerate(chunk):
+            row = rows[i]
+            out.write(json.dumps({
+                "resume": resume.get("id") if isinstance(resume, dict) else None,
+                "similarities": {
+                    company_ids[j]: round(float(value), 4) for j, value in zip(row.indices, row.data)
+                }
+            }) + "\n")
+        chunk.clear()
+
+    for resume in resumes:
+        chunk.append(resume)
+        if len(chunk) == CHUNK_ROWS:
+            flush()
+    if chunk:
+        flush()
+    out.flush()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='Corpus TF-IDF similarity between resumes and companies')
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    fit_command = commands.add_parser('fit', help='fit and save the model over every resume and description')
+    fit_command.add_argument('input', nargs='?', default='-', help='rerank.py-style JSON lines input, or - for stdin')
+    fit_command.add_argument('--model', required=True, metavar='FILE')
+
+    score_command = commands.add_parser('score', help='resume x company similarities with a saved model')
+    score_command.add_argument('input', nargs='?', default='-', help='rerank.py-style JSON lines input, or - for stdin')
+    score_command.add_argument('--model', required=True, metavar='FILE')
+    score_command.add_argument('--min-similarity', type=float, default=DEFAULT_MIN_SIMILARITY,
+                               help='leave out smaller similarities')
+    args = arg_parser.parse_args()
+
+    try:
+        if args.command == 'fit':
+            run_fit(args.input, args.model)
+        else:
+            run_score(args.input, args.model, args.min_similarity)
+    except json.JSONDecodeError as e:
+        print(json.dumps({"error": f"Invalid JSON: {str(e)}"}))
+        sys.exit(1)
+    except Exception as e:
+        print(json.dumps({"error": str(e)}))
+        sys.exit(1)
@@ -0,0 +1,340 @@
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+# The term vocabularies of the parser and the ranker, with stable integer ids.
+#
+# The lists below are what resume_parser extracts. Each of the four term
+# kinds (skills, project keywords, branches, core computer skill categories)
+# is a Vocabulary of lowercased terms, keyed like resume_index.TERM_FIELDS.
+# A term's id never changes: ids are recorded in vocabulary_ids.json, and a
+# term missing there gets the next free id, in list order. Run
+# `python vocabulary.py --update` after adding terms to record them; removed
+# terms keep their ids.
+#
+# A set of terms is a Python int with bit i set for the term with id i, so
+# sets intersect with & and count with popcount(), or a sorted list of ids.
+# Terms outside a vocabulary (company requirements are free text) are kept
+# separately as strings. Stored ids should be kept with the vocabulary's
+# header() and checked with compatible() when read back.
+
+IDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'vocabulary_ids.json')
+
+# Skills matched by extract_skills
+SKILL_SET = [
+    # Programming Languages
+    'java', 'python', 'c++', 'c#', 'javascript', 'html', 'css', 'php', 'sql', 'r', 'apex', 'swift',
+    'kotlin', 'rust', 'typescript', 'perl', 'scala', 'go', 'ruby', 'matlab',
+    # Tools and Frameworks
+    'aws', 'amazon web services', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'react',
+    'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'spring boot', 'hibernate', 'asp.net',
+    '.net', 'tensorflow', 'pytorch', 'keras', 'salesforce', 'tableau', 'power bi', 'excel',
+    'microsoft excel',
+    # Databases
+    'mysql', 'postgresql', 'mongodb', 'oracle', 'cassandra', 'redis', 'sqlite',
+    # Concepts
+    'artificial intelligence', 'ai', 'machine learning', 'ml', 'data science', 'deep learning',
+    'natural language processing', 'nlp', 'computer vision', 'cloud computing', 'devops',
+    'development operations', 'automation', 'cybersecurity', 'networking', 'data analysis',
+    'data structures', 'algorithms', 'oop', 'object-oriented programming', 'database management',
+    'embedded systems', 'internet of things', 'iot', 'rest api', 'web development', 'full-stack',
+    'front-end', 'back-end', 'agile', 'scrum', 'user interface', 'ui', 'user experience', 'ux', 'testing',
+    'qa', 'quality assurance', 'security', 'risk analysis', 'risk management', 'data analytics', 'big data',
+    'business intelligence', 'seo', 'sem', 'digital marketing', 'consulting', 'audit', 'finance', 'banking',
+    'automotive', 'electrical engineering', 'mechanical engineering', 'civil engineering',
+    'chemical engineering', 'petroleum engineering',
+    # Domain-specific
+    'automobile engineering', 'information technology', 'civil', 'mechanical', 'structured query language',
+    'energy', 'trading', 'gas pipeline engineering', 'salesforce lightning', 'salesforce visualforce',
+    'digital transformation', 'business analysis', 'strategic planning', 'process improvement',
+    'technical consulting', 'troubleshooting', 'system integration', 'design thinking', 'prototyping',
+    'engineering fundamentals', 'process engineering', 'research', 'technical analysis', 'communication',
+    'curriculum design', 'teaching', 'analytical skills', 'computer-aided design', 'teamwork',
+    'client management', 'coordination', 'product development', 'market research', 'credit risk',
+    'financial modeling', 'advanced programming', 'digital solutions', 'electronics design',
+    'circuit analysis', 'debugging', 'business development', 'sales', 'engineering', 'metallurgy',
+    'technical problem solving', 'engineering skills', 'technical design', 'project management',
+    'technical proficiency', 'automotive technology', 'threat analysis',
+    'information technology infrastructure', 'system administration', 'system programming',
+    'operating system', 'graphics processing unit', 'gpu', 'search engine optimization',
+    'search engine marketing', 'revenue management', 'research and development', 'innovation',
+    'android development', 'software/hardware integration', 'process optimization', 'system design',
+    'information technology strategy', 'enterprise architecture', 'power systems', 'cascading style sheets',
+    'responsive design', 'industrial automation', 'rest application programming interfaces',
+    'representational state transfer', 'marketing', 'oil and gas'
+]
+
+# Skills that are also matched anywhere in the text, by category
+SKILL_CATEGORIES = {
+    'programming_languages': ['java', 'python', 'c++', 'c#', 'javascript', 'typescript', 'php', 'ruby', 'perl',
+                             'scala', 'swift', 'kotlin', 'r', 'matlab', 'go', 'rust', 'cobol', 'fortran', 'bash',
+                             'powershell', 'assembly', 'lisp', 'prolog', 'dart', 'apex'],
+
+    'web_development': ['html', 'css', 'javascript', 'react', 'angular', 'vue', 'django', 'flask', 'node.js',
+                       'express', 'php', 'laravel', 'symfony', 'ruby on rails', 'bootstrap', 'jquery', 'asp.net',
+                       'spring mvc', 'wordpress', 'gatsby', 'sass', 'less', 'webpack', 'babel'],
+
+    'data_science': ['python', 'r', 'sql', 'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy',
+                    'matplotlib', 'seaborn', 'tableau', 'power bi', 'excel', 'spss', 'sas', 'hadoop', 'spark',
+                    'big data', 'data mining', 'data analytics', 'statistical analysis', 'machine learning', 'ai',
+                    'deep learning', 'nlp', 'computer vision'],
+
+    'databases': ['sql', 'mysql', 'postgresql', 'oracle', 'sql server', 'mongodb', 'cassandra', 'redis',
+                 'dynamodb', 'firebase', 'neo4j', 'sqlite', 'mariadb', 'couchdb', 'dbms', 'database management'],
+
+    'cloud_devops': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab',
+                    'terraform', 'ansible', 'puppet', 'chef', 'bitbucket', 'jira', 'confluence', 'ci/cd',
+                    'cloud computing', 'devops', 'microservices', 'serverless'],
+
+    'mobile_development': ['android', 'ios', 'swift', 'kotlin', 'flutter', 'react native', 'xamarin',
+                          'mobile app development', 'objective-c', 'cordova', 'ionic'],
+
+    'system_concepts': ['algorithms', 'data structures', 'oop', 'design patterns', 'architecture', 'system design',
+                       'microservices', 'restful api', 'soap', 'graphql', 'mvc', 'mvvm', 'operating systems',
+                       'networking', 'distributed systems', 'concurrency', 'multithreading', 'memory management'],
+
+    'cybersecurity': ['security', 'encryption', 'cryptography', 'penetration testing', 'ethical hacking',
+                     'firewall', 'vpn', 'intrusion detection', 'malware analysis', 'siem', 'forensics',
+                     'cybersecurity', 'network security', 'authentication', 'authorization'],
+
+    'business_finance': ['finance', 'accounting', 'banking', 'trading', 'investment', 'risk management',
+                        'credit risk', 'financial modeling', 'fintech', 'blockchain', 'cryptocurrency',
+                        'consulting', 'audit', 'compliance', 'business analysis', 'strategic planning']
+}
+
+# Project keywords matched by extract_project_keywords
+PROJECT_KEYWORDS = [
+    'ai', 'ml', 'rpa', 'python', 'automation', 'audit', 'financial analysis', 'risk assessment', 'cad',
+    'solidworks', 'vehicle dynamics', 'dsa', 'java', 'aws', 'system design', 'data analysis', 'finance',
+    'sql', 'risk analysis', 'tech', 'data security', 'chemical simulation', 'matlab', 'oil & gas',
+    'structural design', 'autocad', 'construction', 'azure', '.net', 'javascript', 'kubernetes', 'devops',
+    'docker', 'cloud', 'web dev', 'react', 'business analysis', 'excel', 'power bi', 'networking',
+    'cybersecurity', 'firewalls', 'r', 'big data', 'oop', 'software development', 'competitive programming',
+    'dbms', 'oracle', 'embedded c', 'hardware', 'iot', 'fpga', 'microcontrollers', 'vlsi',
+    'renewable energy', 'scada', 'data visualization', 'tableau', 'fintech', 'quantitative analysis',
+    'risk modeling', 'investment banking', 'power systems', 'electrical engineering', 'salesforce', 'crm',
+    'apex programming', 'full stack', 'digital strategy', 'analytics', 'it consulting', 'business strategy',
+    'process optimization', 'it systems', 'technical support', 'erp', 'energytech', 'research',
+    'visualization', 'debugging', 'git', 'software dev', 'prototyping', 'design thinking', 'ux research',
+    'process engineering', 'industrial safety', 'technical research', 'wireless networks', 'telecom',
+    'curriculum design', 'teaching', 'problem-solving', 'mechanical design', 'engineering design',
+    'product development', 'client communication', 'market analysis', 'control systems', 'market research',
+    'credit risk', 'agile development', 'full-stack', 'process safety', 'pcb design', 'sdlc',
+    'sales strategies', 'metallurgical analysis', 'material science', 'material testing',
+    'civil engineering', 'construction management', 'automotive engineering', 'automotive software',
+    'business intelligence', 'political analytics', 'business operations', 'network security',
+    'ethical hacking', 'siem', 'cloud computing', 'system administration', 'cuda', 'gpu computing', 'os',
+    'seo', 'sem', 'google ads', 'marketing analytics', 'revenue optimization', 'teaching skills',
+    'curriculum development', 'r&d', 'innovation', 'android', 'kotlin', 'ui/ux',
+    'software-hardware integration', 'financial modeling', 'algorithm', 'c++', 'electrical',
+    'energy engineering', 'project planning', 'customer service', 'territory management', 'html', 'css',
+    'responsive design', 'industrial automation', 'robotics', 'embedded systems', 'ai/ml',
+    'software engineering', 'rest apis', 'web development', 'testing', 'marketing', 'product design',
+    'it solutions', 'chemical engineering', 'petroleum engineering', 'energy', 'algorithms',
+    'risk management', 'banking', 'sap', 'consulting', 'it services', 'qa', 'digital design'
+]
+
+# Standardized branch names (what extract_branch returns) and their aliases
+BRANCH_MAPPING = {
+    'Computer Science': ['cse', 'computer science', 'computer science and engineering', 'cs', 'computer',
+                        'computer engineering', 'software engineering', 'computation', 'computing'],
+    'Information Technology': ['it', 'information technology', 'information systems', 'information science'],
+    'Electronics and Communication': ['ece', 'electronics and communication', 'electronics', 'communication engineering',
+                                     'electronics and communication engineering', 'electronic engineering'],
+    'Electrical Engineering': ['ee', 'electrical', 'electrical engineering', 'electrical and electronics',
+                              'eee', 'electrical and electronics engineering', 'power systems'],
+    'Mechanical Engineering': ['mech', 'mechanical', 'mechanical engineering', 'mechanics'],
+    'Civil Engineering': ['civil', 'civil engineering', 'structural engineering'],
+    'Chemical Engineering': ['chem', 'chemical', 'chemical engineering', 'chemistry engineering'],
+    'Petroleum Engineering': ['petroleum', 'petro', 'petroleum engineering', 'oil and gas'],
+    'Aerospace Engineering': ['aerospace', 'aeronautical', 'aeronautical engineering', 'aerospace engineering'],
+    'Automobile Engineering': ['automobile', 'automotive engineering', 'automotive'],
+    'Mathematics and Computing': ['maths & computing', 'mathematics and computing', 'mathematical computing',
+                                 'math and cs', 'mathematics and computer science']
+}
+
+# Core computer skill categories (what extract_core_computer_skills returns)
+# and the terms that indicate them
+CORE_COMPUTER_SKILLS = {
+    'OS': ['operating system', 'os', 'windows', 'linux', 'unix', 'macos', 'android', 'ios', 'embedded os',
+          'real-time os', 'rtos', 'operating systems', 'system administration'],
+    'Networks': ['networking', 'network', 'tcp/ip', 'dns', 'dhcp', 'router', 'switch', 'firewall', 'vpn',
+                'lan', 'wan', 'network security', 'network administration', 'cisco', 'network architecture'],
+    'DBMS': ['database management system', 'dbms', 'sql', 'mysql', 'postgresql', 'oracle', 'mongodb',
+            'database design', 'er diagram', 'normalization', 'acid', 'transaction', 'sql server', 'nosql',
+            'database administration', 'data modeling'],
+    'OOP': ['object oriented programming', 'oop', 'object-oriented', 'inheritance', 'polymorphism',
+           'encapsulation', 'abstraction', 'class', 'object', 'java', 'c++', 'c#', 'design patterns'],
+    'Computer Architecture': ['computer architecture', 'processor design', 'memory hierarchy', 'cache',
+                            'pipelining', 'instruction sets', 'cpu', 'alu', 'von neumann', 'harvard architecture',
+                            'risc', 'cisc', 'assembly language', 'microprocessors']
+}
+
+
+if hasattr(int, 'bit_count'):
+    def popcount(bits):
+        return bits.bit_count()
+else:
+    # Python < 3.10
+    def popcount(bits):
+        return bin(bits).count('1')
+
+
+def bit_ids(bits):
+    # Ids of the set bits, ascending
+    text = format(bits, 'b')[::-1]
+    ids = []
+    position = text.find('1')
+    while position >= 0:
+        ids.append(position)
+        position = text.find('1', position + 1)
+    return ids
+
+
+class Vocabulary:
+    # Terms numbered 0, 1, ... in the order given, duplicates dropped. Terms
+    # are matched exactly, so callers lowercase them first.
+
+    def __init__(self, terms):
+        self.terms = []
+        self.ids = {}
+        for term in terms:
+            if term not in self.ids:
+                self.ids[term] = len(self.terms)
+                self.terms.append(term)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __contains__(self, term):
+        return term in self.ids
+
+    def id(self, term):
+        return self.ids.get(term)
+
+    def encode(self, terms):
+        # (bits, extra): the bitset of the known terms and the other terms,
+        # sorted and de-duplicated
+        bits = 0
+        extra = set()
+        for term in terms:
+            term_id = self.ids.get(term)
+            if term_id is None:
+                extra.add(term)
+            else:
+                bits |= 1 << term_id
+        return bits, sorted(extra)
+
+    def decode(self, bits, extra=()):
+        # The terms of a bitset in id order, then extra
+        return [self.terms[term_id] for term_id in bit_ids(bits)] + list(extra)
+
+    def id_list(self, terms):
+        # Sorted ids of the known terms
+        return sorted({self.ids[term] for term in terms if term in self.ids})
+
+    def pack(self, terms):
+        # JSON form of a set of terms: the bitset as hex, or [hex, *extra]
+        # when some terms are not in the vocabulary
+        bits, extra = self.encode(terms)
+        return [format(bits, 'x')] + extra if extra else format(bits, 'x')
+
+    def unpack(self, value):
+        if isinstance(value, str):
+            return self.decode(int(value, 16))
+        return self.decode(int(value[0], 16), value[1:])
+
+    def fingerprint(self, size=None):
+        # Digest of the first size terms (all by default)
+        terms = self.terms if size is None else self.terms[:size]
+        return hashlib.sha256("\n".join(terms).encode('utf-8')).hexdigest()[:16]
+
+    def header(self):
+        return [len(self.terms), self.fingerprint()]
+
+    def compatible(self, header):
+        # Whether ids stored under header (an earlier header()) still name
+        # the same terms
+        size, fingerprint = header
+        return size <= len(self.terms) and self.fingerprint(size) == fingerprint
+
+
+def vocabulary_terms():
+    # {kind: lowercased terms in list order} from the lists above
+    return {
+        'skills': [term.lower() for term in SKILL_SET] + [
+            term.lower() for terms in SKILL_CATEGORIES.values() for term in terms
+        ],
+        'keywords': [term.lower() for term in PROJECT_KEYWORDS],
+        'branch': [branch.lower() for branch in BRANCH_MAPPING],
+        'core': [category.lower() for category in CORE_COMPUTER_SKILLS]
+    }
+
+
+def load_vocabularies(path=IDS_PATH):
+    # {kind: Vocabulary}: the recorded ids, then any new terms
+    recorded = {}
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            recorded = json.load(f)
+    return {
+        kind: Vocabulary(recorded.get(kind, []) + terms) for kind, terms in vocabulary_terms().items()
+    }
+
+
+VOCABULARIES = load_vocabularies()
+SKILLS = VOCABULARIES['skills']
+KEYWORDS = VOCABULARIES['keywords']
+BRANCHES = VOCABULARIES['branch']
+CORE_SKILLS = VOCABULARIES['core']
+
+
+HEADERS = {kind: vocabulary.header() for kind, vocabulary in VOCABULARIES.items()}
+
+
+def headers():
+    # {kind: header()} of every vocabulary
+    return dict(HEADERS)
+
+
+def unrecorded(path=IDS_PATH):
+    # {kind: count} of terms that have no id in the ids file yet
+    recorded = {}
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            recorded = json.load(f)
+    counts = {kind: len(vocabulary) - len(recorded.get(kind, [])) for kind, vocabulary in VOCABULARIES.items()}
+    return {kind: count for kind, count in counts.items() if count}
+
+
+def write_ids(path=IDS_PATH):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({kind: vocabulary.terms for kind, vocabulary in VOCABULARIES.items()}, f, indent=1)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='Show or record the term vocabularies and their ids')
+    arg_parser.add_argument('--terms', choices=sorted(VOCABULARIES), help='print this vocabulary as id, term lines')
+    arg_parser.add_argument('--check', action='store_true', help='fail if some terms have no recorded id')
+    arg_parser.add_argument('--update', action='store_true', help='record ids for new terms in vocabulary_ids.json')
+    args = arg_parser.parse_args()
+
+    if args.update:
+        write_ids()
+    missing = unrecorded()
+    if args.terms:
+        for term_id, term in enumerate(VOCABULARIES[args.terms].terms):
+            print(f"{term_id}\t{term}")
+    else:
+        print(json.dumps({
+            kind: {"terms": size, "fingerprint": fingerprint, "unrecorded": missing.get(kind, 0)}
+            for kind, (size, fingerprint) in headers().items()
+        }))
+    if args.check and missing:
+        print(json.dumps({"error": f"Terms without recorded ids: {missing}; run python vocabulary.py --update"}))
+        sys.exit(1)
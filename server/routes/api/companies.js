@@ -1,5 +1,5 @@
 import { Router } from 'express';
-import { createCompany, getCompanies, getCompanyById, updateCompany, deleteCompany, getTopResumes } from '../../controllers/companyController.js';
+import { createCompany, getCompanies, getCompanyById, updateCompany, deleteCompany, getTopResumes, rerankCompanies, getRerankStatus, getRerankJobs } from '../../controllers/companyController.js';
 import auth from '../../middleware/auth.js';
 
 const router = Router();
@@ -13,6 +13,19 @@ router.get(
     '/', 
     getCompanies
 );
+router.post(
+    '/rerank', 
+    // auth, 
+    rerankCompanies
+);
+router.get(
+    '/rerank/jobs', 
+    getRerankJobs
+);
+router.get(
+    '/rerank/jobs/:jobId', 
+    getRerankStatus
+);
 router.get(
     '/:id', 
     getCompanyById
@@ -27,10 +40,10 @@ router.delete(
     // auth, 
     deleteCompany
 );
-// router.get(
-//     '/:id/resumes', 
-//     // auth, 
-//     getTopResumes
-// );
+router.get(
+    '/:id/resumes', 
+    // auth, 
+    getTopResumes
+);
 
 export default router;
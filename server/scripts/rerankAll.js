@@ -0,0 +1,45 @@
+import path from 'path';
+import dotenv from 'dotenv';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+dotenv.config({ path: path.resolve(__dirname, '../.env') });
+
+// Recomputes every stored resume's score and rank for every company. The
+// running server does the work: its rank index worker is the only process
+// allowed to change the index, so this script queues a re-rank job there and
+// waits for it to finish.
+// Usage: node scripts/rerankAll.js
+// SERVER_URL defaults to http://localhost:$PORT (5000).
+const serverUrl = process.env.SERVER_URL || `http://localhost:${process.env.PORT || 5000}`;
+const POLL_MS = 2000;
+
+const call = async (method, route) => {
+  const response = await fetch(`${serverUrl}/api/companies${route}`, { method });
+  const body = await response.json();
+  if (!response.ok) {
+    throw new Error(body.error || body.msg || `HTTP ${response.status}`);
+  }
+  return body;
+};
+
+try {
+  let job = await call('POST', '/rerank');
+  console.log(`Re-rank job ${job.id} ${job.status}`);
+  while (job.status === 'queued' || job.status === 'running') {
+    await new Promise(resolve => setTimeout(resolve, POLL_MS));
+    job = await call('GET', `/rerank/jobs/${job.id}`);
+  }
+
+  if (job.status !== 'done') {
+    throw new Error(job.error || `Re-rank job ${job.id} ${job.status}`);
+  }
+  const { resumes, companies, updated, errors } = job.result;
+  console.log(`Re-ranked ${resumes} resumes for ${companies} companies (${updated} rankings, ${errors} errors)`);
+  process.exit(0);
+} catch (error) {
+  console.error('Error re-ranking resumes:', error);
+  process.exit(1);
+}
@@ -8,10 +8,13 @@ import { join, resolve } from 'path';
 import { existsSync, mkdirSync } from 'fs';
 import resumesRouter from './routes/api/resumes.js';
 import companiesRouter from './routes/api/companies.js';
+import { resumeParserPool } from './services/resumeParser.js';
+import { rankIndexPool, seedRankIndex } from './services/rankGenerator.js';
 
 const app = express();
 
-connectDB();
+// Once the database is up, build the rank index if this is its first run
+connectDB().then(seedRankIndex);
 
 const uploadsDir = join(process.cwd(), 'uploads');
 if (!existsSync(uploadsDir)) {
@@ -35,4 +38,13 @@ app.use((err, req, res, next) => {
 
 const PORT = process.env.PORT || 5000;
 
-app.listen(PORT, () => console.log(`Server started on port ${PORT}`));
+app.listen(PORT, () => {
+  console.log(`Server started on port ${PORT}`);
+  resumeParserPool.warm();
+  rankIndexPool.warm();
+});
+
+process.on('exit', () => {
+  resumeParserPool.close();
+  rankIndexPool.close();
+});
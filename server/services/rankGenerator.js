@@ -1,337 +1,223 @@
-import { runPythonScript } from '../utils/pythonRunner.js';
+import { once } from 'events';
+import { existsSync } from 'fs';
+import { join } from 'path';
+import { streamPythonScript } from '../utils/pythonRunner.js';
 import Resume from '../models/Resume.js';
+import Company from '../models/Company.js';
+import { PythonWorkerPool } from '../utils/pythonWorkerPool.js';
+
+// Per-company rank index (python/rank_index.py), held in memory by a single
+// rank_generator.py worker: every update is appended to one file, so there
+// must be exactly one writer. Everything that changes the index, including
+// rerankAllResumes, goes through this worker, so only the server process may
+// run it; scripts ask the server instead (POST /api/companies/rerank).
+// The same worker scores resumes without touching the index ('score' op).
+export const RANK_INDEX_PATH = process.env.RANK_INDEX_PATH || join(process.cwd(), 'data', 'rank_index.jsonl');
+
+// RANK_METRICS_FILE turns on per-request stage timings (python/metrics.py):
+// Prometheus text if it ends in .prom, JSON lines otherwise. A request with
+// no reply within RANK_INDEX_TIMEOUT_MS (including time queued behind a
+// rebuild) fails and the worker is killed; its replacement reloads the index
+// from the log.
+export const rankIndexPool = new PythonWorkerPool('rank_generator.py', {
+  size: 1,
+  args: [
+    '--worker', RANK_INDEX_PATH,
+    ...(process.env.RANK_METRICS_FILE ? ['--metrics', process.env.RANK_METRICS_FILE] : [])
+  ],
+  timeoutMs: parseInt(process.env.RANK_INDEX_TIMEOUT_MS, 10) || 60000
+});
+
+
+
+const transformCompanyData = (companyData) => ({
+  Company_Name: companyData.name,
+  CPI: companyData.cpi,
+  Skill_Set: companyData.skillSet,
+  Min_Projects: companyData.minProjects,
+  Project_Keywords: companyData.projectKeywords,
+  Branch: companyData.branch,
+  Core_Skills: companyData.coreSkills
+});
+
+const transformResumeData = (resumeData) => ({
+  CPI: resumeData['CPI/GPA'] || 0,
+  Skill_Set: new Set(resumeData.Skills || []),
+  Projects: resumeData.No_of_Projects || 0,
+  Project_Keywords: new Set(resumeData.Project_Keywords || []),
+  Mobile: resumeData.Mobile_Number || "",
+  Email: resumeData.Email_ID || "",
+  Experience: resumeData.Experience === 'Yes' ? 1 : 0,
+  Core_Skills: new Set(resumeData.Core_Computer_Skills ? 
+    resumeData.Core_Computer_Skills.split(',').map(skill => skill.trim()) : []),
+  Branch: resumeData.Branch || ''
+});
+
+// The scoring inputs of a parsed resume as stored on its Resume document
+export const scoringInputs = (resumeData) => {
+  const { CPI, Branch, Projects, Project_Keywords, Skill_Set, Experience } = transformResumeData(resumeData);
+  return {
+    cpi: CPI,
+    branch: Branch,
+    projects: Projects,
+    projectKeywords: Array.from(Project_Keywords),
+    skillSet: Array.from(Skill_Set),
+    experience: Experience
+  };
+};
 
-
-
-export const generateRankingScore = async (resumeData, companyData) => {
-  try {
-    const transformedCompanyData = {
-      Company_Name: companyData.name,
-      CPI: companyData.cpi,
-      Skill_Set: companyData.skillSet,
-      Min_Projects: companyData.minProjects,
-      Project_Keywords: companyData.projectKeywords,
-      Branch: companyData.branch,
-      Core_Skills: companyData.coreSkills
-    };
-
-    // console.log(resumeData)
-  
-    const transformedResumeData = {
-      CPI: resumeData['CPI/GPA'] || 0,
-      Skill_Set: new Set(resumeData.Skills || []),
-      Projects: resumeData.No_of_Projects || 0,
-      Project_Keywords: new Set(resumeData.Project_Keywords || []),
-      Mobile: resumeData.Mobile_Number || "",
-      Email: resumeData.Email_ID || "",
-      Experience: resumeData.Experience === 'Yes' ? 1 : 0,
-      Core_Skills: new Set(resumeData.Core_Computer_Skills ? 
-        resumeData.Core_Computer_Skills.split(',').map(skill => skill.trim()) : []),
-      Branch: resumeData.Branch || ''
+// The scoring fields of a stored Resume document: its stored scoring inputs,
+// or for resumes uploaded before those were kept, as far as the display
+// fields go
+const transformStoredResumeData = (resume) => {
+  const scoring = resume.scoring;
+  if (scoring) {
+    return {
+      CPI: scoring.cpi || 0,
+      Skill_Set: scoring.skillSet || [],
+      Projects: scoring.projects || 0,
+      Project_Keywords: scoring.projectKeywords || [],
+      Experience: scoring.experience || 0,
+      Branch: scoring.branch || ''
     };
-    
-
-    // console.log(transformedResumeData)
+  }
 
-    //preparing json
-    const prepareForJSON = (obj) => {
-      const result = {};
+  return {
+    CPI: resume.education?.[0]?.gpa || 0,
+    Skill_Set: resume.skills || [],
+    Projects: resume.projects?.length || 0,
+    Project_Keywords: new Set((resume.projects || []).flatMap(project => project.technologies || [])),
+    Experience: resume.experience?.length ? 1 : 0,
+    Branch: resume.education?.[0]?.field || ''
+  };
+};
 
-      for (const [key, value] of Object.entries(obj)) {
-        if (value instanceof Set) {
-          result[key] = Array.from(value);
-        } else {
-          result[key] = value;
-        }
-      }
+//preparing json
+const prepareForJSON = (obj) => {
+  const result = {};
 
-      return result;
-    };
+  for (const [key, value] of Object.entries(obj)) {
+    if (value instanceof Set) {
+      result[key] = Array.from(value);
+    } else {
+      result[key] = value;
+    }
+  }
 
-    const jsonReadyResumeData = prepareForJSON(transformedResumeData);
-    const jsonReadyCompanyData = prepareForJSON(transformedCompanyData);
+  return result;
+};
 
-    // stringify
-    const resumeJson = JSON.stringify(jsonReadyResumeData);
-    const companyJson = JSON.stringify(jsonReadyCompanyData);
+export const generateRankingScore = async (resumeData, companyData) => {
+  try {
+    const result = await rankIndexPool.request({
+      op: 'score',
+      resumes: [prepareForJSON(transformResumeData(resumeData))],
+      companies: [prepareForJSON(transformCompanyData(companyData))]
+    });
 
-    const result = await runPythonScript('rank_generator.py', [resumeJson, companyJson]);
-    console.log(result)
-    
     if (result.error) {
       throw new Error(result.error);
     }
-    
-    return result.score;
+    if (result.errors.length > 0) {
+      throw new Error(result.errors[0].error);
+    }
+
+    return result.scores[0][0];
   } catch (error) {
     console.error('Error generating ranking score:', error);
     throw new Error(`Failed to generate ranking score: ${error.message}`);
   }
 };
 
+// Scores one resume against every company in one request to the rank
+// worker. Returns one score per company, in order; null where that company
+// failed.
+export const generateRankingScores = async (resumeData, companies) => {
+  try {
+    const result = await rankIndexPool.request({
+      op: 'score',
+      resumes: [prepareForJSON(transformResumeData(resumeData))],
+      companies: companies.map(company => prepareForJSON(transformCompanyData(company)))
+    });
+
+    if (result.error) {
+      throw new Error(result.error);
+    }
+
+    for (const { company, error } of result.errors || []) {
+      console.error(`Error calculating score for company ${companies[company]?.name}: ${error}`);
+    }
+
+    return result.scores[0];
+  } catch (error) {
+    console.error('Error generating ranking scores:', error);
+    throw new Error(`Failed to generate ranking scores: ${error.message}`);
+  }
+};
+
 
 
-// export const generateRankings = async (resumeData, companies) => {
-//   try {
-//     const newResumeScores = [];
-
-//     for (const company of companies) {
-//       const newScore = await generateRankingScore(resumeData, company);
-
-//       newResumeScores.push({
-//         companyId: company._id.toString(),
-//         companyName: company.name,
-//         score: newScore
-//       });
-//     }
-
-//     const rankings = [];
-
-//     for (const { companyId, companyName, score } of newResumeScores) {
-//       // Get all resumes that have ranking for this company
-//       const resumes = await Resume.find({ 'rankings.company': companyId });
-
-//       console.log(resumes)
-//       // Add the new resume (not saved yet)
-//       const allRankings = resumes?.map(r => {
-//         const ranking = r?.rankings?.find(rank => rank?.company?.toString() === companyId);
-//         return {
-//           resume: r,
-//           score: ranking?.score || 0
-//         };
-//       });
-
-//       // Include the current resume being uploaded
-//       allRankings.push({
-//         resume: null, // null means this is the new resume
-//         score
-//       });
-
-//       // Sort by score descending
-//       allRankings.sort((a, b) => b.score - a.score);
-
-//       // Assign ranks
-//       for (let i = 0; i < allRankings.length; i++) {
-//         allRankings[i].rank = i + 1;
-//       }
-
-//       // Update rankings of existing resumes in DB
-//       for (const item of allRankings) {
-//         if (item.resume) {
-//           const updatedRankings = item.resume.rankings.map(r =>
-//             r.company.toString() === companyId
-//               ? { ...r.toObject(), score: item.score, rank: item.rank }
-//               : r
-//           );
-
-//           item.resume.rankings = updatedRankings;
-//           await item.resume.save();
-//         } else {
-//           // This is the new resume
-//           rankings.push({
-//             company: companyId,
-//             companyName,
-//             score,
-//             rank: item.rank
-//           });
-//         }
-//       }
-//     }
-
-//     return rankings;
-//   } catch (error) {
-//     console.error('❌ Error generating rankings:', error);
-//     throw new Error(`Failed to generate rankings: ${error.message}`);
-//   }
-// };
-
-export const generateRankings = async (resumeData, companies) => {
+// Ranks one resume (resumeId: its existing or pre-allocated _id) against
+// every company. The rank index worker scores it, records the scores under
+// resumeId (replacing any earlier ones) and answers rank and totalResumes
+// from each company's sorted scores, without loading any other resume.
+export const generateRankings = async (resumeData, companies, resumeId) => {
   try {
     if (!companies || !Array.isArray(companies) || companies.length === 0) {
       throw new Error('No companies provided for ranking');
     }
 
-    const rankings = [];
     const startTime = Date.now();
 
-    // First, calculate scores for the new resume against all companies
-    const newResumeScores = [];
-    for (const company of companies) {
+    const validCompanies = companies.filter(company => {
       if (!company || !company._id) {
         console.warn(`Skipping company with missing ID: ${company?.name || 'Unknown'}`);
-        continue;
+        return false;
       }
-      
-      try {
-        console.log(`Calculating score for ${company.name}...`);
-        const score = await generateRankingScore(resumeData, company);
-        newResumeScores.push({
-          company: company,
-          score: score
-        });
-        console.log(`Score for ${company.name}: ${score}`);
-      } catch (error) {
-        console.error(`Error calculating score for company ${company.name}:`, error);
-        continue;
-      }
-    }
-
-    if (newResumeScores.length === 0) {
-      throw new Error('Failed to calculate scores for any company');
-    }
-
-    // Get all existing resumes with their rankings in one query
-    const companyIds = companies
-      .filter(c => c && c._id)
-      .map(c => c._id);
+      return true;
+    });
 
-    if (companyIds.length === 0) {
+    if (validCompanies.length === 0) {
       throw new Error('No valid company IDs found');
     }
 
-    const existingResumes = await Resume.find({
-      'rankings.company': { $in: companyIds }
-    }).select('rankings');
+    console.log(`Calculating scores for ${validCompanies.length} companies...`);
+    const result = await rankIndexPool.request({
+      op: 'rank',
+      resume_id: resumeId.toString(),
+      resume: prepareForJSON(transformResumeData(resumeData)),
+      companies: validCompanies.map(company => ({
+        id: company._id.toString(),
+        ...prepareForJSON(transformCompanyData(company))
+      }))
+    });
 
-    console.log(`Found ${existingResumes.length} existing resumes with rankings`);
-
-    // Process each company's rankings
-    for (const { company, score: newScore } of newResumeScores) {
-      if (!company || !company._id) {
-        console.warn(`Skipping invalid company data`);
-        continue;
-      }
-
-      console.log(`\nProcessing rankings for ${company.name}`);
-      
-      // Get existing scores for this company with proper null checks
-      const companyScores = existingResumes
-        .map(resume => {
-          try {
-            if (!resume || !resume.rankings || !Array.isArray(resume.rankings)) {
-              return null;
-            }
-
-            const ranking = resume.rankings.find(r => {
-              if (!r || !r.company) return false;
-              if (!company || !company._id) return false;
-              
-              try {
-                // Safely get company ID strings
-                let rankingCompanyId = null;
-                let currentCompanyId = null;
-                
-                // Handle different company ID formats
-                if (r.company._id) {
-                  // It's a populated company object
-                  rankingCompanyId = r.company._id.toString();
-                } else if (typeof r.company === 'string') {
-                  // It's a string ID
-                  rankingCompanyId = r.company;
-                } else if (r.company.toString) {
-                  // It's an ObjectId
-                  rankingCompanyId = r.company.toString();
-                }
-                
-                // Get current company ID
-                if (company._id.toString) {
-                  currentCompanyId = company._id.toString();
-                }
-                
-                if (!rankingCompanyId || !currentCompanyId) {
-                  return false;
-                }
-                
-                return rankingCompanyId === currentCompanyId;
-              } catch (error) {
-                console.warn(`Error comparing company IDs for resume ${resume._id}:`, error);
-                return false;
-              }
-            });
-
-            if (!ranking) return null;
-
-            return {
-              resume: resume,
-              score: ranking.score || 0
-            };
-          } catch (error) {
-            console.warn(`Error processing resume ${resume._id}:`, error);
-            return null;
-          }
-        })
-        .filter(Boolean);
-
-      // Add new resume score
-      const allScores = [
-        { resume: null, score: newScore },
-        ...companyScores
-      ];
-
-      if (allScores.length === 0) {
-        console.warn(`No valid scores found for ${company.name}`);
-        continue;
-      }
+    if (result.error) {
+      throw new Error(result.error);
+    }
 
-      // Sort and rank
-      allScores.sort((a, b) => b.score - a.score);
-      
-      let currentRank = 1;
-      let currentScore = allScores[0]?.score || 0;
-      let skipCount = 0;
-      
-      for (let i = 0; i < allScores.length; i++) {
-        if (allScores[i].score < currentScore) {
-          currentRank += skipCount + 1;
-          currentScore = allScores[i].score;
-          skipCount = 0;
-        } else {
-          skipCount++;
-        }
-        allScores[i].rank = currentRank;
-      }
+    for (const { company, error } of result.errors || []) {
+      console.error(`Error calculating score for company ${validCompanies[company]?.name}: ${error}`);
+    }
 
-      // Store new resume's ranking
-      const newResumeRanking = allScores.find(score => score.resume === null);
-      if (!newResumeRanking) {
-        console.warn(`Could not find new resume ranking for ${company.name}`);
-        continue;
+    const rankings = [];
+    validCompanies.forEach((company, index) => {
+      const ranking = result.rankings[index];
+      if (!ranking) {
+        return;
       }
-
       rankings.push({
         company: company._id,
         companyName: company.name,
-        score: newResumeRanking.score,
-        rank: newResumeRanking.rank,
-        totalResumes: allScores.length
+        score: ranking.score,
+        rank: ranking.rank,
+        totalResumes: ranking.totalResumes
       });
+      console.log(`Completed ${company.name}: Rank ${ranking.rank}/${ranking.totalResumes} (score ${ranking.score})`);
+    });
 
-      // Update existing resumes' rankings in bulk
-      const updates = allScores
-        .filter(score => score.resume && score.resume._id)
-        .map(score => ({
-          updateOne: {
-            filter: { _id: score.resume._id },
-            update: {
-              $set: {
-                'rankings.$[elem].score': score.score,
-                'rankings.$[elem].rank': score.rank,
-                'rankings.$[elem].totalResumes': allScores.length
-              }
-            },
-            arrayFilters: [{ 'elem.company': company._id }]
-          }
-        }));
-
-      // if (updates.length > 0) {
-      //   try {
-      //     await Resume.bulkWrite(updates);
-      //   } catch (error) {
-      //     console.error(`Error updating rankings for ${company.name}:`, error);
-      //   }
-      // }
-
-      console.log(`Completed ${company.name}: Rank ${newResumeRanking.rank}/${allScores.length} (${Math.round((newResumeRanking.rank / allScores.length) * 100)}%)`);
+    if (rankings.length === 0) {
+      throw new Error('Failed to calculate scores for any company');
     }
 
     const endTime = Date.now();
@@ -343,3 +229,232 @@ export const generateRankings = async (resumeData, companies) => {
     throw new Error(`Failed to generate rankings: ${error.message}`);
   }
 };
+
+// A rank index worker request whose error reply is thrown
+const requestIndex = async (payload) => {
+  const result = await rankIndexPool.request(payload);
+  if (result.error) {
+    throw new Error(result.error);
+  }
+  return result;
+};
+
+// The k best resumes for a company from the rank index, best first
+export const getTopRankings = (companyId, k = 10) =>
+  requestIndex({ op: 'top', company: companyId.toString(), k });
+
+// Takes a deleted resume out of every company's ranking
+export const removeResumeRankings = async (resumeId) => {
+  await requestIndex({ op: 'remove_resume', resume: resumeId.toString() });
+};
+
+// Forgets a deleted company's ranking
+export const dropCompanyRankings = async (companyId) => {
+  await requestIndex({ op: 'drop_company', company: companyId.toString() });
+};
+
+// Recomputes every resume's score and rank for every company (or only for
+// companyIds), e.g. after a company's requirements or the weights change.
+// Ranks are per company, so a changed company only needs its own. Companies
+// and stored resumes
+// are streamed into python/rerank.py, which scores them in one process and
+// sends each company's full ranking back in chunks of chunkSize; each chunk
+// becomes one bulkWrite. Pairs that fail to score keep their old ranking.
+// The same scores are sent to the rank index worker, which installs them in
+// place of those companies' rankings (of every ranking, for a full re-rank);
+// resumes ranked or removed while the re-rank ran keep their newer entries.
+export const rerankAllResumes = async ({ chunkSize = 1000, companyIds = null } = {}) => {
+  const startTime = Date.now();
+  const companies = await Company.find(companyIds ? { _id: { $in: companyIds } } : {}).lean();
+  const companyNames = new Map(companies.map(company => [company._id.toString(), company.name]));
+  const indexRankings = Object.fromEntries(
+    companies.map(company => [company._id.toString(), { resumes: [], scores: [] }])
+  );
+  let summary = null;
+  let updated = 0;
+
+  await requestIndex({ op: 'begin_rebuild' });
+
+  const args = ['-', '--chunk-size', String(chunkSize)];
+  const { stdin, done } = streamPythonScript('rerank.py', args, async (line) => {
+    if (line.done) {
+      summary = line;
+    } else if (line.rankings) {
+      await writeRankingChunk(line);
+      const ranking = indexRankings[line.company];
+      for (const { resume, score } of line.rankings) {
+        ranking.resumes.push(resume);
+        ranking.scores.push(score);
+      }
+      updated += line.rankings.length;
+    } else if (line.resume !== undefined) {
+      console.error(`Error calculating score of resume ${line.resume} for company ${companyNames.get(line.company)}: ${line.error}`);
+    } else if (line.error) {
+      throw new Error(line.error);
+    }
+  });
+
+  const write = async (value) => {
+    if (!stdin.write(JSON.stringify(value) + '\n')) {
+      await once(stdin, 'drain');
+    }
+  };
+
+  try {
+    await write({
+      companies: companies.map(company => ({
+        id: company._id.toString(),
+        ...prepareForJSON(transformCompanyData(company))
+      }))
+    });
+
+    const cursor = Resume.find().select('scoring skills education projects experience').lean().cursor();
+    for await (const resume of cursor) {
+      await write({ id: resume._id.toString(), ...prepareForJSON(transformStoredResumeData(resume)) });
+    }
+  } finally {
+    stdin.end();
+  }
+
+  await done;
+  if (!summary) {
+    throw new Error('Re-rank finished without a summary');
+  }
+  await requestIndex({ op: 'rebuild', rankings: indexRankings, all: !companyIds });
+
+  console.log(`Re-ranked ${summary.resumes} resumes for ${summary.companies} companies ` +
+    `(${updated} rankings, ${summary.errors} errors) in ${(Date.now() - startTime) / 1000} seconds`);
+  return { ...summary, updated };
+};
+
+// Re-ranks run as background jobs, one at a time, so no HTTP request waits
+// for one. Requests made while a job runs join the single queued job, which
+// re-ranks each company asked for once (or every company, if any request
+// asked for that) as soon as the running job ends. Finished jobs are kept
+// for status queries, up to MAX_FINISHED_RERANK_JOBS.
+const MAX_FINISHED_RERANK_JOBS = 50;
+const rerankJobs = new Map();
+let runningRerank = null;
+let queuedRerank = null;
+let nextRerankJobId = 1;
+
+const describeRerankJob = (job) => ({
+  id: job.id,
+  status: job.status,
+  companies: job.all ? 'all' : Array.from(job.companies),
+  requestedAt: job.requestedAt,
+  startedAt: job.startedAt,
+  finishedAt: job.finishedAt,
+  result: job.result,
+  error: job.error
+});
+
+// Queues a re-rank of one company (or of every company, with no companyId)
+// and returns the job that will do it
+export const scheduleRerank = (companyId = null) => {
+  if (!queuedRerank) {
+    queuedRerank = {
+      id: String(nextRerankJobId++),
+      status: 'queued',
+      companies: new Set(),
+      all: false,
+      requestedAt: new Date()
+    };
+    rerankJobs.set(queuedRerank.id, queuedRerank);
+  }
+
+  const job = queuedRerank;
+  if (companyId) {
+    job.companies.add(companyId.toString());
+  } else {
+    job.all = true;
+  }
+  if (!runningRerank) {
+    startQueuedRerank();
+  }
+  return describeRerankJob(job);
+};
+
+const startQueuedRerank = () => {
+  const job = queuedRerank;
+  queuedRerank = null;
+  if (!job) {
+    return;
+  }
+
+  runningRerank = job;
+  job.status = 'running';
+  job.startedAt = new Date();
+  rerankAllResumes(job.all ? {} : { companyIds: Array.from(job.companies) })
+    .then((result) => {
+      job.status = 'done';
+      job.result = result;
+    })
+    .catch((error) => {
+      console.error(`Re-rank job ${job.id} failed:`, error);
+      job.status = 'failed';
+      job.error = error.message;
+    })
+    .finally(() => {
+      job.finishedAt = new Date();
+      runningRerank = null;
+
+      const finished = Array.from(rerankJobs.values()).filter(({ finishedAt }) => finishedAt);
+      for (const { id } of finished.slice(0, finished.length - MAX_FINISHED_RERANK_JOBS)) {
+        rerankJobs.delete(id);
+      }
+      startQueuedRerank();
+    });
+};
+
+// On a first deploy there is no index file yet, so uploads would be ranked
+// against nobody and top-k lists would hold only new uploads: the index is
+// seeded with a full re-rank of the stored resumes instead. Until that job
+// finishes, ranks are against the resumes it has not reached as well. The
+// file exists from the first update on, so this runs once per index; if the
+// job fails, scripts/rerankAll.js does the same.
+export const seedRankIndex = () => {
+  if (existsSync(RANK_INDEX_PATH)) {
+    return null;
+  }
+  const job = scheduleRerank();
+  console.log(`No rank index at ${RANK_INDEX_PATH}; seeding it from the stored resumes (re-rank job ${job.id})`);
+  return job;
+};
+
+// A re-rank job's status, or null if it is unknown (or long finished)
+export const getRerankJob = (jobId) => {
+  const job = rerankJobs.get(String(jobId));
+  return job ? describeRerankJob(job) : null;
+};
+
+// Every known re-rank job, oldest first
+export const listRerankJobs = () => Array.from(rerankJobs.values()).map(describeRerankJob);
+
+// One rerank.py output chunk as a bulkWrite: rankings a resume already has
+// for the company are updated in place, missing ones are added
+const writeRankingChunk = async ({ company, totalResumes, rankings }) => {
+  const updates = rankings.flatMap(({ resume, score, rank }) => [
+    {
+      updateOne: {
+        filter: { _id: resume },
+        update: {
+          $set: {
+            'rankings.$[elem].score': score,
+            'rankings.$[elem].rank': rank,
+            'rankings.$[elem].totalResumes': totalResumes
+          }
+        },
+        arrayFilters: [{ 'elem.company': company }]
+      }
+    },
+    {
+      updateOne: {
+        filter: { _id: resume, 'rankings.company': { $ne: company } },
+        update: { $push: { rankings: { company, score, rank, totalResumes } } }
+      }
+    }
+  ]);
+
+  await Resume.bulkWrite(updates, { ordered: false });
+};
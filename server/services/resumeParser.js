@@ -1,10 +1,34 @@
-import { runPythonScript } from '../utils/pythonRunner.js';
+import { PythonWorkerPool } from '../utils/pythonWorkerPool.js';
 import { extractTextFromFile } from '../utils/fileExtractor.js';
 
+// Warm resume_parser.py workers; each keeps spaCy and the parser loaded.
+// Extraction limits keep oversized uploads (portfolios, scanned theses)
+// from stalling a worker; ordinary resumes are far below them. A field
+// extractor that runs out of time leaves its column empty and listed in
+// `Degraded`; a request that still hangs is cut off by the pool timeout.
+// RESUME_PARSER_METRICS_FILE turns on per-stage timings of every parse
+// (python/metrics.py), appended as JSON lines by all workers (a .prom file
+// would only hold the totals of whichever worker wrote it last).
+// RESUME_PARSER_CAPTURE_SLOW (seconds, or e.g. "50x" the median) profiles
+// outlier parses into RESUME_PARSER_CAPTURE_DIR (python/slow_capture.py).
+export const resumeParserPool = new PythonWorkerPool('resume_parser.py', {
+  size: parseInt(process.env.RESUME_PARSER_WORKERS, 10) || 2,
+  args: [
+    '--worker', '--max-pages', '10', '--max-chars', '100000', '--time-budget', '20',
+    '--extractor-timeout', '5',
+    ...(process.env.RESUME_PARSER_METRICS_FILE ? ['--metrics', process.env.RESUME_PARSER_METRICS_FILE] : []),
+    ...(process.env.RESUME_PARSER_CAPTURE_SLOW
+      ? ['--capture-slow', process.env.RESUME_PARSER_CAPTURE_SLOW,
+          '--capture-dir', process.env.RESUME_PARSER_CAPTURE_DIR || 'slow_captures']
+      : [])
+  ],
+  timeoutMs: parseInt(process.env.RESUME_PARSER_TIMEOUT_MS, 10) || 120000
+});
+
 
 export const parseResumeText = async (resumeText) => {
   try {
-    const result = await runPythonScript('resume_parser.py', [resumeText]);
+    const result = await resumeParserPool.request({ path: resumeText });
     return result;
   } catch (error) {
     console.error('Error parsing resume:', error);
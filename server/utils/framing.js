@@ -0,0 +1,50 @@
+// Length-prefixed JSON frames, the protocol of the Python --worker modes
+// (python/framing.py): every message is a 4-byte big-endian byte count
+// followed by that many bytes of UTF-8 JSON.
+
+const HEADER_SIZE = 4;
+
+export const encodeFrame = (message) => {
+  const body = Buffer.from(JSON.stringify(message), 'utf8');
+  const frame = Buffer.allocUnsafe(HEADER_SIZE + body.length);
+  frame.writeUInt32BE(body.length, 0);
+  body.copy(frame, HEADER_SIZE);
+  return frame;
+};
+
+// Reassembles frames from stream chunks and calls onFrame with each body (a
+// Buffer). Chunks are only concatenated once a whole header or body is in,
+// so a large message is copied once rather than once per chunk.
+export class FrameReader {
+  constructor(onFrame) {
+    this.onFrame = onFrame;
+    this.chunks = [];
+    this.length = 0;
+    this.needed = HEADER_SIZE;
+    this.inBody = false;
+  }
+
+  push(chunk) {
+    this.chunks.push(chunk);
+    this.length += chunk.length;
+
+    while (this.length >= this.needed) {
+      const data = this.take(this.needed);
+      if (this.inBody) {
+        this.inBody = false;
+        this.needed = HEADER_SIZE;
+        this.onFrame(data);
+      } else {
+        this.inBody = true;
+        this.needed = data.readUInt32BE(0);
+      }
+    }
+  }
+
+  take(count) {
+    const data = this.chunks.length === 1 ? this.chunks[0] : Buffer.concat(this.chunks, this.length);
+    this.chunks = count < data.length ? [data.subarray(count)] : [];
+    this.length = data.length - count;
+    return data.subarray(0, count);
+  }
+}
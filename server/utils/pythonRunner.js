@@ -1,53 +1,77 @@
-import {  spawn } from 'child_process';
-import { join,dirname } from 'path';
-import { fileURLToPath } from 'url'; 
+import { spawn } from 'child_process';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
-export const runPythonScript = (scriptName, args = []) => {
-  return new Promise((resolve, reject) => {
-    const scriptPath = join(__dirname, '..', 'python', scriptName);
-    const pythonProcess = spawn('python', [scriptPath, ...args]);
-    
-    let result = '';
-    let errorOutput = '';
-
-    pythonProcess.stdout.on('data', (data) => {
-      result += data.toString();
-    });
 
-    pythonProcess.stderr.on('data', (data) => {
-      errorOutput += data.toString();
-    });
+// Runs a script that reads and writes JSON lines, for jobs too large to
+// buffer: the caller writes input to the returned stdin (honouring
+// backpressure) and gets each output line parsed through onLine. done
+// resolves after the last line has been handled; onLine may be async, and
+// lines are handled one at a time in order, with the script's output paused
+// while any are outstanding.
+export const streamPythonScript = (scriptName, args = [], onLine) => {
+  const scriptPath = join(__dirname, '..', 'python', scriptName);
+  const pythonProcess = spawn('python', [scriptPath, ...args]);
 
+  let buffer = '';
+  let errorOutput = '';
+  let handled = Promise.resolve();
+  let outstanding = 0;
+
+  const handle = (line) => {
+    let parsed;
+    try {
+      parsed = JSON.parse(line);
+    } catch (error) {
+      console.error('Failed to parse Python script output line:', line.substring(0, 200));
+      return;
+    }
+    outstanding++;
+    pythonProcess.stdout.pause();
+    handled = handled
+      .then(() => onLine(parsed))
+      .finally(() => {
+        outstanding--;
+        if (outstanding === 0) {
+          pythonProcess.stdout.resume();
+        }
+      });
+  };
+
+  pythonProcess.stdout.on('data', (data) => {
+    buffer += data.toString();
+
+    let newline;
+    while ((newline = buffer.indexOf('\n')) !== -1) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      if (line) {
+        handle(line);
+      }
+    }
+  });
+
+  pythonProcess.stderr.on('data', (data) => {
+    errorOutput += data.toString();
+  });
+
+  const done = new Promise((resolve, reject) => {
+    pythonProcess.on('error', reject);
     pythonProcess.on('close', (code) => {
-      if (code !== 0) {
-        console.error(`Python script exited with code ${code}`);
-        console.error(`Error output: ${errorOutput}`);
-        reject(new Error(`Python script exited with code ${code}: ${errorOutput}`));
-        return;
+      if (buffer.trim()) {
+        handle(buffer.trim());
       }
-      
-      try {
-        // Find the JSON part of the output (starts with "{")
-        const jsonStart = result.indexOf('{');
-        if (jsonStart === -1) {
-          throw new Error('No JSON found in output');
+      handled.then(() => {
+        if (code !== 0) {
+          reject(new Error(`Python script exited with code ${code}: ${errorOutput}`));
+          return;
         }
-        
-        // Extract only the JSON part
-        const jsonString = result.substring(jsonStart);
-        
-        // For debugging
-        console.log("Attempting to parse JSON:", jsonString.substring(0, 100) + "...");
-        
-        const parsedResult = JSON.parse(jsonString);
-        resolve(parsedResult);
-      } catch (error) {
-        console.error('Failed to parse Python script output:', error);
-        console.error('Raw output first 200 chars:', result.substring(0, 200));
-        reject(new Error(`Failed to parse Python script output: ${error.message}`));
-      }
+        resolve();
+      }, reject);
     });
   });
+
+  return { stdin: pythonProcess.stdin, done };
 };
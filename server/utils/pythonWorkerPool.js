@@ -0,0 +1,151 @@
+import { spawn } from 'child_process';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+import { FrameReader, encodeFrame } from './framing.js';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+// One long-lived Python process speaking length-prefixed JSON frames
+// (framing.js): requests go in as {"id", ...payload}, replies come back as
+// {"id", "result"}.
+class PythonWorker {
+  constructor(scriptPath, args) {
+    this.pending = new Map();
+    this.alive = true;
+
+    this.process = spawn('python', [scriptPath, ...args]);
+
+    const reader = new FrameReader((body) => this.handleReply(body));
+    this.process.stdout.on('data', (data) => reader.push(data));
+
+    this.process.stderr.on('data', (data) => {
+      console.error(`Python worker ${this.process.pid}: ${data.toString().trim()}`);
+    });
+
+    // Writing to a worker that has died raises EPIPE on stdin; without a
+    // handler that would be an unhandled 'error' event and crash the server
+    this.process.stdin.on('error', (error) => this.fail(error));
+
+    this.process.on('error', (error) => this.fail(error));
+    this.process.on('close', (code) => {
+      this.fail(new Error(`Python worker exited with code ${code}`));
+    });
+  }
+
+  handleReply(body) {
+    let reply;
+    try {
+      reply = JSON.parse(body.toString('utf8'));
+    } catch (error) {
+      console.error('Failed to parse Python worker reply:', body.toString('utf8', 0, 200));
+      return;
+    }
+
+    const request = this.pending.get(reply.id);
+    if (!request) {
+      console.warn(`Python worker replied to unknown request ${reply.id}`);
+      return;
+    }
+
+    this.pending.delete(reply.id);
+    request.resolve(reply.result);
+  }
+
+  send(id, payload, timeoutMs = 0) {
+    return new Promise((resolve, reject) => {
+      if (!this.alive) {
+        reject(new Error('Python worker is not running'));
+        return;
+      }
+
+      let timer = null;
+      if (timeoutMs > 0) {
+        // A regex or PDF call in progress cannot be interrupted from inside
+        // Python, so a request that overruns takes its worker down with it
+        timer = setTimeout(() => {
+          this.pending.delete(id);
+          reject(new Error(`Python worker timed out after ${timeoutMs} ms`));
+          this.kill();
+        }, timeoutMs);
+      }
+
+      this.pending.set(id, {
+        resolve: (result) => { clearTimeout(timer); resolve(result); },
+        reject: (error) => { clearTimeout(timer); reject(error); }
+      });
+      this.process.stdin.write(encodeFrame({ id, ...payload }));
+    });
+  }
+
+  fail(error) {
+    this.alive = false;
+    for (const { reject } of this.pending.values()) {
+      reject(error);
+    }
+    this.pending.clear();
+  }
+
+  kill() {
+    this.alive = false;
+    this.process.kill();
+  }
+}
+
+// A fixed-size set of warm workers for one script. Each request goes to the
+// worker with the fewest requests in flight; dead workers are replaced lazily.
+// With timeoutMs set, a request that gets no reply in time is rejected and its
+// worker is killed (failing any other requests it had in flight).
+export class PythonWorkerPool {
+  constructor(scriptName, { size = 2, args = ['--worker'], timeoutMs = 0 } = {}) {
+    this.scriptPath = join(__dirname, '..', 'python', scriptName);
+    this.args = args;
+    this.size = size;
+    this.timeoutMs = timeoutMs;
+    this.workers = [];
+    this.nextId = 1;
+  }
+
+  spawnWorker() {
+    const worker = new PythonWorker(this.scriptPath, this.args);
+    this.workers.push(worker);
+    return worker;
+  }
+
+  // Start every worker up front so the first requests do not pay model loading
+  warm() {
+    this.workers = this.workers.filter(worker => worker.alive);
+    while (this.workers.length < this.size) {
+      this.spawnWorker();
+    }
+  }
+
+  getWorker() {
+    this.workers = this.workers.filter(worker => worker.alive);
+
+    const idle = this.workers.find(worker => worker.pending.size === 0);
+    if (idle) {
+      return idle;
+    }
+
+    if (this.workers.length < this.size) {
+      return this.spawnWorker();
+    }
+
+    return this.workers.reduce((least, worker) =>
+      worker.pending.size < least.pending.size ? worker : least
+    );
+  }
+
+  request(payload) {
+    const id = this.nextId++;
+    return this.getWorker().send(id, payload, this.timeoutMs);
+  }
+
+  close() {
+    for (const worker of this.workers) {
+      worker.kill();
+    }
+    this.workers = [];
+  }
+}